@@ -0,0 +1,160 @@
+"""Benchmark: memory and attribute access of config entries at blocklist scale.
+
+Builds --triggers TriggerEntry objects (an imported blocklist) plus a few
+profiles, once with the slotted classes from config.py and once with plain
+dict-backed dataclasses of the same shape (derived fields included), and
+reports per-entry memory, decode time from a config.json dict, and the cost
+of the per-tick reads (lowercase name, time-based check, limit, schedule
+window) -- precomputed, and recomputed on every read as before.
+
+    python benchmarks/bench_config_entries.py
+    python benchmarks/bench_config_entries.py --triggers 50000 --rounds 20
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+import fakes  # noqa: F401  (puts src/ on sys.path)
+from config import Config, TriggerEntry, TriggerSchedule
+
+
+@dataclass
+class DictTriggerEntry:
+    """TriggerEntry with a __dict__ per instance instead of slots."""
+    name: str = ""
+    type: str = "site"
+    profile_id: str = ""
+    time_limit_minutes: int = 0
+    name_lower: str = field(init=False, repr=False, compare=False)
+    limit_seconds: int = field(init=False, repr=False, compare=False)
+    is_time_based: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        lower = self.name.lower()
+        self.name_lower = self.name if lower == self.name else lower
+        self.limit_seconds = self.time_limit_minutes * 60
+        self.is_time_based = self.time_limit_minutes > 0
+
+
+@dataclass
+class RecomputingTriggerEntry:
+    """TriggerEntry as it was before: no derived fields, is_time_based a property."""
+    name: str = ""
+    type: str = "site"
+    profile_id: str = ""
+    time_limit_minutes: int = 0
+
+    @property
+    def is_time_based(self):
+        return self.time_limit_minutes > 0
+
+
+@dataclass
+class DictTriggerSchedule:
+    start_hour: int = 20
+    start_minute: int = 0
+    end_hour: int = 4
+    end_minute: int = 0
+
+    def is_in_window(self, hour, minute):
+        start = self.start_hour * 60 + self.start_minute
+        end = self.end_hour * 60 + self.end_minute
+        now = hour * 60 + minute
+        if start <= end:
+            return start <= now < end
+        return now >= start or now < end
+
+
+def make_rows(n):
+    # Sites are stored lowercase by the settings window, app names keep their case
+    return [{"name": f"blocked{i}.example" if i % 3 else f"Blocked{i}.exe",
+             "type": "site" if i % 3 else "app",
+             "profile_id": "default", "time_limit_minutes": 30 if i % 7 == 0 else 0}
+            for i in range(n)]
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return objects, size
+
+
+def best_ms(func, rounds):
+    times = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times), statistics.median(times)
+
+
+def scan(triggers):
+    # What a detection tick reads per trigger
+    hits = 0
+    for t in triggers:
+        if t.is_time_based and t.limit_seconds > 0:
+            hits += 1
+        if t.name_lower[0] == "b":
+            hits += 1
+    return hits
+
+
+def scan_recomputed(triggers):
+    # The same reads with every derived value recomputed (no precomputed fields)
+    hits = 0
+    for t in triggers:
+        if t.is_time_based and t.time_limit_minutes * 60 > 0:
+            hits += 1
+        if t.name.lower()[0] == "b":
+            hits += 1
+    return hits
+
+
+def scan_windows(schedules):
+    return sum(s.is_in_window(h, 30) for s in schedules for h in range(24))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--triggers", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = make_rows(args.triggers)
+    data = {"version": 3, "schedule_profiles": [{"id": "default", "name": "Abends"}],
+            "triggers": rows}
+
+    slotted, slotted_bytes = measure_memory(lambda: [TriggerEntry(**r) for r in rows])
+    plain, plain_bytes = measure_memory(lambda: [DictTriggerEntry(**r) for r in rows])
+    print(f"{args.triggers} triggers")
+    print(f"  memory   slotted {slotted_bytes / len(rows):6.0f} B/entry   "
+          f"dict-backed {plain_bytes / len(rows):6.0f} B/entry")
+
+    best, median = best_ms(lambda: [TriggerEntry.from_dict(r) for r in rows], args.rounds)
+    print(f"  decode   triggers {best:6.1f} ms best, {median:6.1f} ms median")
+    best, median = best_ms(lambda: Config.decode(data), args.rounds)
+    print(f"  load     Config.decode incl. indexes {best:6.1f} ms best, {median:6.1f} ms median")
+
+    s_best, _ = best_ms(lambda: scan(slotted), args.rounds)
+    d_best, _ = best_ms(lambda: scan(plain), args.rounds)
+    recomputing = [RecomputingTriggerEntry(**r) for r in rows]
+    r_best, _ = best_ms(lambda: scan_recomputed(recomputing), args.rounds)
+    print(f"  access   slotted {s_best:6.2f} ms   dict-backed {d_best:6.2f} ms   "
+          f"recomputed {r_best:6.2f} ms  (per pass over all triggers)")
+
+    schedules = [TriggerSchedule(i % 24, 15, (i + 8) % 24, 45) for i in range(1000)]
+    plain_schedules = [DictTriggerSchedule(i % 24, 15, (i + 8) % 24, 45) for i in range(1000)]
+    s_best, _ = best_ms(lambda: scan_windows(schedules), args.rounds)
+    d_best, _ = best_ms(lambda: scan_windows(plain_schedules), args.rounds)
+    print(f"  windows  slotted {s_best:6.2f} ms   dict-backed {d_best:6.2f} ms  "
+          f"(24 000 is_in_window calls)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Benchmark suite: detection hot path against synthetic process/window tables.
+
+Runs one monitor tick (process snapshot + get_active_matches), the Config
+window lookups and close_trigger_apps for every combination of the given
+sizes, against fake psutil and user32 providers. Reports p50/p95/p99 latency
+and peak allocation per tick, and exits non-zero if any case's p99 tick eats
+more than --budget-share of the 5 s monitor interval.
+
+    python benchmarks/bench_detection.py
+    python benchmarks/bench_detection.py --processes 2000 --windows 500 --triggers 1000
+    python benchmarks/bench_detection.py --enumerate   # no title cache, EnumWindows per tick
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+import tracemalloc
+
+from fakes import FakePsutil, FakeUser32, make_desktop, make_processes
+import chrome_monitor
+import window_events
+from chrome_monitor import ProcessSnapshot, close_trigger_apps, get_active_matches
+from config import Config, ScheduleProfile, TriggerEntry, TriggerSchedule
+from window_events import WindowTitleCache
+
+TICK_BUDGET_MS = 5000  # TriggerMonitor interval
+
+
+def _sizes(text):
+    return [int(x) for x in text.split(",")]
+
+
+def make_config(n_triggers, rng):
+    """Three profiles with overlapping windows; half sites, half apps, some time-based."""
+    profiles = [
+        ScheduleProfile(id="evening", name="Abends", schedule=TriggerSchedule(20, 0, 4, 0)),
+        ScheduleProfile(id="work", name="Arbeit", schedule=TriggerSchedule(9, 0, 17, 30)),
+        ScheduleProfile(id="late", name="Spät", schedule=TriggerSchedule(23, 15, 6, 0)),
+    ]
+    triggers = []
+    for i in range(n_triggers):
+        kind = "site" if i % 2 == 0 else "app"
+        name = f"site{i}.example" if kind == "site" else f"app{i}"
+        triggers.append(TriggerEntry(
+            name=name, type=kind,
+            profile_id=rng.choice(("evening", "work", "late", "")),
+            time_limit_minutes=30 if i % 5 == 0 else 0,
+        ))
+    return Config(schedule_profiles=profiles, triggers=triggers)
+
+
+class Case:
+    def __init__(self, n_processes, n_windows, n_triggers, enumerate_windows):
+        rng = random.Random(n_processes * 7 + n_windows * 3 + n_triggers)
+        self.label = f"{n_processes:>5} proc {n_windows:>4} win {n_triggers:>5} trig"
+        self.config = make_config(n_triggers, rng)
+        sites = [t.name for t in self.config.triggers if t.type == "site"]
+        apps = [t.name for t in self.config.triggers if t.type == "app"]
+        desktop = make_desktop(n_windows, site_names=sites, rng=rng)
+        self.user32 = FakeUser32(desktop)
+        self.psutil = FakePsutil(make_processes(n_processes, apps, rng))
+        self.desktop = desktop
+        self.windows = WindowTitleCache() if not enumerate_windows else None
+        self._fill_cache()
+        # Ticks sweep the clock so every profile window is exercised
+        self.minutes = [(m // 60, m % 60) for m in range(0, 1440, 7)]
+
+    def _fill_cache(self):
+        if self.windows is not None:
+            self.windows.replace_all((hwnd, pid, title)
+                                     for hwnd, (pid, title, visible) in self.desktop.items()
+                                     if visible and title)
+
+    def install(self):
+        chrome_monitor.psutil = self.psutil
+        window_events._user32 = self.user32
+
+    def tick(self, i):
+        """What the monitor thread and Tk tick do per detection pass."""
+        config = self.config
+        hour, minute = self.minutes[i % len(self.minutes)]
+        config.any_profile_active(hour, minute)
+        triggers = config.get_triggers_in_window(hour, minute)
+        if not triggers:
+            return triggers, ()
+        snapshot = ProcessSnapshot.capture()
+        matches = get_active_matches(triggers, snapshot, config.trigger_index, self.windows)
+        for trigger in triggers:
+            if trigger.name in matches:
+                config.get_profile_for_trigger(trigger)
+        return triggers, matches
+
+    def lookups(self, i):
+        config = self.config
+        hour, minute = self.minutes[i % len(self.minutes)]
+        config.any_profile_active(hour, minute)
+        for trigger in config.get_triggers_in_window(hour, minute):
+            config.get_profile_for_trigger(trigger)
+
+    def close(self, i):
+        # close_trigger_apps evicts the windows it closed; start every round from the full desktop
+        self._fill_cache()
+        triggers, matches = self.tick(i)
+        to_close = [t for t in triggers if t.name in matches]
+        close_trigger_apps(to_close, ProcessSnapshot.capture(), self.windows)
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return pick(0.50), pick(0.95), pick(0.99)
+
+
+def measure(fn, rounds):
+    samples = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+
+def peak_kib(fn, rounds):
+    """Highest per-call peak allocation over a few calls (tracemalloc is slow)."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for i in range(rounds):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn(i)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=_sizes, default=[50, 500, 2000])
+    parser.add_argument("--windows", type=_sizes, default=[20, 100, 500])
+    parser.add_argument("--triggers", type=_sizes, default=[5, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=60)
+    parser.add_argument("--enumerate", action="store_true",
+                        help="enumerate fake windows per tick instead of using the title cache")
+    parser.add_argument("--budget-share", type=float, default=0.02,
+                        help="max p99 tick as a fraction of the 5 s interval (default 2%%)")
+    args = parser.parse_args()
+
+    budget_ms = TICK_BUDGET_MS * args.budget_share
+    print(f"{args.rounds} rounds per case, p99 tick budget {budget_ms:.0f} ms"
+          f"{' (EnumWindows per tick)' if args.enumerate else ''}")
+    print(f"{'case':<32} {'tick p50/p95/p99 ms':>22} {'lookup p99':>11} "
+          f"{'close p99':>10} {'tick KiB':>9}")
+
+    failures = []
+    for n_proc, n_win, n_trig in itertools.product(args.processes, args.windows, args.triggers):
+        case = Case(n_proc, n_win, n_trig, args.enumerate)
+        case.install()
+        tick = measure(case.tick, args.rounds)
+        lookup = measure(case.lookups, args.rounds)
+        close = measure(case.close, max(1, args.rounds // 4))
+        kib = peak_kib(case.tick, min(args.rounds, 10))
+        flag = ""
+        if tick[2] > budget_ms:
+            failures.append(case.label)
+            flag = "  OVER BUDGET"
+        print(f"{case.label:<32} {tick[0]:6.2f} /{tick[1]:6.2f} /{tick[2]:6.2f} "
+              f"{lookup[2]:11.3f} {close[2]:10.2f} {kib:9.0f}{flag}")
+
+    if failures:
+        print(f"\n{len(failures)} case(s) over the {budget_ms:.0f} ms tick budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
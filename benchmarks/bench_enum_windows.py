@@ -0,0 +1,82 @@
+"""Micro-benchmark: window enumeration cost per tick.
+
+Compares the old detection path (one browser-filtered EnumWindows walk plus
+one unfiltered walk) with the single-pass enum_windows() primitive, against a
+fake user32 holding a few hundred top-level windows.
+
+    python benchmarks/bench_enum_windows.py --windows 250
+"""
+import argparse
+import ctypes
+import time
+from ctypes import wintypes
+
+from fakes import BROWSER_PIDS, FakeUser32, make_desktop
+import window_events
+
+
+def legacy_titles(user32, filter_pids=None):
+    """The pre-refactor _get_window_titles, kept here as the baseline."""
+    titles = []
+    def _callback(hwnd, _lparam):
+        if not user32.IsWindowVisible(hwnd):
+            return True
+        if filter_pids is not None:
+            pid = wintypes.DWORD()
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            if pid.value not in filter_pids:
+                return True
+        length = user32.GetWindowTextLengthW(hwnd)
+        if length > 0:
+            buf = ctypes.create_unicode_buffer(length + 1)
+            user32.GetWindowTextW(hwnd, buf, length + 1)
+            if buf.value:
+                titles.append(buf.value)
+        return True
+    user32.EnumWindows(window_events._WNDENUMPROC(_callback), 0)
+    return titles
+
+
+def legacy_tick(user32, browser_pids):
+    browser_titles = legacy_titles(user32, browser_pids)
+    legacy_titles(user32)
+    return browser_titles
+
+
+def single_pass_tick(_user32, browser_pids):
+    return [title for _hwnd, pid, title in window_events.enum_windows()
+            if pid in browser_pids]
+
+
+def measure(fn, user32, browser_pids, rounds):
+    user32.calls = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(user32, browser_pids)
+    elapsed = time.perf_counter() - start
+    return elapsed / rounds * 1000, user32.calls / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--windows", type=int, default=250)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    user32 = FakeUser32(make_desktop(args.windows))
+    window_events._user32 = user32
+    browser_pids = set(BROWSER_PIDS)
+
+    assert sorted(legacy_tick(user32, browser_pids)) == sorted(single_pass_tick(user32, browser_pids))
+
+    old_ms, old_calls = measure(legacy_tick, user32, browser_pids, args.rounds)
+    new_ms, new_calls = measure(single_pass_tick, user32, browser_pids, args.rounds)
+    print(f"{args.windows} windows, {args.rounds} rounds")
+    print(f"  two walks   : {old_ms:7.3f} ms/tick  {old_calls:6.0f} user32 calls")
+    print(f"  single pass : {new_ms:7.3f} ms/tick  {new_calls:6.0f} user32 calls")
+    print(f"  saved       : {100 * (1 - new_ms / old_ms):5.1f} % time, "
+          f"{100 * (1 - new_calls / old_calls):5.1f} % calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark: cold start up to the tray icon.
+
+Two measurements, each in fresh interpreters:
+
+  * import profile of sticky_alarm (`python -X importtime`), top modules by
+    cumulative time. Fails if a lazily loaded UI module (settings window,
+    popups, winsound/wave) is imported at startup again. Where pystray or
+    PIL.ImageTk cannot load (no desktop session), they are replaced by empty
+    stubs and the rest of the import chain is still measured.
+  * time to tray: from process launch until StickyAlarmApp has built the
+    tray icon (Windows only — needs Tk, pystray and a desktop session).
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --top 25
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Must not be imported before the user opens the matching window
+LAZY_MODULES = ("settings_window", "popup", "break_popup", "diagnostics_window",
+                "winsound", "wave")
+
+# Builds the app and the tray icon, then reports and exits instead of
+# entering the tray and Tk main loops.
+_TRAY_PROBE = """
+import os
+import pystray
+import sticky_alarm
+
+def _probe_tray(self):
+    pystray.Icon.run = lambda icon, *a, **k: None
+    _run_tray(self)
+    print("TRAY", flush=True)
+    os._exit(0)
+
+_run_tray = sticky_alarm.StickyAlarmApp._run_tray
+sticky_alarm.StickyAlarmApp._run_tray = _probe_tray
+sticky_alarm.StickyAlarmApp().run()
+"""
+
+
+# Modules that need a desktop session to import; stubbed when they fail
+STUBBABLE = ("pystray", "PIL.ImageTk")
+
+# Installs the stubs, then marks where the measured import starts
+_STUB_PRELUDE = """
+import sys, types
+for name in {names!r}:
+    try:
+        __import__(name)
+    except Exception:
+        for loaded in [m for m in sys.modules if m == name or m.startswith(name + ".")]:
+            del sys.modules[loaded]
+        stub = types.ModuleType(name)
+        stub.__getattr__ = lambda attr: None
+        sys.modules[name] = stub
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, stub)
+        print("STUB", name, file=sys.stderr, flush=True)
+print("MEASURE", file=sys.stderr, flush=True)
+import sticky_alarm
+"""
+
+
+def _run_importtime(code):
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=SRC, capture_output=True, text=True)
+
+
+def import_profile(top):
+    """Return (total_us, [(cumulative_us, module)], eager lazy modules, stubbed modules)."""
+    stubbed = []
+    proc = _run_importtime("import sticky_alarm")
+    if proc.returncode == 0:
+        lines = proc.stderr.splitlines()
+    else:
+        proc = _run_importtime(_STUB_PRELUDE.format(names=STUBBABLE))
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        lines = proc.stderr.splitlines()
+        stubbed = [line.split()[1] for line in lines if line.startswith("STUB ")]
+        lines = lines[lines.index("MEASURE") + 1:]
+    rows = []
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()[1:]))  # nesting indent kept
+    total = sum(us for us, name in rows if not name.startswith(" "))
+    eager = sorted({name.strip() for _us, name in rows} & set(LAZY_MODULES))
+    rows.sort(reverse=True)
+    return total, rows[:top], eager, stubbed
+
+
+def time_to_tray(timeout=30):
+    started = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", _TRAY_PROBE], cwd=SRC,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    try:
+        for line in proc.stdout:
+            if line.strip() == "TRAY":
+                return (time.perf_counter() - started) * 1000
+        raise RuntimeError(proc.stderr.read().strip().splitlines()[-1])
+    finally:
+        proc.kill()
+        proc.wait(timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    failed = False
+    try:
+        totals = []
+        for _ in range(args.runs):
+            total, rows, eager, stubbed = import_profile(args.top)
+            totals.append(total / 1000)
+        print(f"import sticky_alarm: median {statistics.median(totals):.1f} ms "
+              f"over {args.runs} runs")
+        if stubbed:
+            print(f"  (stubbed, not measured: {', '.join(stubbed)})")
+        for us, name in rows:
+            print(f"  {us / 1000:8.1f} ms  {name}")
+        if eager:
+            print(f"FAIL: imported at startup: {', '.join(eager)}")
+            failed = True
+    except RuntimeError as e:
+        print(f"FAIL: import profile unavailable: {e}")
+        failed = True
+
+    if sys.platform == "win32":
+        times = [time_to_tray() for _ in range(args.runs)]
+        print(f"time to tray icon: median {statistics.median(times):.0f} ms, "
+              f"max {max(times):.0f} ms")
+    else:
+        print("time to tray icon: skipped (Windows only)")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
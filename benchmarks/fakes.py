@@ -0,0 +1,114 @@
+"""Fake psutil / user32 providers and synthetic desktops for the benchmarks."""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+BROWSER_PIDS = (1000, 1001, 1002)
+
+
+class FakeUser32:
+    """Just enough of user32 for EnumWindows-based enumeration, with call counting."""
+
+    def __init__(self, windows):
+        self.windows = windows  # hwnd -> (pid, title, visible)
+        self.calls = 0
+
+    def EnumWindows(self, proc, lparam):
+        self.calls += 1
+        for hwnd in self.windows:
+            if not proc(hwnd, lparam):
+                break
+        return True
+
+    def IsWindowVisible(self, hwnd):
+        self.calls += 1
+        return self.windows[hwnd][2]
+
+    def GetWindowThreadProcessId(self, hwnd, pid_ref):
+        self.calls += 1
+        pid_ref._obj.value = self.windows[hwnd][0]
+        return 1
+
+    def GetWindowTextLengthW(self, hwnd):
+        self.calls += 1
+        return len(self.windows[hwnd][1])
+
+    def GetWindowTextW(self, hwnd, buf, size):
+        self.calls += 1
+        buf.value = self.windows[hwnd][1][:size - 1]
+        return len(buf.value)
+
+    def PostMessageW(self, hwnd, msg, wparam, lparam):
+        self.calls += 1
+        return True
+
+
+class FakeProcess:
+    def __init__(self, pid, name):
+        self.pid = pid
+        self.info = {"pid": pid, "name": name}
+
+    def kill(self):
+        pass
+
+
+class FakePsutil:
+    """Stands in for the psutil module inside chrome_monitor."""
+
+    class NoSuchProcess(Exception):
+        pass
+
+    class AccessDenied(Exception):
+        pass
+
+    def __init__(self, processes):
+        self._procs = [FakeProcess(pid, name) for pid, name in processes]
+        self._by_pid = {p.pid: p for p in self._procs}
+
+    def process_iter(self, attrs=None):
+        return iter(self._procs)
+
+    def Process(self, pid):
+        try:
+            return self._by_pid[pid]
+        except KeyError:
+            raise self.NoSuchProcess(pid)
+
+    def wait_procs(self, procs, timeout=None):
+        return list(procs), []
+
+
+def make_desktop(n_windows, n_browser=12, site_names=(), rng=None):
+    """Typical desktop: many hidden/untitled helper windows, a few browser windows.
+
+    Returns hwnd -> (pid, title, visible). Browser titles mention some of the
+    given site names so matching has real hits.
+    """
+    rng = rng or random.Random(1)
+    windows = {}
+    for i in range(n_windows):
+        hwnd = 0x10000 + i
+        if i < n_browser:
+            site = rng.choice(site_names) if site_names and i % 3 == 0 else f"example{i}.com"
+            windows[hwnd] = (BROWSER_PIDS[i % 3], f"Tab {i} - {site} - Google Chrome", True)
+        elif i % 4 == 0:
+            windows[hwnd] = (2000 + i, f"Window {i}", True)
+        elif i % 4 == 1:
+            windows[hwnd] = (2000 + i, "", True)
+        else:
+            windows[hwnd] = (2000 + i, f"Hidden helper {i}", False)
+    return windows
+
+
+def make_processes(n_processes, app_names=(), rng=None):
+    """Process table with three browser processes and a few trigger apps running."""
+    rng = rng or random.Random(2)
+    procs = [(pid, "chrome.exe") for pid in BROWSER_PIDS]
+    running_apps = rng.sample(list(app_names), min(3, len(app_names)))
+    procs += [(3000 + i, f"{name}.exe") for i, name in enumerate(running_apps)]
+    while len(procs) < n_processes:
+        i = len(procs)
+        procs.append((5000 + i, f"svc{i}_{rng.randrange(10**6)}.exe"))
+    return procs[:max(n_processes, len(BROWSER_PIDS))]
@@ -8,6 +8,9 @@ echo.
 echo Building StickyAlarm.exe...
 pyinstaller --onefile --windowed --name="StickyAlarm" --icon=assets/icon.ico ^
     --add-data "src/config.py;." ^
+    --add-data "src/config_store.py;." ^
+    --add-data "src/config_schema.py;." ^
+    --add-data "src/config_watcher.py;." ^
     --add-data "src/scheduler.py;." ^
     --add-data "src/popup.py;." ^
     --add-data "src/chrome_monitor.py;." ^
@@ -16,8 +19,17 @@ pyinstaller --onefile --windowed --name="StickyAlarm" --icon=assets/icon.ico ^
     --add-data "src/autostart.py;." ^
     --add-data "src/theme.py;." ^
     --add-data "src/widgets.py;." ^
+    --add-data "src/animation.py;." ^
     --add-data "src/break_scheduler.py;." ^
     --add-data "src/break_popup.py;." ^
+    --add-data "src/trigger_matcher.py;." ^
+    --add-data "src/window_events.py;." ^
+    --add-data "src/monitor.py;." ^
+    --add-data "src/clock.py;." ^
+    --add-data "src/engine.py;." ^
+    --add-data "src/profiler.py;." ^
+    --add-data "src/diagnostics_window.py;." ^
+    --add-data "src/icon_cache.py;." ^
     --add-data "assets/icon.png;assets" ^
     --add-data "assets/sounds;assets/sounds" ^
     --hidden-import pystray._win32 ^
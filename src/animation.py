@@ -0,0 +1,119 @@
+"""Shared frame scheduler — one Tk timer drives every running animation."""
+import sys
+import tkinter as tk
+
+from clock import SYSTEM_CLOCK
+
+FRAME_MS = 16  # ~60 fps
+
+
+class Animation:
+    """A running animation, as returned by FrameScheduler.start()."""
+
+    def __init__(self, scheduler, on_frame, duration, on_done, started):
+        self._scheduler = scheduler
+        self.on_frame = on_frame
+        self.duration = duration
+        self.on_done = on_done
+        self.started = started
+
+    @property
+    def running(self):
+        return self in self._scheduler._active
+
+    def cancel(self):
+        """Stop without calling on_done."""
+        self._scheduler._remove(self)
+
+
+class FrameScheduler:
+    """Runs animation callbacks from a single after() timer on the Tk root.
+
+    Progress is computed from the monotonic clock, not counted in frames: a
+    frame that arrives late (the Tk loop was busy, e.g. during a tick) just
+    jumps ahead, and missed frames are skipped instead of queued. Only one
+    timer is pending at a time, and none at all while nothing animates.
+    """
+
+    def __init__(self, root, clock=SYSTEM_CLOCK, frame_ms=FRAME_MS):
+        self.root = root
+        self.clock = clock
+        self.frame_ms = frame_ms
+        self._active = []
+        self._after_id = None
+
+    def start(self, on_frame, duration=None, on_done=None):
+        """Call on_frame every frame until the animation ends.
+
+        With a duration (seconds), on_frame(t) gets the progress t in 0..1 and
+        is called once more with exactly 1.0 before on_done(). Without one,
+        on_frame(elapsed) gets the seconds since start and runs until
+        cancelled. on_frame may return False to stop early (on_done is not
+        called). If on_frame raises, the error is reported and a timed
+        animation ends with on_done(). The first frame is drawn immediately.
+        """
+        anim = Animation(self, on_frame, duration, on_done, self.clock.monotonic())
+        self._active.append(anim)
+        self._step(anim, anim.started)
+        if anim in self._active and self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._frame)
+        return anim
+
+    def _remove(self, anim):
+        if anim in self._active:
+            self._active.remove(anim)
+        if not self._active and self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _step(self, anim, now):
+        elapsed = now - anim.started
+        finished = False
+        try:
+            if anim.duration is None:
+                keep = anim.on_frame(elapsed)
+            else:
+                t = min(1.0, elapsed / anim.duration) if anim.duration > 0 else 1.0
+                keep = anim.on_frame(t)
+                finished = t >= 1.0
+        except tk.TclError:
+            keep = False  # widget destroyed mid-animation
+        except Exception:
+            # Report it like any Tk callback error, then finish just this animation
+            # so whatever waits on on_done (e.g. a fade-out) still happens
+            self.root.report_callback_exception(*sys.exc_info())
+            self._remove(anim)
+            if anim.duration is not None and anim.on_done:
+                anim.on_done()
+            return
+        if keep is False or finished:
+            self._remove(anim)
+        if finished and keep is not False and anim.on_done:
+            anim.on_done()
+
+    def _frame(self):
+        self._after_id = None
+        now = self.clock.monotonic()
+        try:
+            for anim in list(self._active):
+                if anim in self._active:  # an earlier callback may have cancelled it
+                    self._step(anim, now)
+        finally:
+            if self._active and self._after_id is None:
+                # Aim for the next frame boundary; never queue up behind a slow frame
+                spent_ms = int((self.clock.monotonic() - now) * 1000)
+                self._after_id = self.root.after(max(1, self.frame_ms - spent_ms), self._frame)
+
+
+def frame_scheduler(widget):
+    """The FrameScheduler shared by every widget under the same Tk root."""
+    root = widget._root()
+    scheduler = getattr(root, "_frame_scheduler", None)
+    if scheduler is None:
+        scheduler = root._frame_scheduler = FrameScheduler(root)
+    return scheduler
+
+
+def animate(widget, on_frame, duration=None, on_done=None):
+    """Shortcut for frame_scheduler(widget).start(...)."""
+    return frame_scheduler(widget).start(on_frame, duration, on_done)
@@ -1,8 +1,10 @@
 """Break countdown popup — gentle reminder with circular progress ring and rounded card."""
+import math
 import tkinter as tk
 
 import theme as T
-from widgets import RoundedButton, fade_in_window, fade_out_window, draw_circular_progress, round_rect
+from animation import animate
+from widgets import CardWindow, ProgressRing, RoundedButton, fade_in_window, fade_out_window
 
 
 class BreakPopup:
@@ -10,82 +12,42 @@ class BreakPopup:
         self.root = root
         self.on_snooze = on_snooze
         self.on_complete = on_complete
-        self.popup = None
-        self._countdown_id = None
+        self.card = None  # CardWindow, built by build() and kept for the app's lifetime
+        self._showing = False
+        self._countdown = None
         self._remaining = 0
+        self._shown_remaining = None
         self._total = 0
 
-    def show(self, duration_seconds, title="Pause", text="Steh auf, streck dich, trink Wasser.", fullscreen=False, icon="\u2615"):
-        if self.popup and self.popup.winfo_exists():
-            return
-        self._remaining = duration_seconds
-        self._total = duration_seconds
-
-        self.popup = tk.Toplevel(self.root)
-        self.popup.overrideredirect(True)
-        self.popup.attributes("-topmost", True)
-
-        sx = self.popup.winfo_screenwidth()
-        sy = self.popup.winfo_screenheight()
-
-        cw, ch = 420, 530
-        radius = T.CARD_RADIUS
-        margin = 10
+    @property
+    def popup(self):
+        return self.card.window if self.card is not None else None
 
-        if fullscreen:
-            self.popup.geometry(f"{sx}x{sy}+0+0")
-            self.popup.configure(bg="#000000", highlightthickness=0)
+    def build(self):
+        """Create the (withdrawn) window and its widgets; show() reuses them."""
+        if self.card is not None and self.card.exists():
+            return
+        self.card = card = CardWindow(self.root, 420, 530, pad_x=80, pad_y=56)
+        inner = card.inner
 
-            card_canvas = tk.Canvas(
-                self.popup, width=cw + margin * 2, height=ch + margin * 2,
-                bg="#000000", highlightthickness=0, bd=0)
-            card_canvas.place(relx=0.5, rely=0.5, anchor="center")
-        else:
-            pw, ph = cw + margin * 2, ch + margin * 2
-            x, y = (sx - pw) // 2, (sy - ph) // 2
-            self.popup.geometry(f"{pw}x{ph}+{x}+{y}")
-            self.popup.configure(bg="#FF00FF", highlightthickness=0)
-            self.popup.attributes("-transparentcolor", "#FF00FF")
-
-            card_canvas = tk.Canvas(
-                self.popup, width=pw, height=ph,
-                bg="#FF00FF", highlightthickness=0, bd=0)
-            card_canvas.pack(fill="both", expand=True)
-
-        # Shadow layer
-        round_rect(card_canvas, margin + 4, margin + 4,
-                   margin + cw + 4, margin + ch + 4,
-                   radius=radius, fill=T.BG_SHADOW, outline="")
-        # Card background
-        round_rect(card_canvas, margin, margin,
-                   margin + cw, margin + ch,
-                   radius=radius, fill=T.BG, outline=T.BORDER)
-
-        # Content frame
-        inner = tk.Frame(card_canvas, bg=T.BG)
-        card_canvas.create_window(
-            margin + cw // 2, margin + ch // 2,
-            window=inner, width=cw - 80, height=ch - 56)
-
-        # Icon
-        if icon:
-            tk.Label(
-                inner, text=icon, font=("Segoe UI Emoji", 36),
-                bg=T.BG, fg=T.TEXT,
-            ).pack(pady=(0, 4))
+        # Icon (hidden when the user picked none)
+        self._icon_label = tk.Label(
+            inner, font=("Segoe UI Emoji", 36),
+            bg=T.BG, fg=T.TEXT,
+        )
 
         # Title
-        tk.Label(
-            inner, text=title,
-            font=(T.FONT, 22, "bold"), bg=T.BG, fg=T.TEXT,
-        ).pack(pady=(0, 4))
+        self._title_label = tk.Label(
+            inner, font=(T.FONT, 22, "bold"), bg=T.BG, fg=T.TEXT,
+        )
+        self._title_label.pack(pady=(0, 4))
 
         # Subtitle
-        tk.Label(
-            inner, text=text,
-            font=(T.FONT, 11), bg=T.BG, fg=T.TEXT_MUTED,
+        self._text_label = tk.Label(
+            inner, font=(T.FONT, 11), bg=T.BG, fg=T.TEXT_MUTED,
             justify="center",
-        ).pack(pady=(0, 16))
+        )
+        self._text_label.pack(pady=(0, 16))
 
         # Circular progress ring with timer text
         ring_size = 200
@@ -94,52 +56,69 @@ class BreakPopup:
             bg=T.BG, highlightthickness=0, bd=0,
         )
         self._ring_canvas.pack(pady=(0, 16))
+        center = ring_size // 2
+        self._ring = ProgressRing(self._ring_canvas, center, center, radius=78, thickness=10,
+                                  fg_color=T.ACCENT, glow_color=T.ACCENT_DIM)
+        # Timer text centered in ring
+        self._ring_text = self._ring_canvas.create_text(
+            center, center, text="",
+            font=(T.FONT, T.FONT_SIZE_HERO, "bold"),
+            fill=T.TEXT, anchor="center",
+        )
 
         # Snooze button (secondary style)
-        RoundedButton(
+        self._snooze_btn = RoundedButton(
             inner, text="Schlummern",
             bg=T.BG_INPUT, fg=T.TEXT,
             hover_bg=T.BG_HOVER, hover_fg=T.TEXT,
             command=self._on_snooze,
             width=200, height=48, radius=18,
-        ).pack()
-
-        fade_in_window(self.popup, duration_ms=300)
-        self._update_countdown()
+        )
+        self._snooze_btn.pack()
 
-    def _update_countdown(self):
-        if not self.popup or not self.popup.winfo_exists():
+    def show(self, duration_seconds, title="Pause", text="Steh auf, streck dich, trink Wasser.", fullscreen=False, icon="\u2615"):
+        if self.is_showing:
             return
-        mins, secs = divmod(self._remaining, 60)
-        time_text = f"{mins:02d}:{secs:02d}"
-        self._draw_ring(time_text)
-        if self._remaining > 0:
-            self._remaining -= 1
-            self._countdown_id = self.root.after(1000, self._update_countdown)
+        self._remaining = duration_seconds
+        self._total = duration_seconds
+        self._shown_remaining = None
+        self.build()
+
+        # Only texts and geometry change between breaks
+        if icon:
+            self._icon_label.configure(text=icon)
+            if not self._icon_label.winfo_manager():
+                self._icon_label.pack(pady=(0, 4), before=self._title_label)
         else:
-            self._on_timer_complete()
-
-    def _draw_ring(self, time_text):
-        c = self._ring_canvas
-        c.delete("all")
-        size = 200
-        cx, cy = size // 2, size // 2
-        radius = 78
-        thickness = 10
-        fraction = self._remaining / self._total if self._total > 0 else 0
-
-        # Subtle glow layer behind foreground arc
-        if fraction > 0.003:
-            draw_circular_progress(c, cx, cy, radius, thickness + 6,
-                                   fraction, T.ACCENT_DIM)
-        draw_circular_progress(c, cx, cy, radius, thickness, fraction, T.ACCENT)
+            self._icon_label.pack_forget()
+        self._title_label.configure(text=title)
+        self._text_label.configure(text=text)
+        self._snooze_btn.reset()
+        self.card.show(fullscreen)
+        self._showing = True
 
-        # Timer text centered in ring
-        c.create_text(
-            cx, cy, text=time_text,
-            font=(T.FONT, T.FONT_SIZE_HERO, "bold"),
-            fill=T.TEXT, anchor="center",
-        )
+        fade_in_window(self.popup, duration_ms=300)
+        self._start_countdown()
+
+    def _start_countdown(self):
+        """Drive the ring every frame; the time left comes from a monotonic deadline."""
+        self._countdown = animate(self.popup, self._countdown_frame, self._total,
+                                  on_done=self._on_timer_complete)
+
+    def _countdown_frame(self, t):
+        if not self.is_showing:
+            return False
+        self._remaining = math.ceil(self._total * (1 - t))
+        self._ring.set(1 - t)
+        if self._remaining != self._shown_remaining:
+            self._shown_remaining = self._remaining
+            mins, secs = divmod(self._remaining, 60)
+            self._ring_canvas.itemconfigure(self._ring_text, text=f"{mins:02d}:{secs:02d}")
+
+    def _stop_countdown(self):
+        if self._countdown:
+            self._countdown.cancel()
+            self._countdown = None
 
     def _on_snooze(self):
         self._fade_and_close(self.on_snooze)
@@ -148,29 +127,26 @@ class BreakPopup:
         self._fade_and_close(self.on_complete)
 
     def _fade_and_close(self, callback):
-        if self._countdown_id:
-            self.root.after_cancel(self._countdown_id)
-            self._countdown_id = None
-        if self.popup and self.popup.winfo_exists():
-            fade_out_window(self.popup, duration_ms=250, on_done=lambda: self._destroy_and_call(callback))
+        self._stop_countdown()
+        if self.is_showing:
+            fade_out_window(self.popup, duration_ms=250, on_done=lambda: self._hide_and_call(callback))
         else:
-            self.popup = None
+            self._showing = False
             callback()
 
-    def _destroy_and_call(self, callback):
-        if self.popup and self.popup.winfo_exists():
-            self.popup.destroy()
-        self.popup = None
+    def _hide_and_call(self, callback):
+        self._hide()
         callback()
 
+    def _hide(self):
+        self._showing = False
+        if self.card is not None:
+            self.card.hide()
+
     def dismiss(self):
-        if self._countdown_id:
-            self.root.after_cancel(self._countdown_id)
-            self._countdown_id = None
-        if self.popup and self.popup.winfo_exists():
-            self.popup.destroy()
-        self.popup = None
+        self._stop_countdown()
+        self._hide()
 
     @property
     def is_showing(self):
-        return self.popup is not None and self.popup.winfo_exists()
+        return self._showing and self.card is not None and self.card.exists()
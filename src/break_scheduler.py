@@ -1,6 +1,8 @@
 """Break timer scheduler — independent periodic break reminders."""
 from enum import Enum, auto
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from clock import SYSTEM_CLOCK
 
 
 class BreakState(Enum):
@@ -11,23 +13,31 @@ class BreakState(Enum):
     SNOOZED = auto()     # user snoozed, waiting
 
 
+# While enabled, tick at least this often so the sleep/lock gap check still works
+SLEEP_CHECK_INTERVAL = 60
+# A monotonic gap this long between ticks means the PC was asleep or locked
+SLEEP_GAP = 300
+
+
 class BreakScheduler:
-    def __init__(self, config):
+    """All deadlines are monotonic seconds, so wall-clock jumps never fire or lose a break."""
+
+    def __init__(self, config, clock=None):
         self.config = config
+        self.clock = clock or SYSTEM_CLOCK
         self.state = BreakState.IDLE
         self._next_break = None
         self._break_end = None
         self._snooze_end = None
         self._timer_start = None
-        self._last_tick_time = datetime.now()
+        self._last_tick_time = self.clock.monotonic()
         if config.break_enabled:
             self._reset_timer()
 
     def _reset_timer(self):
-        now = datetime.now()
+        now = self.clock.monotonic()
         self._timer_start = now
-        self._next_break = now + timedelta(
-            minutes=self.config.break_interval_minutes)
+        self._next_break = now + self.config.break_interval_minutes * 60
         self._break_end = None
         self._snooze_end = None
         self._last_tick_time = now
@@ -38,12 +48,13 @@ class BreakScheduler:
             self.state = BreakState.IDLE
             return self.state
 
-        now = datetime.now()
+        now = self.clock.monotonic()
 
-        # Detect PC lock/sleep: if gap between ticks >= 5 minutes, reset timer
-        if self._last_tick_time:
-            gap = (now - self._last_tick_time).total_seconds()
-            if gap >= 300:  # 5 minutes
+        # Detect PC lock/sleep: if gap between ticks >= 5 minutes, reset timer.
+        # Measured on the monotonic clock, so a wall-clock change is not a gap.
+        if self._last_tick_time is not None:
+            gap = now - self._last_tick_time
+            if gap >= SLEEP_GAP:
                 self._last_tick_time = now
                 self._reset_timer()
                 return self.state
@@ -53,43 +64,60 @@ class BreakScheduler:
             self._reset_timer()
 
         elif self.state == BreakState.RUNNING:
-            if self._next_break and now >= self._next_break:
+            if self._next_break is not None and now >= self._next_break:
                 self.state = BreakState.BREAK_DUE
 
         elif self.state == BreakState.BREAK_ACTIVE:
-            if self._break_end and now >= self._break_end:
+            if self._break_end is not None and now >= self._break_end:
                 self._reset_timer()
 
         elif self.state == BreakState.SNOOZED:
-            if self._snooze_end and now >= self._snooze_end:
+            if self._snooze_end is not None and now >= self._snooze_end:
                 self.state = BreakState.BREAK_DUE
 
         return self.state
 
+    def next_wakeup(self, now):
+        """Earliest wall-clock instant at which tick() needs to run again, or None when idle."""
+        if not self.config.break_enabled:
+            return None
+        deadline = None
+        if self.state == BreakState.RUNNING:
+            deadline = self._next_break
+        elif self.state == BreakState.BREAK_ACTIVE:
+            deadline = self._break_end
+        elif self.state == BreakState.SNOOZED:
+            deadline = self._snooze_end
+        mono = self.clock.monotonic()
+        if self.state == BreakState.BREAK_DUE:
+            # Waiting for the alarm popup to go away
+            deadline = mono + 5
+        if deadline is None or deadline > mono + SLEEP_CHECK_INTERVAL:
+            deadline = mono + SLEEP_CHECK_INTERVAL
+        return now + timedelta(seconds=max(0.0, deadline - mono))
+
     def start_break(self):
         self.state = BreakState.BREAK_ACTIVE
-        self._break_end = datetime.now() + timedelta(
-            minutes=self.config.break_duration_minutes)
+        self._break_end = self.clock.monotonic() + self.config.break_duration_minutes * 60
 
     def snooze(self):
         self.state = BreakState.SNOOZED
-        self._snooze_end = datetime.now() + timedelta(
-            minutes=self.config.break_snooze_minutes)
+        self._snooze_end = self.clock.monotonic() + self.config.break_snooze_minutes * 60
 
     def skip_break(self):
         self._reset_timer()
 
     def remaining_break_seconds(self) -> int:
-        if self.state == BreakState.BREAK_ACTIVE and self._break_end:
-            return max(0, int((self._break_end - datetime.now()).total_seconds()))
+        if self.state == BreakState.BREAK_ACTIVE and self._break_end is not None:
+            return max(0, int(self._break_end - self.clock.monotonic()))
         return 0
 
     def remaining_until_break_seconds(self) -> int:
         """Seconds until next break is due (for display in settings)."""
-        if self.state == BreakState.RUNNING and self._next_break:
-            return max(0, int((self._next_break - datetime.now()).total_seconds()))
-        if self.state == BreakState.SNOOZED and self._snooze_end:
-            return max(0, int((self._snooze_end - datetime.now()).total_seconds()))
+        if self.state == BreakState.RUNNING and self._next_break is not None:
+            return max(0, int(self._next_break - self.clock.monotonic()))
+        if self.state == BreakState.SNOOZED and self._snooze_end is not None:
+            return max(0, int(self._snooze_end - self.clock.monotonic()))
         return 0
 
     def reload_config(self):
@@ -99,16 +127,17 @@ class BreakScheduler:
             self._break_end = None
             self._snooze_end = None
             self._timer_start = None
-        elif self.state == BreakState.RUNNING and self._timer_start:
+        elif self.state == BreakState.RUNNING and self._timer_start is not None:
             # Smart adjust: keep elapsed time, recalculate next break
-            elapsed = (datetime.now() - self._timer_start).total_seconds()
+            now = self.clock.monotonic()
+            elapsed = now - self._timer_start
             new_interval_secs = self.config.break_interval_minutes * 60
             remaining = new_interval_secs - elapsed
             if remaining <= 0:
                 # Elapsed already exceeds new interval — trigger soon
-                self._next_break = datetime.now() + timedelta(seconds=5)
+                self._next_break = now + 5
             else:
-                self._next_break = datetime.now() + timedelta(seconds=remaining)
+                self._next_break = now + remaining
         elif self.state == BreakState.SNOOZED:
             # Re-apply snooze with new config snooze duration
             # Keep existing snooze_end, don't reset
@@ -1,124 +1,182 @@
 """App & website monitor for Sticky Alarm."""
-import ctypes
-from ctypes import wintypes
+from typing import NamedTuple
+
 import psutil
-import subprocess
+
+from profiler import NULL_PROFILER
+from trigger_matcher import TriggerIndex
+from window_events import enum_windows, post_close
 
 _BROWSER_NAMES = {"chrome.exe", "msedge.exe", "firefox.exe", "brave.exe", "opera.exe"}
-_user32 = ctypes.windll.user32
-_WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
 
 
-def _get_browser_pids():
-    pids = set()
-    for proc in psutil.process_iter(["name", "pid"]):
+_KILL_TIMEOUT = 3.0  # seconds to wait for killed processes to exit
+
+
+class ProcessSnapshot:
+    """One walk of the process table, shared by every trigger check in a tick."""
+
+    def __init__(self, processes=(), handles=None):
+        self.names = {}  # pid -> process name
+        self.pids_by_name = {}  # lowercase name -> [pid, ...]
+        self.handles = handles or {}  # pid -> psutil.Process from the walk
+        for pid, name in processes:
+            if not name:
+                continue
+            self.names[pid] = name
+            self.pids_by_name.setdefault(name.lower(), []).append(pid)
+        self.lower_names = list(self.pids_by_name)
+
+    @classmethod
+    def capture(cls):
+        processes = []
+        handles = {}
+        for proc in psutil.process_iter(["name", "pid"]):
+            try:
+                pid = proc.info["pid"]
+                processes.append((pid, proc.info["name"]))
+                handles[pid] = proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return cls(processes, handles)
+
+    @property
+    def browser_pids(self):
+        pids = set()
+        for name in _BROWSER_NAMES:
+            pids.update(self.pids_by_name.get(name, ()))
+        return pids
+
+    def handle(self, pid):
+        proc = self.handles.get(pid)
+        return proc if proc is not None else psutil.Process(pid)
+
+
+class CloseReport(NamedTuple):
+    """Outcome of close_trigger_apps."""
+    killed: tuple           # (pid, name) of processes that exited
+    alive: tuple            # (pid, name) still running after the bounded wait
+    windows_closed: int     # browser windows asked to close
+
+    def still_running(self, trigger):
+        """True if a process of this app trigger survived the close."""
+        if trigger.type != "app":
+            return False
+        proc_name = app_process_name(trigger.name_lower)
+        return any(name.lower() == proc_name for _pid, name in self.alive)
+
+
+def app_process_name(name):
+    """Image name an app trigger matches, like taskkill /IM (lowercase name in)."""
+    return name if name.endswith(".exe") else f"{name}.exe"
+
+
+def terminate_pids(snapshot, pids, timeout=_KILL_TIMEOUT):
+    """Kill all pids at once, then wait for them together (bounded).
+
+    Returns (killed, alive) as lists of pids; pids that could not be killed
+    (e.g. access denied) count as alive.
+    """
+    procs = []
+    killed = []
+    denied = []
+    for pid in pids:
         try:
-            name = proc.info["name"]
-            if name and name.lower() in _BROWSER_NAMES:
-                pids.add(proc.info["pid"])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-    return pids
-
-
-def _get_window_titles(filter_pids=None):
-    titles = []
-    def _callback(hwnd, _lparam):
-        if not _user32.IsWindowVisible(hwnd):
-            return True
-        if filter_pids is not None:
-            pid = wintypes.DWORD()
-            _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-            if pid.value not in filter_pids:
-                return True
-        length = _user32.GetWindowTextLengthW(hwnd)
-        if length > 0:
-            buf = ctypes.create_unicode_buffer(length + 1)
-            _user32.GetWindowTextW(hwnd, buf, length + 1)
-            if buf.value:
-                titles.append(buf.value)
-        return True
-    _user32.EnumWindows(_WNDENUMPROC(_callback), 0)
-    return titles
-
-
-def _get_window_handles_with_titles(filter_pids=None):
-    """Return list of (hwnd, title) for matching windows."""
-    results = []
-    def _callback(hwnd, _lparam):
-        if not _user32.IsWindowVisible(hwnd):
-            return True
-        if filter_pids is not None:
-            pid = wintypes.DWORD()
-            _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-            if pid.value not in filter_pids:
-                return True
-        length = _user32.GetWindowTextLengthW(hwnd)
-        if length > 0:
-            buf = ctypes.create_unicode_buffer(length + 1)
-            _user32.GetWindowTextW(hwnd, buf, length + 1)
-            if buf.value:
-                results.append((hwnd, buf.value))
-        return True
-    _user32.EnumWindows(_WNDENUMPROC(_callback), 0)
-    return results
-
-
-def get_active_matches(triggers):
-    """Return list of trigger names that are currently active."""
-    matched = []
-    browser_pids = _get_browser_pids()
-    browser_titles = _get_window_titles(browser_pids)
-    all_titles = _get_window_titles()
+            proc = snapshot.handle(pid)
+            proc.kill()
+            procs.append(proc)
+        except psutil.NoSuchProcess:
+            killed.append(pid)
+        except (psutil.AccessDenied, OSError):
+            denied.append(pid)
+    if procs:
+        gone, alive = psutil.wait_procs(procs, timeout=timeout)
+    else:
+        gone, alive = [], []
+    killed.extend(p.pid for p in gone)
+    return killed, [p.pid for p in alive] + denied
 
-    for trigger in triggers:
-        name = trigger.name.lower()
-        if trigger.type == "site":
-            for title in browser_titles:
-                if name in title.lower():
-                    matched.append(trigger.name)
-                    break
-        elif trigger.type == "app":
-            # Check running processes
-            for proc in psutil.process_iter(["name"]):
-                try:
-                    pname = proc.info["name"]
-                    if pname and name in pname.lower():
-                        matched.append(trigger.name)
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+
+def _list_windows(windows=None, filter_pids=None):
+    """Return (hwnd, pid, title) tuples from the cache, or from one EnumWindows pass."""
+    if windows is not None:
+        return windows.windows(filter_pids)
+    return [w for w in enum_windows() if filter_pids is None or w[1] in filter_pids]
+
+
+def get_active_matches(triggers, snapshot=None, index=None, windows=None, profiler=None):
+    """Return list of trigger names that are currently active.
+
+    Pass a ProcessSnapshot to reuse one process-table walk across callers,
+    the Config's TriggerIndex to skip compiling the trigger names, and a
+    WindowTitleCache to read titles from instead of enumerating windows.
+    A TickProfiler gets the "windows" and "matching" phases.
+    """
+    profiler = profiler or NULL_PROFILER
+    if snapshot is None:
+        snapshot = ProcessSnapshot.capture()
+    if index is None:
+        index = TriggerIndex(triggers)
+    with profiler.phase("windows"):
+        browser_titles = [title for _hwnd, _pid, title
+                          in _list_windows(windows, snapshot.browser_pids)]
+    with profiler.phase("matching"):
+        found_sites = index.match_sites(browser_titles)
+        found_apps = index.match_apps(snapshot.lower_names)
+
+        matched = []
+        for trigger in triggers:
+            name = trigger.name_lower
+            if trigger.type == "site" and name in found_sites:
+                matched.append(trigger.name)
+            elif trigger.type == "app" and name in found_apps:
+                matched.append(trigger.name)
     return matched
 
 
-def close_trigger_apps(triggers):
-    """Kill processes matching app triggers, close browser tabs matching site triggers."""
-    WM_CLOSE = 0x0010
+def close_trigger_apps(triggers, snapshot=None, windows=None):
+    """Kill processes matching app triggers, close browser tabs matching site triggers.
+
+    App processes are matched by image name (like taskkill /IM) against the
+    snapshot and killed in one batch. Returns a CloseReport.
+    """
+    if snapshot is None:
+        snapshot = ProcessSnapshot.capture()
+    pids = []
+    site_names = []
     for trigger in triggers:
-        name = trigger.name.lower()
+        name = trigger.name_lower
         if trigger.type == "app":
-            # Try taskkill
-            proc_name = name if name.endswith(".exe") else f"{name}.exe"
-            try:
-                subprocess.run(
-                    ["taskkill", "/IM", proc_name, "/F"],
-                    capture_output=True, creationflags=0x08000000  # CREATE_NO_WINDOW
-                )
-            except Exception:
-                pass
+            pids.extend(snapshot.pids_by_name.get(app_process_name(name), ()))
         elif trigger.type == "site":
-            # Close browser windows whose title contains the site name
-            browser_pids = _get_browser_pids()
-            for hwnd, title in _get_window_handles_with_titles(browser_pids):
-                if name in title.lower():
-                    _user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+            site_names.append(name)
+
+    # Close browser windows whose title contains the site name
+    windows_closed = 0
+    if site_names:
+        for hwnd, _pid, title in _list_windows(windows, snapshot.browser_pids):
+            lower = title.lower()
+            if any(name in lower for name in site_names):
+                post_close(hwnd)
+                windows_closed += 1
+                if windows is not None:
+                    # WM_CLOSE is only posted; drop the title now so the next
+                    # scan does not match the window while it is still closing
+                    windows.remove(hwnd)
+
+    killed, alive = terminate_pids(snapshot, pids) if pids else ([], [])
+    return CloseReport(
+        killed=tuple((pid, snapshot.names.get(pid, "")) for pid in killed),
+        alive=tuple((pid, snapshot.names.get(pid, "")) for pid in alive),
+        windows_closed=windows_closed,
+    )
 
 
-def is_app_window_open(app_name):
+def is_app_window_open(app_name, windows=None):
     if not app_name:
         return False
     keyword = app_name.lower().strip()
-    for title in _get_window_titles():
+    for _hwnd, _pid, title in _list_windows(windows):
         if keyword in title.lower():
             return True
     return False
@@ -0,0 +1,50 @@
+"""Clock abstraction — monotonic time for durations, wall time for schedule windows."""
+import time
+from datetime import datetime, timedelta
+
+
+class Clock:
+    """The real clock.
+
+    monotonic() never jumps (NTP, DST, manual changes) and is what deadlines
+    and durations are measured with. now()/time() are wall time and only used
+    for schedule windows and persisted timestamps.
+    """
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def now(self):
+        return datetime.now()
+
+    def time(self):
+        return time.time()
+
+
+class FakeClock(Clock):
+    """Manually driven clock for tests and simulations."""
+
+    def __init__(self, start=None):
+        self._wall = start or datetime(2024, 1, 1, 12, 0)
+        self._mono = 0.0
+
+    def monotonic(self):
+        return self._mono
+
+    def now(self):
+        return self._wall
+
+    def time(self):
+        return self._wall.timestamp()
+
+    def advance(self, seconds):
+        """Let real time pass: both clocks move forward."""
+        self._mono += seconds
+        self._wall += timedelta(seconds=seconds)
+
+    def set_wall(self, wall):
+        """Change the wall clock only (NTP correction, DST, user edit)."""
+        self._wall = wall
+
+
+SYSTEM_CLOCK = Clock()
@@ -4,33 +4,64 @@ import json
 import os
 import time
 import random
-from dataclasses import dataclass, field, asdict
+import bisect
+import shutil
+from datetime import timedelta
+from dataclasses import dataclass, field, fields
+from typing import NamedTuple
+
+from config_schema import CURRENT_VERSION, Field, Record, can_migrate, make_codec, migrate
+from config_store import ConfigWriter
+from trigger_matcher import TriggerIndex
 
 
 CONFIG_DIR = os.path.join(os.environ.get("APPDATA", ""), "StickyAlarm")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+USAGE_FILE = os.path.join(CONFIG_DIR, "usage.jsonl")
+
+_writer = ConfigWriter(CONFIG_FILE)
+
+# Top-level settings grouped by the component that depends on them
+BREAK_TIMER_FIELDS = frozenset({
+    "break_enabled", "break_interval_minutes", "break_duration_minutes", "break_snooze_minutes"})
+ALARM_POPUP_FIELDS = frozenset({
+    "popup_title", "popup_text", "snooze_label", "confirm_label", "sound_file", "fullscreen_popup"})
 
 
 def _generate_id():
     return f"{int(time.time() * 1000)}_{random.randint(0, 9999)}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TriggerSchedule:
     start_hour: int = 20
     start_minute: int = 0
     end_hour: int = 4
     end_minute: int = 0
+    # Derived once in __post_init__ (minute of day), not part of the config
+    start: int = field(init=False, repr=False, compare=False)
+    end: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "start", self.start_hour * 60 + self.start_minute)
+        object.__setattr__(self, "end", self.end_hour * 60 + self.end_minute)
 
     def is_in_window(self, hour, minute) -> bool:
-        start = self.start_hour * 60 + self.start_minute
-        end = self.end_hour * 60 + self.end_minute
+        start, end = self.start, self.end
         now = hour * 60 + minute
         if start <= end:
             return start <= now < end
         else:
             return now >= start or now < end
 
+    def window_start(self, now):
+        """Return the start datetime of the window containing `now`."""
+        start = now.replace(hour=self.start_hour, minute=self.start_minute,
+                            second=0, microsecond=0)
+        if start > now:
+            start -= timedelta(days=1)
+        return start
+
     @property
     def display(self):
         return (
@@ -39,7 +70,7 @@ class TriggerSchedule:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleProfile:
     id: str = ""
     name: str = "Abends"
@@ -62,70 +93,175 @@ class ScheduleProfile:
             self.launch_apps = []
 
     def to_dict(self):
-        d = {
-            "id": self.id,
-            "name": self.name,
-            "schedule": asdict(self.schedule),
-        }
-        if self.snooze_minutes:
-            d["snooze_minutes"] = self.snooze_minutes
-        if self.alarm_title:
-            d["alarm_title"] = self.alarm_title
-        if self.alarm_message:
-            d["alarm_message"] = self.alarm_message
-        if self.snooze_label:
-            d["snooze_label"] = self.snooze_label
-        if self.confirm_label:
-            d["confirm_label"] = self.confirm_label
-        if self.launch_apps:
-            d["launch_apps"] = self.launch_apps
-        return d
+        return _codec.encoders[ScheduleProfile](self)
 
     @classmethod
     def from_dict(cls, d):
-        schedule = d.get("schedule")
-        if isinstance(schedule, dict):
-            schedule = TriggerSchedule(**schedule)
-        return cls(
-            id=d.get("id", ""),
-            name=d.get("name", "Abends"),
-            schedule=schedule,
-            snooze_minutes=d.get("snooze_minutes", 0),
-            alarm_title=d.get("alarm_title", ""),
-            alarm_message=d.get("alarm_message", ""),
-            snooze_label=d.get("snooze_label", ""),
-            confirm_label=d.get("confirm_label", ""),
-            launch_apps=d.get("launch_apps", []),
-        )
+        """Lenient decode; invalid fields fall back to their defaults."""
+        return _codec.decoders[ScheduleProfile](d, [])
 
 
-@dataclass
+# Not frozen: a frozen __init__ is ~3x slower, which shows when a 10k-entry
+# blocklist is decoded at startup. Entries are replaced, never edited in place.
+@dataclass(slots=True)
 class TriggerEntry:
     name: str = ""
     type: str = "site"
     profile_id: str = ""
     time_limit_minutes: int = 0
+    # Derived once in __post_init__ for the per-tick loops, not part of the config
+    name_lower: str = field(init=False, repr=False, compare=False)
+    limit_seconds: int = field(init=False, repr=False, compare=False)
+    is_time_based: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_time_based(self):
-        return self.time_limit_minutes > 0
+    def __post_init__(self):
+        lower = self.name.lower()
+        # Share the name string when it already is lowercase (most site triggers)
+        self.name_lower = self.name if lower == self.name else lower
+        self.limit_seconds = self.time_limit_minutes * 60
+        self.is_time_based = self.time_limit_minutes > 0
 
     def to_dict(self):
-        d = {"name": self.name, "type": self.type}
-        if self.profile_id:
-            d["profile_id"] = self.profile_id
-        if self.time_limit_minutes:
-            d["time_limit_minutes"] = self.time_limit_minutes
-        return d
+        return _codec.encoders[TriggerEntry](self)
 
     @classmethod
     def from_dict(cls, d):
-        return cls(
-            name=d.get("name", ""),
-            type=d.get("type", "site"),
-            profile_id=d.get("profile_id", ""),
-            time_limit_minutes=d.get("time_limit_minutes", 0),
-        )
+        """Lenient decode; invalid fields fall back to their defaults."""
+        return _codec.decoders[TriggerEntry](d, [])
+
+
+class ScheduleIndex:
+    """Minute-of-day lookup tables compiled from the profiles and triggers.
+
+    Answers "which profiles/triggers are active at hh:mm" in O(1) instead of
+    scanning every profile for every trigger.
+    """
+
+    def __init__(self, profiles, triggers):
+        self.profile_by_id = {}
+        for profile in profiles:
+            self.profile_by_id.setdefault(profile.id, profile)
+        self.default_profile = profiles[0] if profiles else None
+
+        # profile_id -> triggers, unknown/empty profile ids fall back to default
+        self.triggers_by_profile = {pid: [] for pid in self.profile_by_id}
+        owned = []
+        for trigger in triggers:
+            profile = self.profile_by_id.get(trigger.profile_id, self.default_profile)
+            if profile is not None:
+                self.triggers_by_profile[profile.id].append(trigger)
+                owned.append((trigger, profile.id))
+
+        # minute-of-day -> frozenset of active profile ids (identical sets shared)
+        sets = {}
+        self.active_by_minute = []
+        for minute in range(1440):
+            hour, mm = divmod(minute, 60)
+            active = frozenset(pid for pid, p in self.profile_by_id.items()
+                               if p.schedule.is_in_window(hour, mm))
+            self.active_by_minute.append(sets.setdefault(active, active))
+
+        # active set -> triggers in config order, computed once per distinct set
+        self._triggers_for_set = {}
+        for active in sets:
+            self._triggers_for_set[active] = tuple(t for t, pid in owned if pid in active)
+
+        # Minutes at which the active set differs from the minute before
+        self.change_minutes = [
+            m for m in range(1440)
+            if self.active_by_minute[m] is not self.active_by_minute[m - 1]]
+
+    def active_profile_ids(self, hour, minute):
+        return self.active_by_minute[hour * 60 + minute]
+
+    def triggers_at(self, hour, minute):
+        return self._triggers_for_set[self.active_by_minute[hour * 60 + minute]]
+
+    def relink_profiles(self, profiles):
+        """Point at new profile objects with the same ids and schedules."""
+        for profile in profiles:
+            if profile.id in self.profile_by_id:
+                self.profile_by_id[profile.id] = profile
+        self.default_profile = profiles[0] if profiles else None
+
+    def next_change(self, minute_of_day):
+        """Minutes until the active set next changes, or None if it never does."""
+        if not self.change_minutes:
+            return None
+        i = bisect.bisect_right(self.change_minutes, minute_of_day)
+        nxt = self.change_minutes[i] if i < len(self.change_minutes) else self.change_minutes[0] + 1440
+        return nxt - minute_of_day
+
+
+class ConfigChange(NamedTuple):
+    """What differs between two saved states of a Config (see Config.subscribe)."""
+    profiles_added: frozenset = frozenset()     # profile ids
+    profiles_removed: frozenset = frozenset()
+    profiles_changed: frozenset = frozenset()   # ids with new labels, snooze or apps
+    schedules_changed: frozenset = frozenset()  # ids whose time window moved
+    default_changed: bool = False               # first profile is a different one
+    triggers_changed: bool = False              # any trigger added/removed/edited
+    patterns_changed: bool = False              # set of (name, type) differs
+    fields: frozenset = frozenset()             # changed top-level settings
+
+    def __bool__(self):
+        return any(self)
+
+    @property
+    def schedule_changed(self):
+        """True if the minute-of-day tables have to be rebuilt."""
+        return bool(self.profiles_added or self.profiles_removed or self.schedules_changed
+                    or self.default_changed or self.triggers_changed)
+
+    @property
+    def break_changed(self):
+        return bool(self.fields & BREAK_TIMER_FIELDS)
+
+    @property
+    def popup_changed(self):
+        return bool(self.fields & ALARM_POPUP_FIELDS or self.profiles_changed)
+
+
+class ConfigError(ValueError):
+    """A config file that must not be applied; `errors` lists every problem found."""
+
+    def __init__(self, errors):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def _first_profile_id(data):
+    profiles = data["schedule_profiles"]
+    return profiles[0]["id"] if profiles else None
+
+
+def diff_config(old, new):
+    """Compare two Config.to_dict() snapshots."""
+    old_profiles = {p["id"]: p for p in old["schedule_profiles"]}
+    new_profiles = {p["id"]: p for p in new["schedule_profiles"]}
+    common = old_profiles.keys() & new_profiles.keys()
+    schedules_changed = frozenset(
+        pid for pid in common
+        if old_profiles[pid]["schedule"] != new_profiles[pid]["schedule"])
+    profiles_changed = frozenset(
+        pid for pid in common
+        if {k: v for k, v in old_profiles[pid].items() if k != "schedule"}
+        != {k: v for k, v in new_profiles[pid].items() if k != "schedule"})
+    triggers_changed = old["triggers"] != new["triggers"]
+    patterns_changed = triggers_changed and (
+        {(t["name"].lower(), t["type"]) for t in old["triggers"]}
+        != {(t["name"].lower(), t["type"]) for t in new["triggers"]})
+    return ConfigChange(
+        profiles_added=frozenset(new_profiles.keys() - old_profiles.keys()),
+        profiles_removed=frozenset(old_profiles.keys() - new_profiles.keys()),
+        profiles_changed=profiles_changed,
+        schedules_changed=schedules_changed,
+        default_changed=_first_profile_id(old) != _first_profile_id(new),
+        triggers_changed=triggers_changed,
+        patterns_changed=patterns_changed,
+        fields=frozenset(k for k, v in new.items()
+                         if k not in ("schedule_profiles", "triggers") and old.get(k) != v),
+    )
 
 
 @dataclass
@@ -149,9 +285,15 @@ class Config:
     break_popup_text: str = "Steh auf, streck dich, trink Wasser."
     break_fullscreen: bool = False
     break_icon: str = "☕"
+    trigger_index: TriggerIndex = field(default=None, init=False, repr=False, compare=False)
+    schedule_index: ScheduleIndex = field(default=None, init=False, repr=False, compare=False)
+    _saved: dict = field(default=None, init=False, repr=False, compare=False)
+    _subscribers: list = field(default_factory=list, init=False, repr=False, compare=False)
+    # Why load() fell back to defaults without touching config.json (empty if it didn't)
+    load_errors: list = field(default_factory=list, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.schedule_profiles is None:
+        if not self.schedule_profiles:
             self.schedule_profiles = [
                 ScheduleProfile(id="default", name="Abends")
             ]
@@ -167,6 +309,60 @@ class Config:
             ]
         if self.custom_sounds is None:
             self.custom_sounds = []
+        self.rebuild_indexes()
+        self._saved = self.to_dict()
+
+    def rebuild_indexes(self):
+        """Recompile lookup structures derived from the profiles and triggers."""
+        self.trigger_index = TriggerIndex(self.triggers)
+        self.schedule_index = ScheduleIndex(self.schedule_profiles, self.triggers)
+
+    def subscribe(self, callback):
+        """Call callback(ConfigChange) after every save that changed something."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def adopt(self, other, text=None):
+        """Take over every setting of `other` (e.g. a re-read config.json) and notify.
+
+        The indexes built for `other` are reused, so parsing and compiling can
+        happen off the UI thread. `text` is the file content `other` was parsed
+        from; it is recorded as what is on disk, and any save still queued
+        from before is dropped.
+        """
+        change = diff_config(self._saved, other._saved)
+        for f in fields(self):
+            if f.init:
+                setattr(self, f.name, getattr(other, f.name))
+        self.trigger_index = other.trigger_index
+        self.schedule_index = other.schedule_index
+        self._saved = other._saved
+        self.load_errors = []
+        if text is not None:
+            _writer.cancel()
+            _writer.seed(text)
+        self._notify(change)
+        return change
+
+    def _diff_and_reindex(self):
+        snapshot = self.to_dict()
+        change = diff_config(self._saved, snapshot)
+        self._saved = snapshot
+        if change.patterns_changed:
+            self.trigger_index = TriggerIndex(self.triggers)
+        if change.schedule_changed:
+            self.schedule_index = ScheduleIndex(self.schedule_profiles, self.triggers)
+        else:
+            self.schedule_index.relink_profiles(self.schedule_profiles)
+        return change, snapshot
+
+    def _notify(self, change):
+        if change:
+            for callback in list(self._subscribers):
+                callback(change)
 
     @property
     def default_profile(self):
@@ -174,9 +370,9 @@ class Config:
 
     def get_profile_for_trigger(self, trigger):
         if trigger.profile_id:
-            for profile in self.schedule_profiles:
-                if profile.id == trigger.profile_id:
-                    return profile
+            profile = self.schedule_index.profile_by_id.get(trigger.profile_id)
+            if profile is not None:
+                return profile
         return self.default_profile
 
     def get_triggers_for_profile(self, profile_id):
@@ -187,46 +383,29 @@ class Config:
         return profile.snooze_minutes or self.snooze_minutes
 
     def get_triggers_in_window(self, hour, minute):
-        result = []
-        for trigger in self.triggers:
-            profile = self.get_profile_for_trigger(trigger)
-            if profile.schedule.is_in_window(hour, minute):
-                result.append(trigger)
-        return result
+        """Return a tuple of triggers whose profile window contains hh:mm."""
+        return self.schedule_index.triggers_at(hour, minute)
 
     def any_profile_active(self, hour, minute):
-        for profile in self.schedule_profiles:
-            if profile.schedule.is_in_window(hour, minute):
-                return True
-        return False
+        return bool(self.schedule_index.active_profile_ids(hour, minute))
+
+    def next_schedule_change(self, now):
+        """Return the datetime of the next minute at which the set of active profiles changes."""
+        delta = self.schedule_index.next_change(now.hour * 60 + now.minute)
+        if delta is None:
+            return None
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=delta)
 
     def to_dict(self):
-        return {
-            "schedule_profiles": [p.to_dict() for p in self.schedule_profiles],
-            "triggers": [t.to_dict() for t in self.triggers],
-            "snooze_minutes": self.snooze_minutes,
-            "sound_file": self.sound_file,
-            "autostart": self.autostart,
-            "popup_title": self.popup_title,
-            "popup_text": self.popup_text,
-            "snooze_label": self.snooze_label,
-            "confirm_label": self.confirm_label,
-            "fullscreen_popup": self.fullscreen_popup,
-            "custom_sounds": self.custom_sounds,
-            "break_enabled": self.break_enabled,
-            "break_interval_minutes": self.break_interval_minutes,
-            "break_duration_minutes": self.break_duration_minutes,
-            "break_snooze_minutes": self.break_snooze_minutes,
-            "break_popup_title": self.break_popup_title,
-            "break_popup_text": self.break_popup_text,
-            "break_fullscreen": self.break_fullscreen,
-            "break_icon": self.break_icon,
-        }
+        d = _codec.encoders[Config](self)
+        d["version"] = CURRENT_VERSION
+        return d
 
     def save(self):
-        os.makedirs(CONFIG_DIR, exist_ok=True)
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        """Queue a write-behind save (see flush_saves), then notify subscribers."""
+        change, snapshot = self._diff_and_reindex()
+        _writer.submit(snapshot)
+        self._notify(change)
 
     @classmethod
     def load(cls):
@@ -234,82 +413,133 @@ class Config:
             return cls()
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return cls()
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            # Keep the user's file for recovery instead of overwriting it with defaults
+            _quarantine(CONFIG_FILE)
             return cls()
-        if "schedule_profiles" in data:
-            return cls._from_dict(data)
-        return cls._migrate_old(data)
+        config, errors, from_version = cls.decode(data)
+        if errors and not can_migrate(from_version):
+            # E.g. written by a newer version: run on defaults, but never save them over it
+            _writer.hold()
+            config.load_errors = errors
+            return config
+        if errors:
+            # Start with defaults for the broken fields, but keep the original around
+            _backup(CONFIG_FILE, "invalid")
+        else:
+            _writer.seed(text)
+        if from_version != CURRENT_VERSION or errors:
+            config.save()
+        return config
 
     @classmethod
-    def _from_dict(cls, data):
-        profiles = [
-            ScheduleProfile.from_dict(p)
-            for p in data.get("schedule_profiles", [])
-        ]
-        triggers = [
-            TriggerEntry.from_dict(t)
-            for t in data.get("triggers", [])
-        ]
-        # Migration: assign unlinked triggers to default profile
-        if profiles:
-            default_id = profiles[0].id
-            for t in triggers:
-                if not t.profile_id:
-                    t.profile_id = default_id
-        return cls(
-            schedule_profiles=profiles or None,
-            triggers=triggers or None,
-            snooze_minutes=data.get("snooze_minutes", 15),
-            sound_file=data.get("sound_file", ""),
-            autostart=data.get("autostart", False),
-            popup_title=data.get("popup_title", "Alarm"),
-            popup_text=data.get("popup_text", "Dein System hat heute geliefert.\nJetzt darf es sich erholen."),
-            snooze_label=data.get("snooze_label", "Schlummern"),
-            confirm_label=data.get("confirm_label", "Abendroutine starten"),
-            fullscreen_popup=data.get("fullscreen_popup", True),
-            custom_sounds=data.get("custom_sounds", []),
-            break_enabled=data.get("break_enabled", False),
-            break_interval_minutes=data.get("break_interval_minutes", 60),
-            break_duration_minutes=data.get("break_duration_minutes", 5),
-            break_snooze_minutes=data.get("break_snooze_minutes", 5),
-            break_popup_title=data.get("break_popup_title", "Pause"),
-            break_popup_text=data.get("break_popup_text", "Steh auf, streck dich, trink Wasser."),
-            break_fullscreen=data.get("break_fullscreen", False),
-            break_icon=data.get("break_icon", "☕"),
-        )
+    def parse(cls, text):
+        """Strictly parse config.json content. Raises ConfigError listing every problem."""
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ConfigError([f"Invalid JSON: {e}"]) from None
+        config, errors, _from_version = cls.decode(data)
+        if errors:
+            raise ConfigError(errors)
+        return config
 
     @classmethod
-    def _migrate_old(cls, data):
-        schedule = TriggerSchedule(
-            start_hour=data.get("start_hour", 20),
-            start_minute=data.get("start_minute", 0),
-            end_hour=data.get("end_hour", 4),
-            end_minute=data.get("end_minute", 0),
-        )
-        profile = ScheduleProfile(
-            id="default",
-            name="Abends",
-            schedule=schedule,
-            launch_apps=data.get("launch_apps", []),
-        )
-        triggers = []
-        for site in data.get("trigger_sites", []):
-            triggers.append(TriggerEntry(name=site, type="site", profile_id="default"))
-        for app in data.get("trigger_apps", []):
-            triggers.append(TriggerEntry(name=app, type="app", profile_id="default"))
-        config = cls(
-            schedule_profiles=[profile],
-            triggers=triggers or None,
-            snooze_minutes=data.get("snooze_minutes", 15),
-            sound_file=data.get("sound_file", ""),
-            autostart=data.get("autostart", False),
-            popup_title=data.get("popup_title", "Alarm"),
-            popup_text=data.get("popup_text", "Dein System hat heute geliefert.\nJetzt darf es sich erholen."),
-            snooze_label=data.get("snooze_label", "Schlummern"),
-            confirm_label=data.get("confirm_label", "Abendroutine starten"),
-            fullscreen_popup=data.get("fullscreen_popup", True),
-            custom_sounds=data.get("custom_sounds", []),
-        )
-        config.save()
-        return config
+    def decode(cls, data):
+        """Migrate and decode a config dict. Returns (config, errors, from_version).
+
+        Never raises; fields with errors keep their defaults.
+        """
+        if not isinstance(data, dict):
+            return cls(), ["config: expected an object"], None
+        data, errors, from_version = migrate(data)
+        if errors:
+            return cls(), errors, from_version
+        config = _codec.decoders[Config](data, errors)
+        return config, errors, from_version
+
+
+def disk_digest():
+    """Hash of the config.json content this process last loaded or wrote."""
+    return _writer.digest
+
+
+def flush_saves():
+    """Write any queued Config.save() now; call before exiting."""
+    return _writer.flush()
+
+
+def _quarantine(path):
+    """Move an unreadable config aside as config.json.corrupt-<timestamp>."""
+    try:
+        os.replace(path, f"{path}.corrupt-{time.strftime('%Y%m%d-%H%M%S')}")
+    except OSError:
+        pass
+
+
+def _backup(path, reason):
+    """Copy the config to config.json.<reason>-<timestamp> before it is rewritten."""
+    try:
+        shutil.copyfile(path, f"{path}.{reason}-{time.strftime('%Y%m%d-%H%M%S')}")
+    except OSError:
+        pass
+
+
+# -- Schema: the one place that lists fields, their types and limits --
+
+_SCHEDULE = Record(TriggerSchedule, (
+    Field("start_hour", int, min=0, max=23),
+    Field("start_minute", int, min=0, max=59),
+    Field("end_hour", int, min=0, max=23),
+    Field("end_minute", int, min=0, max=59),
+))
+
+_PROFILE = Record(ScheduleProfile, (
+    Field("id", str),
+    Field("name", str),
+    Field("schedule", _SCHEDULE),
+    Field("snooze_minutes", int, min=0, omit_empty=True),
+    Field("alarm_title", str, omit_empty=True),
+    Field("alarm_message", str, omit_empty=True),
+    Field("snooze_label", str, omit_empty=True),
+    Field("confirm_label", str, omit_empty=True),
+    Field("launch_apps", "str_list", omit_empty=True),
+))
+
+_TRIGGER = Record(TriggerEntry, (
+    Field("name", str, required=True),
+    Field("type", str, choices=("site", "app")),
+    Field("profile_id", str, omit_empty=True),
+    Field("time_limit_minutes", int, min=0, omit_empty=True),
+))
+
+_CONFIG = Record(Config, (
+    Field("schedule_profiles", ("list", _PROFILE)),
+    Field("triggers", ("list", _TRIGGER)),
+    Field("snooze_minutes", int, min=0),
+    Field("sound_file", str),
+    Field("autostart", bool),
+    Field("popup_title", str),
+    Field("popup_text", str),
+    Field("snooze_label", str),
+    Field("confirm_label", str),
+    Field("fullscreen_popup", bool),
+    Field("custom_sounds", "str_list"),
+    Field("break_enabled", bool),
+    Field("break_interval_minutes", int, min=1),
+    Field("break_duration_minutes", int, min=1),
+    Field("break_snooze_minutes", int, min=1),
+    Field("break_popup_title", str),
+    Field("break_popup_text", str),
+    Field("break_fullscreen", bool),
+    Field("break_icon", str),
+))
+
+_codec = make_codec(_CONFIG)
@@ -0,0 +1,251 @@
+"""Declarative config schema: versioned migrations plus generated codecs.
+
+Config records are described once with Field specs. make_codec() turns those
+into plain Python functions (one decoder and one encoder per record, built
+with exec like dataclasses does), so loading thousands of triggers is a
+straight run of dict lookups and type checks with no per-field dispatch.
+Decoders never raise: every problem is collected, and the field falls back
+to its dataclass default.
+"""
+import dataclasses
+from typing import NamedTuple
+
+CURRENT_VERSION = 3
+
+
+class Field(NamedTuple):
+    name: str
+    kind: object                # int, bool, str, "str_list", a Record, or ("list", Record)
+    min: int = None             # inclusive bounds for int
+    max: int = None
+    choices: tuple = ()         # allowed values for str
+    required: bool = False      # str must be present and non-empty, else the record is dropped
+    omit_empty: bool = False    # encoder leaves the key out when the value is falsy
+
+
+class Record(NamedTuple):
+    cls: type
+    fields: tuple
+
+
+# -- Migrations: each takes the dict of version N and returns version N+1 --
+
+def _v1_to_v2(data):
+    """Flat single-window format -> schedule profiles."""
+    data = dict(data)
+    schedule = {k: data.pop(k) for k in ("start_hour", "start_minute", "end_hour", "end_minute")
+                if k in data}
+    profile = {"id": "default", "name": "Abends", "schedule": schedule}
+    launch_apps = data.pop("launch_apps", None)
+    if launch_apps:
+        profile["launch_apps"] = launch_apps
+    triggers = [{"name": s, "type": "site", "profile_id": "default"}
+                for s in data.pop("trigger_sites", None) or ()]
+    triggers += [{"name": a, "type": "app", "profile_id": "default"}
+                 for a in data.pop("trigger_apps", None) or ()]
+    data["schedule_profiles"] = [profile]
+    if triggers:
+        data["triggers"] = triggers
+    return data
+
+
+def _v2_to_v3(data):
+    """Triggers without a profile belong to the first profile."""
+    profiles = data.get("schedule_profiles")
+    triggers = data.get("triggers")
+    if (isinstance(profiles, list) and profiles and isinstance(profiles[0], dict)
+            and profiles[0].get("id") and isinstance(triggers, list)):
+        default_id = profiles[0]["id"]
+        data = dict(data)
+        data["triggers"] = [
+            dict(t, profile_id=default_id) if isinstance(t, dict) and not t.get("profile_id") else t
+            for t in triggers]
+    return data
+
+
+MIGRATIONS = {1: _v1_to_v2, 2: _v2_to_v3}
+
+
+def detect_version(data):
+    version = data.get("version")
+    if version is None:
+        return 2 if "schedule_profiles" in data else 1
+    return version
+
+
+def can_migrate(version):
+    """True if a config with this version can be brought up to CURRENT_VERSION."""
+    return (isinstance(version, int) and not isinstance(version, bool)
+            and 1 <= version <= CURRENT_VERSION)
+
+
+def migrate(data):
+    """Bring a config dict up to CURRENT_VERSION. Returns (data, errors, from_version)."""
+    version = detect_version(data)
+    if not isinstance(version, int) or isinstance(version, bool) or version < 1:
+        return data, [f"version: unsupported value {version!r}"], version
+    if version > CURRENT_VERSION:
+        return data, [f"version: {version} was written by a newer Sticky Alarm "
+                      f"(this one reads up to {CURRENT_VERSION})"], version
+    from_version = version
+    while version < CURRENT_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+    data = dict(data)
+    data.pop("version", None)
+    return data, [], from_version
+
+
+# -- Code generation --
+
+def _at(path, index):
+    return path if index is None else f"{path}[{index}]"
+
+
+def _where(path, index, key):
+    where = _at(path, index)
+    return f"{where}.{key}" if where else key
+
+
+def _default_expr(record, f, env):
+    """Expression for the field's dataclass default (None = let __post_init__ decide)."""
+    dc_field = {x.name: x for x in dataclasses.fields(record.cls)}[f.name]
+    if dc_field.default is dataclasses.MISSING:
+        return "None"
+    name = f"_d_{record.cls.__name__}_{f.name}"
+    env[name] = dc_field.default
+    return name
+
+
+def _decoder_source(record, env):
+    cls_name = record.cls.__name__
+    env[f"_cls_{cls_name}"] = record.cls
+    env[f"_keys_{cls_name}"] = frozenset(f.name for f in record.fields)
+    lines = [
+        f"def decode_{cls_name}(data, errors, path='', index=None):",
+        "    if type(data) is not dict:",
+        "        errors.append((_at(path, index) or 'config') + ': expected an object')",
+        "        return None",
+        f"    if not data.keys() <= _keys_{cls_name}:",
+        f"        for key in sorted(data.keys() - _keys_{cls_name}):",
+        "            errors.append(_where(path, index, key) + ': unknown key')",
+        "    drop = False",
+    ]
+    args = []
+    for f in record.fields:
+        var = f"v_{f.name}"
+        default = _default_expr(record, f, env)
+        err = f"errors.append(_where(path, index, {f.name!r}) + ': "
+        lines.append(f"    {var} = data.get({f.name!r}, _MISSING)")
+        lines.append(f"    if {var} is _MISSING:")
+        if f.required:
+            lines.append(f"        {err}is required'); drop = True")
+        else:
+            lines.append(f"        {var} = {default}")
+        if f.kind is int:
+            lines.append(f"    elif type({var}) is not int:")
+            lines.append(f"        {err}expected an integer'); {var} = {default}")
+            if f.min is not None:
+                lines.append(f"    elif {var} < {f.min}:")
+                lines.append(f"        {err}must be >= {f.min}'); {var} = {default}")
+            if f.max is not None:
+                lines.append(f"    elif {var} > {f.max}:")
+                lines.append(f"        {err}must be <= {f.max}'); {var} = {default}")
+        elif f.kind is bool:
+            lines.append(f"    elif type({var}) is not bool:")
+            lines.append(f"        {err}expected true or false'); {var} = {default}")
+        elif f.kind is str:
+            lines.append(f"    elif type({var}) is not str:")
+            lines.append(f"        {err}expected a string'); {var} = {default}")
+            if f.required:
+                lines.append(f"        drop = True")
+                lines.append(f"    elif not {var}:")
+                lines.append(f"        {err}must not be empty'); drop = True")
+            if f.choices:
+                env[f"_choices_{cls_name}_{f.name}"] = frozenset(f.choices)
+                shown = " or ".join(f'"{c}"' for c in f.choices)
+                lines.append(f"    elif {var} not in _choices_{cls_name}_{f.name}:")
+                lines.append(f"        {err}must be {shown}'); {var} = {default}")
+        elif f.kind == "str_list":
+            lines.append(f"    elif type({var}) is not list or not all(type(x) is str for x in {var}):")
+            lines.append(f"        {err}expected a list of strings'); {var} = {default}")
+            lines.append("    else:")
+            lines.append(f"        {var} = list({var})")
+        elif isinstance(f.kind, Record):
+            sub = f.kind.cls.__name__
+            lines.append("    else:")
+            lines.append(f"        {var} = decode_{sub}({var}, errors, _where(path, index, {f.name!r}))")
+        elif isinstance(f.kind, tuple) and f.kind[0] == "list":
+            sub = f.kind[1].cls.__name__
+            lines.append(f"    elif type({var}) is not list:")
+            lines.append(f"        {err}expected a list'); {var} = {default}")
+            lines.append("    else:")
+            lines.append(f"        item_path = _where(path, index, {f.name!r})")
+            lines.append(f"        {var} = [x for x in (decode_{sub}(item, errors, item_path, i)")
+            lines.append(f"                           for i, item in enumerate({var})) if x is not None]")
+        else:
+            raise TypeError(f"unsupported field kind {f.kind!r}")
+        args.append(f"{f.name}={var}")
+    lines.append("    if drop:")
+    lines.append("        return None  # a required field is unusable; leave the record out")
+    lines.append(f"    return _cls_{cls_name}({', '.join(args)})")
+    return "\n".join(lines)
+
+
+def _encoder_source(record):
+    cls_name = record.cls.__name__
+    lines = [f"def encode_{cls_name}(obj):", "    d = {}"]
+    for f in record.fields:
+        if isinstance(f.kind, Record):
+            value = f"encode_{f.kind.cls.__name__}(obj.{f.name})"
+        elif isinstance(f.kind, tuple):
+            value = f"[encode_{f.kind[1].cls.__name__}(x) for x in obj.{f.name}]"
+        elif f.kind == "str_list":
+            value = f"list(obj.{f.name})"  # copy: snapshots must not share lists
+        else:
+            value = f"obj.{f.name}"
+        if f.omit_empty:
+            lines.append(f"    if obj.{f.name}:")
+            lines.append(f"        d[{f.name!r}] = {value}")
+        else:
+            lines.append(f"    d[{f.name!r}] = {value}")
+    lines.append("    return d")
+    return "\n".join(lines)
+
+
+def _records(root):
+    """Root record and every record nested in it, dependencies first."""
+    seen = []
+
+    def visit(record):
+        for f in record.fields:
+            if isinstance(f.kind, Record):
+                visit(f.kind)
+            elif isinstance(f.kind, tuple):
+                visit(f.kind[1])
+        if record not in seen:
+            seen.append(record)
+    visit(root)
+    return seen
+
+
+class Codec(NamedTuple):
+    decoders: dict   # class -> decode(data, errors, path="", index=None)
+    encoders: dict   # class -> encode(obj) -> dict
+    source: str      # generated code, for debugging
+
+
+def make_codec(root):
+    env = {"_MISSING": object(), "_at": _at, "_where": _where}
+    parts = []
+    for record in _records(root):
+        parts.append(_decoder_source(record, env))
+        parts.append(_encoder_source(record))
+    source = "\n\n".join(parts)
+    exec(compile(source, "<config codec>", "exec"), env)
+    records = _records(root)
+    return Codec(
+        decoders={r.cls: env[f"decode_{r.cls.__name__}"] for r in records},
+        encoders={r.cls: env[f"encode_{r.cls.__name__}"] for r in records},
+        source=source,
+    )
@@ -0,0 +1,134 @@
+"""Crash-safe, write-behind persistence for config.json."""
+import hashlib
+import json
+import os
+import threading
+import time
+
+SAVE_DELAY = 0.5  # seconds; saves within this window are coalesced into one write
+_REPLACE_RETRIES = 5  # os.replace can briefly fail on Windows while a scanner holds the file
+
+
+def digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def atomic_write(path, text):
+    """Write text to a temp file next to path, fsync it, then rename over path.
+
+    A crash at any point leaves either the old or the new file, never a
+    truncated one.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    for attempt in range(_REPLACE_RETRIES):
+        try:
+            os.replace(tmp, path)
+            return
+        except PermissionError:
+            if attempt == _REPLACE_RETRIES - 1:
+                raise
+            time.sleep(0.05)
+
+
+class ConfigWriter:
+    """Coalesces saves and writes them on a background thread.
+
+    submit() only stores the latest data and returns; the writer thread
+    serializes it once the burst has settled and skips the write if the
+    content hash matches what is already on disk. flush() writes anything
+    pending synchronously (used on quit).
+    """
+
+    def __init__(self, path, delay=SAVE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.last_error = None
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending = None  # dict waiting to be written
+        self._due = 0.0
+        self._digest = None  # hash of the content last read or written
+        self._stat = None  # (mtime_ns, size) of the file at that point
+        self._held = False  # file on disk must not be replaced (see hold())
+        self._thread = None
+
+    @property
+    def digest(self):
+        return self._digest
+
+    def cancel(self):
+        """Drop a queued save (the file on disk has been adopted instead)."""
+        with self._cond:
+            self._pending = None
+
+    def seed(self, text):
+        """Record content already on disk (e.g. just loaded) to skip rewriting it."""
+        self._digest = digest(text)
+        self._stat = self._file_stat()
+        self._held = False
+
+    def hold(self):
+        """Leave the file alone: drop saves until seed() records readable content."""
+        with self._cond:
+            self._held = True
+            self._pending = None
+
+    def _file_stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def submit(self, data):
+        with self._cond:
+            if self._held:
+                return
+            self._pending = data
+            self._due = time.monotonic() + self.delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self):
+        """Write pending data now. Returns True if the file is up to date."""
+        with self._io_lock:
+            with self._cond:
+                data, self._pending = self._pending, None
+            if data is None:
+                return self.last_error is None
+            return self._write(data)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                remaining = self._due - time.monotonic()
+                while remaining > 0:
+                    self._cond.wait(remaining)
+                    remaining = self._due - time.monotonic()
+            self.flush()
+
+    def _write(self, data):
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+        new_digest = digest(text)
+        if new_digest == self._digest and self._stat is not None and self._stat == self._file_stat():
+            return True  # unchanged, and nobody touched the file since
+        # Record the digest first so a file watcher recognizes our own write
+        old_digest, self._digest = self._digest, new_digest
+        try:
+            atomic_write(self.path, text)
+        except OSError as e:
+            self._digest = old_digest
+            self.last_error = e
+            return False
+        self._stat = self._file_stat()
+        self.last_error = None
+        return True
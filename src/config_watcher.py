@@ -0,0 +1,163 @@
+"""Watches config.json for external edits (e.g. a deployed trigger list)."""
+import ctypes
+import os
+import sys
+import threading
+
+from config import Config, ConfigError
+from config_store import digest
+
+POLL_INTERVAL = 2.0  # seconds between stat() calls when polling
+
+if sys.platform == "win32":
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+    _kernel32.FindFirstChangeNotificationW.argtypes = [ctypes.c_wchar_p, ctypes.c_bool, ctypes.c_uint32]
+    _kernel32.FindNextChangeNotification.argtypes = [ctypes.c_void_p]
+    _kernel32.FindCloseChangeNotification.argtypes = [ctypes.c_void_p]
+    _kernel32.CreateEventW.restype = ctypes.c_void_p
+    _kernel32.CreateEventW.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.c_bool, ctypes.c_wchar_p]
+    _kernel32.SetEvent.argtypes = [ctypes.c_void_p]
+    _kernel32.ResetEvent.argtypes = [ctypes.c_void_p]
+    _kernel32.WaitForMultipleObjects.argtypes = [
+        ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p), ctypes.c_bool, ctypes.c_uint32]
+else:
+    _kernel32 = None
+
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x0001
+FILE_NOTIFY_CHANGE_SIZE = 0x0008
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x0010
+INFINITE = 0xFFFFFFFF
+
+
+class _PollWaiter:
+    """Wakes every POLL_INTERVAL; works everywhere."""
+
+    def __init__(self, stop_event, interval):
+        self._stop = stop_event
+        self.interval = interval
+
+    def wait(self):
+        self._stop.wait(self.interval)
+
+    def close(self):
+        pass
+
+
+class _DirChangeWaiter:
+    """Wakes when anything in the directory is written or renamed, or on stop (Windows).
+
+    stop_handle is a Win32 event that ConfigWatcher.stop() signals, so the
+    wait needs no timeout.
+    """
+
+    def __init__(self, directory, stop_handle):
+        self._handle = _kernel32.FindFirstChangeNotificationW(
+            directory, False,
+            FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_SIZE | FILE_NOTIFY_CHANGE_LAST_WRITE)
+        if self._handle in (None, INVALID_HANDLE_VALUE):
+            raise OSError("FindFirstChangeNotification failed")
+        self._handles = (ctypes.c_void_p * 2)(self._handle, stop_handle)
+
+    def wait(self):
+        # The stat() check decides what changed
+        if _kernel32.WaitForMultipleObjects(2, self._handles, False, INFINITE) == 0:
+            _kernel32.FindNextChangeNotification(self._handle)
+
+    def close(self):
+        _kernel32.FindCloseChangeNotification(self._handle)
+
+
+class ConfigWatcher:
+    """Background thread that notices when config.json changes on disk.
+
+    A change is detected by mtime/size and confirmed by content hash. Content
+    this process wrote itself (is_own(digest) is true) is ignored. New content
+    is parsed and validated on the watcher thread; the result goes to
+    on_change(config, text) or on_invalid(errors) — both called from the
+    watcher thread.
+    """
+
+    def __init__(self, path, on_change, on_invalid=None, is_own=None,
+                 interval=POLL_INTERVAL, polling=None):
+        self.path = path
+        self.on_change = on_change
+        self.on_invalid = on_invalid
+        self.is_own = is_own or (lambda _digest: False)
+        self.interval = interval
+        self.polling = sys.platform != "win32" if polling is None else polling
+        self._stop = threading.Event()
+        # Signalled together with _stop so a directory wait ends without a timeout
+        self._stop_handle = (_kernel32.CreateEventW(None, True, False, None)
+                             if _kernel32 and not self.polling else None)
+        self._thread = None
+        self._stat = self._file_stat()
+        self._digest = None  # last content seen, applied or rejected
+
+    def start(self):
+        if self._thread:
+            return
+        self._stop.clear()
+        if self._stop_handle:
+            _kernel32.ResetEvent(self._stop_handle)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._stop_handle:
+            _kernel32.SetEvent(self._stop_handle)
+        self._thread = None
+
+    def _file_stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _make_waiter(self):
+        if not self.polling and self._stop_handle:
+            try:
+                return _DirChangeWaiter(os.path.dirname(self.path), self._stop_handle)
+            except OSError:
+                pass  # directory missing (first run) — poll until it exists
+        return _PollWaiter(self._stop, self.interval)
+
+    def _run(self):
+        waiter = self._make_waiter()
+        try:
+            while not self._stop.is_set():
+                waiter.wait()
+                if not self._stop.is_set():
+                    self.check()
+                if isinstance(waiter, _PollWaiter) and not self.polling:
+                    waiter = self._make_waiter()
+        finally:
+            waiter.close()
+
+    def check(self):
+        """Look at the file once; returns True if a change was reported."""
+        stat = self._file_stat()
+        if stat is None or stat == self._stat:
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return False  # mid-replace or locked; retry on the next wake
+        self._stat = stat
+        content = digest(text)
+        if content == self._digest or self.is_own(content):
+            self._digest = content
+            return False
+        self._digest = content
+        try:
+            config = Config.parse(text)
+        except ConfigError as e:
+            if self.on_invalid:
+                self.on_invalid(e.errors)
+            return True
+        self.on_change(config, text)
+        return True
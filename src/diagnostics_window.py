@@ -0,0 +1,137 @@
+"""Diagnose window — per-phase tick timings from the TickProfiler."""
+
+import tkinter as tk
+from tkinter import filedialog
+
+import theme as T
+from profiler import PHASES
+from widgets import RoundedButton, enable_dark_titlebar
+
+_REFRESH_MS = 1000
+_COLUMNS = ("Phase", "n", "p50", "p95", "p99", "max")
+
+
+class DiagnosticsWindow:
+    def __init__(self, root, profiler):
+        self.root = root
+        self.profiler = profiler
+        self.window = None
+        self._table = None
+        self._empty = None
+        self._rows = []  # one list of labels per table row, reused on refresh
+        self._refresh_id = None
+
+    def show(self):
+        if self.window and self.window.winfo_exists():
+            self.window.lift()
+            self.window.focus_force()
+            return
+
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Diagnose")
+        self.window.configure(bg=T.BG)
+        self.window.attributes("-topmost", True)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+        self.window.update_idletasks()
+        enable_dark_titlebar(self.window)
+
+        body = tk.Frame(self.window, bg=T.BG)
+        body.pack(fill="both", expand=True, padx=T.SPACE_LG, pady=(T.SPACE_LG, 0))
+        tk.Label(body, text="Tick-Laufzeiten (ms)", font=T.FONT_SECTION,
+                 bg=T.BG, fg=T.TEXT, anchor="w").pack(fill="x", pady=(0, 4))
+        tk.Label(body, text=f"Letzte {self.profiler.size} Messungen je Phase",
+                 font=T.FONT_MUTED, bg=T.BG, fg=T.TEXT_MUTED, anchor="w").pack(fill="x", pady=(0, 12))
+        self._table = tk.Frame(body, bg=T.BG_CARD, padx=T.SPACE_MD, pady=12)
+        self._table.pack(fill="x")
+        for col, text in enumerate(_COLUMNS):
+            tk.Label(self._table, text=text, font=T.FONT_LABEL, bg=T.BG_CARD,
+                     fg=T.LABEL, anchor="w" if col == 0 else "e",
+                     padx=8).grid(row=0, column=col, sticky="ew")
+        self._empty = tk.Label(self._table, text="Noch keine Messungen", font=T.FONT_BODY,
+                               bg=T.BG_CARD, fg=T.TEXT_MUTED, anchor="w", padx=8)
+        self._rows = []
+
+        btn_row = tk.Frame(self.window, bg=T.BG)
+        btn_row.pack(fill="x", padx=T.SPACE_LG, pady=T.SPACE_LG)
+        RoundedButton(
+            btn_row, text="Zurücksetzen",
+            bg=T.BG_INPUT, fg=T.TEXT_SECONDARY,
+            hover_bg=T.BG_HOVER, hover_fg=T.TEXT,
+            command=self._reset, font=T.FONT_BUTTON,
+            width=150, height=40, radius=T.RADIUS_MD,
+        ).pack(side="left")
+        RoundedButton(
+            btn_row, text="Als JSON exportieren",
+            bg=T.ACCENT, fg=T.BG, hover_bg=T.ACCENT_HOVER,
+            command=self._export, font=T.FONT_BUTTON,
+            width=200, height=40, radius=T.RADIUS_MD,
+        ).pack(side="right")
+
+        self._refresh()
+
+    def _refresh(self):
+        # Rows are built once and only get new text, so the window adds no widget churn
+        self._refresh_id = None
+        if not (self.window and self.window.winfo_exists()):
+            return
+        stats = self.profiler.stats()
+        if stats:
+            self._empty.grid_remove()
+        else:
+            self._empty.grid(row=1, column=0, columnspan=len(_COLUMNS), sticky="w")
+        for row, s in enumerate(stats, start=1):
+            values = (PHASES.get(s.phase, s.phase), str(s.count),
+                      f"{s.p50_ms:.2f}", f"{s.p95_ms:.2f}", f"{s.p99_ms:.2f}", f"{s.max_ms:.2f}")
+            if row > len(self._rows):
+                self._rows.append(self._make_row(row))
+            labels = self._rows[row - 1]
+            for label, text in zip(labels, values):
+                label.configure(text=text)
+                label.grid()
+        for labels in self._rows[len(stats):]:
+            for label in labels:
+                label.grid_remove()
+        self._refresh_id = self.window.after(_REFRESH_MS, self._refresh)
+
+    def _make_row(self, row):
+        labels = []
+        for col in range(len(_COLUMNS)):
+            label = tk.Label(self._table, font=T.FONT_BODY, bg=T.BG_CARD,
+                             fg=T.TEXT if col else T.TEXT_SECONDARY,
+                             anchor="w" if col == 0 else "e", padx=8)
+            label.grid(row=row, column=col, sticky="ew")
+            labels.append(label)
+        return labels
+
+    def _reset(self):
+        self.profiler.clear()
+        self._refresh_now()
+
+    def _refresh_now(self):
+        if self._refresh_id:
+            self.window.after_cancel(self._refresh_id)
+        self._refresh()
+
+    def _export(self):
+        self.window.attributes("-topmost", False)
+        path = filedialog.asksaveasfilename(
+            parent=self.window,
+            title="Diagnose exportieren",
+            defaultextension=".json",
+            initialfile="stickyalarm-diagnose.json",
+            filetypes=[("JSON", "*.json"), ("Alle Dateien", "*.*")])
+        if self.window.winfo_exists():
+            self.window.attributes("-topmost", True)
+        if path:
+            try:
+                self.profiler.export(path)
+            except OSError:
+                pass
+
+    def _close(self):
+        if self._refresh_id:
+            self.window.after_cancel(self._refresh_id)
+            self._refresh_id = None
+        self.window.destroy()
+        self.window = None
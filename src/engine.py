@@ -0,0 +1,168 @@
+"""Alarm & break decision logic, free of Tk and the OS.
+
+StickyAlarmApp drives an AlarmEngine from its Tk timer and carries out the
+returned actions on real popups; the simulator drives the same engine on a
+FakeClock against a virtual desktop.
+"""
+from enum import Enum, auto
+from typing import NamedTuple
+
+from clock import SYSTEM_CLOCK
+from scheduler import Scheduler, State
+from break_scheduler import BreakScheduler, BreakState
+from foreground_tracker import ForegroundTracker
+from profiler import NULL_PROFILER
+
+
+class Action(Enum):
+    SHOW_ALARM = auto()
+    DISMISS_ALARM = auto()
+    SHOW_BREAK = auto()
+    DISMISS_BREAK = auto()
+
+
+class Decision(NamedTuple):
+    action: Action
+    profile: object = None   # ScheduleProfile for SHOW_ALARM, if triggered by one
+    triggers: tuple = ()     # matched triggers behind a SHOW_ALARM
+
+
+class AlarmEngine:
+    """Owns the schedulers and tracker and decides what the UI should do."""
+
+    def __init__(self, config, clock=None, tracker=None, profiler=None):
+        self.config = config
+        self.clock = clock or SYSTEM_CLOCK
+        self.scheduler = Scheduler(config, self.clock)
+        self.break_scheduler = BreakScheduler(config, self.clock)
+        self.tracker = tracker or ForegroundTracker(clock=self.clock)
+        self.profiler = profiler or NULL_PROFILER
+        self.active_profile = None
+        self.matched_triggers = []
+        config.subscribe(self.on_config_change)
+
+    @property
+    def state(self):
+        return self.scheduler.state
+
+    def tick(self, alarm_showing, break_showing):
+        """Advance both schedulers; return the list of Decisions for the UI."""
+        decisions = []
+        with self.profiler.phase("scheduler"):
+            state = self.scheduler.tick()
+
+        if state == State.ACTIVE and not alarm_showing:
+            decisions.append(Decision(Action.SHOW_ALARM, self.active_profile,
+                                      tuple(self.matched_triggers)))
+            alarm_showing = True
+        elif state == State.WAITING and alarm_showing:
+            decisions.append(Decision(Action.DISMISS_ALARM))
+            alarm_showing = False
+
+        # Break timer (independent)
+        with self.profiler.phase("break"):
+            break_state = self.break_scheduler.tick()
+        if break_state == BreakState.BREAK_DUE and not break_showing:
+            if not alarm_showing:
+                self.break_scheduler.start_break()
+                decisions.append(Decision(Action.SHOW_BREAK))
+        elif alarm_showing and break_showing:
+            # Alarm takes priority — dismiss break
+            decisions.append(Decision(Action.DISMISS_BREAK))
+            self.break_scheduler.skip_break()
+        return decisions
+
+    def next_wakeup(self, now):
+        """Earliest wall-clock instant at which tick() may decide something new."""
+        wakeups = [w for w in (self.scheduler.next_wakeup(now),
+                               self.break_scheduler.next_wakeup(now)) if w]
+        return min(wakeups) if wakeups else None
+
+    def apply_matches(self, triggers, matches):
+        """Feed one detection result; returns True if it re-armed the alarm."""
+        if self.scheduler.state != State.CONFIRMED or not triggers:
+            return False
+        with self.profiler.phase("tracker"):
+            self.tracker.update_active_matches(matches or [])
+        if not matches:
+            return False
+        matched_triggers = [t for t in triggers if t.name in matches]
+
+        # Check immediate triggers first
+        immediate = [t for t in matched_triggers if not t.is_time_based]
+        if immediate:
+            self.active_profile = self.config.get_profile_for_trigger(immediate[0])
+            self.matched_triggers = immediate
+            self.scheduler.trigger_detected()
+            return True
+        # Check time-based triggers
+        now = self.clock.now()
+        for trigger in matched_triggers:
+            if not trigger.is_time_based:
+                continue
+            profile = self.config.get_profile_for_trigger(trigger)
+            since = profile.schedule.window_start(now).timestamp()
+            if self.tracker.has_exceeded_limit(trigger, since):
+                self.active_profile = profile
+                self.matched_triggers = [trigger]
+                self.scheduler.trigger_detected()
+                return True
+        return False
+
+    # -- User actions --
+
+    def snooze(self):
+        profile = self.active_profile or self.config.default_profile
+        self.scheduler.snooze(self.config.get_snooze_for_profile(profile))
+
+    def confirm(self):
+        """Confirm the routine. Returns (triggers_to_close, triggers_to_scan).
+
+        triggers_to_close are the ones that fired the alarm; if there are none
+        (first alarm of the evening), triggers_to_scan lists the triggers in
+        window that should be matched now and closed if active.
+        """
+        triggers_to_close = list(self.matched_triggers)
+        self.scheduler.confirm_routine()
+        to_scan = ()
+        if not triggers_to_close:
+            now = self.clock.now()
+            to_scan = self.config.get_triggers_in_window(now.hour, now.minute)
+        return triggers_to_close, to_scan
+
+    def apps_closed(self, closed):
+        for t in closed:
+            self.tracker.reset_trigger(t.name)
+
+    @property
+    def routine_profile(self):
+        return self.active_profile or self.config.default_profile
+
+    def force_trigger(self):
+        self.active_profile = None
+        self.matched_triggers = []
+        self.scheduler.force_trigger()
+
+    def break_snoozed(self):
+        self.break_scheduler.snooze()
+
+    def break_completed(self):
+        self.break_scheduler.skip_break()
+
+    def on_config_change(self, change):
+        """Config subscriber: refresh only the state that depends on what changed."""
+        if change.break_changed:
+            self.break_scheduler.reload_config()
+
+        # Profile objects are replaced on save; re-lookup by id (None if removed)
+        if self.active_profile:
+            self.active_profile = self.config.schedule_index.profile_by_id.get(
+                self.active_profile.id)
+
+        # Update snooze duration if the one that applies changed
+        profile = self.active_profile or self.config.default_profile
+        if self.scheduler.state == State.SNOOZED and (
+                "snooze_minutes" in change.fields
+                or profile.id in change.profiles_changed
+                or change.profiles_removed or change.default_changed):
+            self.scheduler.update_snooze_duration(self.config.get_snooze_for_profile(profile))
@@ -1,21 +1,46 @@
-"""Foreground time tracker for time-based triggers."""
-import time
+"""Foreground time tracker for time-based triggers.
+
+Usage is kept in per-trigger, per-minute buckets and appended to a small
+ledger file in batches, so accumulated time survives restarts and can be
+queried for any window (e.g. "since tonight's schedule started").
+"""
+import json
+import os
+from datetime import datetime
+
+from clock import SYSTEM_CLOCK
+
+LEDGER_KEEP_DAYS = 7
+FLUSH_INTERVAL = 60      # seconds between ledger appends
+COMPACT_LINES = 5000     # rewrite the ledger once it grows past this
 
 
 class ForegroundTracker:
-    def __init__(self):
-        self._active = {}  # trigger_name -> accumulated_seconds
-        self._last_update = {}  # trigger_name -> last_seen_timestamp
+    def __init__(self, ledger_path=None, clock=None):
+        self._ledger_path = ledger_path
+        self.clock = clock or SYSTEM_CLOCK
+        self._buckets = {}  # trigger_name -> {epoch_minute: seconds}, oldest first
+        self._reset_at = {}  # trigger_name -> epoch seconds of last reset
+        self._reset_base = {}  # trigger_name -> seconds already in the reset minute
+        self._last_update = {}  # trigger_name -> last seen (monotonic)
+        self._pending = {}  # (trigger_name, epoch_minute) -> unflushed seconds
+        self._pending_resets = []
+        self._ledger_lines = 0  # lines in the ledger file, as far as we know
+        self._compact_at = COMPACT_LINES
+        self._last_flush = self.clock.monotonic()
+        if ledger_path:
+            self._load()
 
-    def update_active_matches(self, matched_names: list):
-        now = time.time()
+    def update_active_matches(self, matched_names):
+        now = self.clock.monotonic()
+        wall = self.clock.time()
         current = set(matched_names)
 
         for name in current:
             if name in self._last_update:
                 delta = now - self._last_update[name]
                 if delta < 15:  # Only count if seen recently (within tick interval)
-                    self._active[name] = self._active.get(name, 0) + delta
+                    self._add(name, wall, delta)
             self._last_update[name] = now
 
         # Clear triggers that are no longer active
@@ -23,16 +48,156 @@ class ForegroundTracker:
             if name not in current:
                 del self._last_update[name]
 
-    def has_exceeded_limit(self, trigger) -> bool:
+        if now - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def _add(self, name, now, seconds):
+        minute = int(now // 60)
+        buckets = self._buckets.setdefault(name, {})
+        buckets[minute] = buckets.get(minute, 0) + seconds
+        key = (name, minute)
+        self._pending[key] = self._pending.get(key, 0) + seconds
+
+    def seconds_since(self, name, since):
+        """Seconds accumulated for `name` since epoch time `since` (and its last reset).
+
+        The minute containing `since` counts in full; after a reset, only
+        what that minute gained after the reset counts.
+        """
+        skip = 0
+        reset_at = self._reset_at.get(name, 0)
+        if reset_at >= since:
+            since = reset_at
+            skip = self._reset_base.get(name, 0)
+        first_minute = int(since // 60)
+        total = 0
+        buckets = self._buckets.get(name, {})
+        for minute in reversed(buckets):
+            if minute < first_minute:
+                break
+            total += buckets[minute]
+        return max(0, total - skip)
+
+    def seconds_on_day(self, name, day):
+        """Seconds accumulated for `name` on a local calendar date."""
+        start = datetime(day.year, day.month, day.day).timestamp()
+        end = start + 86400
+        return sum(secs for minute, secs in self._buckets.get(name, {}).items()
+                   if start <= minute * 60 < end and minute * 60 >= self._reset_at.get(name, 0))
+
+    def has_exceeded_limit(self, trigger, since=0) -> bool:
+        """Check the trigger's limit against usage since `since` (epoch seconds)."""
         if not trigger.is_time_based:
             return False
-        accumulated = self._active.get(trigger.name, 0)
-        return accumulated >= trigger.time_limit_minutes * 60
+        return self.seconds_since(trigger.name, since) >= trigger.limit_seconds
 
     def reset_trigger(self, name: str):
-        self._active.pop(name, None)
-        self._last_update.pop(name, None)
+        self._reset(name)
+        self.flush()
 
     def reset_all(self):
-        self._active.clear()
+        for name in list(self._buckets):
+            self._reset(name)
         self._last_update.clear()
+        self.flush()
+
+    def _reset(self, name):
+        self._last_update.pop(name, None)
+        now = self.clock.time()
+        base = self._buckets.get(name, {}).get(int(now // 60), 0)
+        self._reset_at[name] = now
+        self._reset_base[name] = base
+        self._pending_resets.append((name, now, base))
+
+    # -- Ledger --
+
+    def flush(self):
+        """Append pending usage and resets to the ledger in one write."""
+        self._last_flush = self.clock.monotonic()
+        self._prune()
+        if not self._ledger_path or not (self._pending or self._pending_resets):
+            self._pending.clear()
+            self._pending_resets.clear()
+            return
+        lines = [json.dumps(["u", minute, name, round(secs, 1)], ensure_ascii=False)
+                 for (name, minute), secs in self._pending.items()]
+        lines += [json.dumps(["r", round(ts, 1), name, round(base, 1)], ensure_ascii=False)
+                  for name, ts, base in self._pending_resets]
+        try:
+            os.makedirs(os.path.dirname(self._ledger_path), exist_ok=True)
+            with open(self._ledger_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            return  # keep pending, retry next flush
+        self._pending.clear()
+        self._pending_resets.clear()
+        self._ledger_lines += len(lines)
+        if self._ledger_lines > self._compact_at:
+            self._compact()  # a long-running process must not grow the file without bound
+
+    def _prune(self):
+        """Drop buckets older than the ledger keeps, so memory stays bounded."""
+        cutoff_minute = int(self.clock.time() // 60) - LEDGER_KEEP_DAYS * 1440
+        for name in list(self._buckets):
+            buckets = self._buckets[name]
+            for minute in list(buckets):  # oldest first
+                if minute >= cutoff_minute:
+                    break
+                del buckets[minute]
+            if not buckets:
+                del self._buckets[name]
+
+    def _load(self):
+        if not os.path.exists(self._ledger_path):
+            return
+        cutoff_minute = int(self.clock.time() // 60) - LEDGER_KEEP_DAYS * 1440
+        records = []
+        line_count = 0
+        try:
+            with open(self._ledger_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line after a crash
+                    if (isinstance(rec, list) and len(rec) >= 3
+                            and isinstance(rec[1], (int, float))):
+                        records.append(rec)
+        except OSError:
+            return
+        # Buckets must stay oldest-first for seconds_since()
+        records.sort(key=lambda r: r[1] if r[0] == "u" else r[1] / 60)
+        for rec in records:
+            try:
+                if rec[0] == "u" and rec[1] >= cutoff_minute:
+                    buckets = self._buckets.setdefault(rec[2], {})
+                    buckets[rec[1]] = buckets.get(rec[1], 0) + float(rec[3])
+                elif rec[0] == "r" and rec[1] >= self._reset_at.get(rec[2], 0):
+                    self._reset_at[rec[2]] = rec[1]
+                    self._reset_base[rec[2]] = float(rec[3]) if len(rec) > 3 else 0
+            except (IndexError, TypeError, ValueError):
+                continue
+        self._ledger_lines = line_count
+        if line_count > self._compact_at:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the ledger with one line per retained bucket."""
+        lines = [json.dumps(["u", minute, name, round(secs, 1)], ensure_ascii=False)
+                 for name, buckets in self._buckets.items()
+                 for minute, secs in buckets.items()]
+        lines += [json.dumps(["r", round(ts, 1), name, round(self._reset_base.get(name, 0), 1)],
+                             ensure_ascii=False)
+                  for name, ts in self._reset_at.items()]
+        tmp = self._ledger_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp, self._ledger_path)
+        except OSError:
+            self._compact_at = 2 * self._ledger_lines  # retry later, not on every flush
+            return
+        self._ledger_lines = len(lines)
+        # Seven busy days can exceed COMPACT_LINES on their own; don't rewrite every flush then
+        self._compact_at = max(COMPACT_LINES, 2 * len(lines))
@@ -0,0 +1,135 @@
+"""App icon rendered once at every size and cached on disk next to the config."""
+import hashlib
+import os
+import shutil
+import sys
+
+from PIL import Image, ImageDraw
+
+from config import CONFIG_DIR
+
+ICON_SIZES = (16, 32, 48, 64, 128, 256)  # same set tools/create_icon.py writes to icon.ico
+TRAY_SIZE = 64
+CACHE_VERSION = 1  # bump when the rendering below changes
+ICON_CACHE_DIR = os.path.join(CONFIG_DIR, "icons")
+
+
+def _source_path():
+    icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "icon.png")
+    if not os.path.isfile(icon_path):
+        # PyInstaller bundled path
+        icon_path = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), "assets", "icon.png")
+    return icon_path if os.path.isfile(icon_path) else None
+
+
+def _draw_fallback(size):
+    """Clean geometric alarm clock (designed on a 64-unit grid)."""
+    s = size / 64
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    def box(x1, y1, x2, y2):
+        return [int(x1 * s), int(y1 * s), int(x2 * s), int(y2 * s)]
+
+    # Clock body (circle)
+    draw.ellipse(box(10, 14, 54, 58), fill="#ffffff")
+    # Bell top bumps
+    draw.ellipse(box(18, 6, 30, 18), fill="#ffffff")
+    draw.ellipse(box(34, 6, 46, 18), fill="#ffffff")
+    # Clock face (dark circle inside)
+    draw.ellipse(box(16, 20, 48, 52), fill="#1a1a1a")
+    # Clock hands
+    width = max(1, int(2 * s))
+    draw.line(box(32, 36, 32, 26), fill="#ffffff", width=width)
+    draw.line(box(32, 36, 40, 36), fill="#ffffff", width=width)
+    # Small dot at center
+    draw.ellipse(box(30, 34, 34, 38), fill="#ffffff")
+    return img
+
+
+class IconCache:
+    """Pre-scaled icon bitmaps, keyed by a hash of the source file's bytes.
+
+    The first start renders all ICON_SIZES from assets/icon.png (or the
+    drawn fallback) and writes them as PNGs into a versioned directory;
+    later starts just load the size they need.
+    """
+
+    def __init__(self, cache_dir=ICON_CACHE_DIR, source=None):
+        self.source = source or _source_path()
+        self.cache_dir = cache_dir
+        self.dir = os.path.join(cache_dir, self._fingerprint())
+        self._images = {}
+
+    def _fingerprint(self):
+        # Content, not path or mtime: the onefile build unpacks to a new temp dir every launch
+        if self.source is None:
+            key = b"fallback"
+        else:
+            try:
+                with open(self.source, "rb") as f:
+                    key = f.read()
+            except OSError:
+                key = b"missing"
+        return f"v{CACHE_VERSION}-{hashlib.sha1(key).hexdigest()[:12]}"
+
+    def get(self, size=TRAY_SIZE):
+        img = self._images.get(size)
+        if img is not None:
+            return img
+        img = self._load(size)
+        if img is None and size in ICON_SIZES:
+            self._render_all()
+            return self._images[size]
+        if img is None:
+            img = self._render(size)
+        self._images[size] = img
+        return img
+
+    def _path(self, size):
+        return os.path.join(self.dir, f"icon-{size}.png")
+
+    def _load(self, size):
+        try:
+            with Image.open(self._path(size)) as f:
+                return f.convert("RGBA")
+        except (OSError, ValueError):
+            return None
+
+    def _open_source(self):
+        if self.source is None:
+            return None
+        try:
+            with Image.open(self.source) as f:
+                return f.convert("RGBA")
+        except (OSError, ValueError):
+            return None
+
+    def _render(self, size, original=None):
+        if original is None:
+            original = self._open_source()
+        if original is None:
+            return _draw_fallback(size)
+        return original.resize((size, size), Image.LANCZOS)
+
+    def _render_all(self):
+        """Render every size from one decode of the source and write the cache."""
+        original = self._open_source()
+        for size in ICON_SIZES:
+            self._images[size] = self._render(size, original)
+        self._write()
+
+    def _write(self):
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            for size, img in self._images.items():
+                tmp = self._path(size) + ".tmp"
+                img.save(tmp, format="PNG")
+                os.replace(tmp, self._path(size))
+        except OSError:
+            return  # cache is an optimization; run from memory
+        # Drop caches of older versions or previous icon files
+        for name in os.listdir(self.cache_dir):
+            stale = os.path.join(self.cache_dir, name)
+            if name != os.path.basename(self.dir) and os.path.isdir(stale):
+                shutil.rmtree(stale, ignore_errors=True)
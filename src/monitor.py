@@ -0,0 +1,152 @@
+"""Background trigger monitor — keeps OS enumeration off the Tk thread."""
+import queue
+import threading
+import time
+from typing import NamedTuple
+
+from clock import SYSTEM_CLOCK
+from chrome_monitor import ProcessSnapshot, get_active_matches
+from profiler import NULL_PROFILER
+
+WINDOW_EVENT_COALESCE = 0.25  # seconds; a burst of window events becomes one pass
+
+
+class MatchResult(NamedTuple):
+    """One finished detection pass. Immutable; handed to the UI thread as-is."""
+    seq: int
+    started: float          # clock.monotonic() when the pass began
+    triggers: tuple         # triggers that were in their schedule window
+    matches: tuple          # names of those triggers that are currently active
+    snapshot: ProcessSnapshot
+
+
+class TriggerMonitor:
+    """Worker thread that scans processes/windows on its own cadence.
+
+    The latest MatchResult is published by swapping a single attribute, so
+    readers never block. Other blocking OS work (e.g. closing trigger apps)
+    can be queued with submit() and runs on the same thread.
+    """
+
+    def __init__(self, config, windows=None, interval=5.0, on_result=None, clock=None,
+                 profiler=None):
+        self.config = config
+        self.clock = clock or SYSTEM_CLOCK
+        self.profiler = profiler or NULL_PROFILER
+        self.windows = windows
+        self.interval = interval
+        self.on_result = on_result
+        self._latest = None
+        self._seq = 0
+        self._active = False
+        self._active_since = 0.0
+        self._wake = threading.Event()
+        self._windows_changed = False  # set by windows_changed(), cleared by a pass
+        self._full_pass = False  # set by wake() and set_active(True)
+        self._walked_at = None  # clock.monotonic() of the last process walk
+        self._jobs = queue.SimpleQueue()
+        self._stopped = False
+        self._thread = None
+
+    def start(self):
+        if self._thread:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+
+    @property
+    def latest(self):
+        """Most recent result gathered while monitoring was active, or None."""
+        result = self._latest
+        if result is None or result.started < self._active_since:
+            return None
+        return result
+
+    def set_active(self, active):
+        """Only scan while the alarm is confirmed; wake at once when that starts."""
+        if active and not self._active:
+            self._active_since = self.clock.monotonic()
+            self._active = True
+            self._full_pass = True
+            self._wake.set()
+        elif not active:
+            self._active = False
+
+    def wake(self):
+        """Run a full detection pass now (e.g. after the triggers changed)."""
+        if self._active:
+            self._full_pass = True
+            self._wake.set()
+
+    def windows_changed(self):
+        """Re-match window titles soon, against the last process walk.
+
+        Called for every window event; a burst is coalesced into one pass,
+        and processes are only walked again once the interval has passed.
+        """
+        if self._active:
+            self._windows_changed = True
+            self._wake.set()
+
+    def submit(self, job, on_done=None):
+        """Run job() on the monitor thread; on_done(result) is called from there."""
+        self._jobs.put((job, on_done))
+        self._wake.set()
+
+    def _run(self):
+        while not self._stopped:
+            # Idle: sleep until set_active(True), submit() or stop() sets the event
+            timed_out = not self._wake.wait(self.interval if self._active else None)
+            if self._windows_changed and not timed_out:
+                time.sleep(WINDOW_EVENT_COALESCE)  # let the rest of the burst arrive
+            self._wake.clear()
+            titles_only = self._windows_changed and not (timed_out or self._full_pass)
+            self._windows_changed = self._full_pass = False
+            self._drain_jobs()
+            if self._active and not self._stopped:
+                try:
+                    with self.profiler.phase("scan"):
+                        self._scan(titles_only)
+                except Exception:
+                    pass
+
+    def _drain_jobs(self):
+        while True:
+            try:
+                job, on_done = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result = job()
+            except Exception:
+                result = None
+            if on_done:
+                on_done(result)
+
+    def _scan(self, titles_only=False):
+        started = self.clock.monotonic()
+        config = self.config
+        now = self.clock.now()
+        triggers = tuple(config.get_triggers_in_window(now.hour, now.minute))
+        snapshot = ProcessSnapshot()
+        matches = ()
+        if triggers:
+            latest = self._latest
+            if (titles_only and latest is not None and self._walked_at is not None
+                    and self._walked_at >= self._active_since
+                    and started - self._walked_at < self.interval):
+                snapshot = latest.snapshot  # only titles changed; processes are walked on the interval
+            else:
+                with self.profiler.phase("processes"):
+                    snapshot = ProcessSnapshot.capture()
+                self._walked_at = started
+            matches = tuple(get_active_matches(
+                triggers, snapshot, config.trigger_index, self.windows, self.profiler))
+        self._seq += 1
+        self._latest = MatchResult(self._seq, started, triggers, matches, snapshot)
+        if self.on_result:
+            self.on_result()
@@ -4,7 +4,10 @@ import winsound
 import os
 
 import theme as T
-from widgets import RoundedButton, fade_in_window, fade_out_window, round_rect
+from animation import animate
+from widgets import GRADIENT_STEPS, CardWindow, RoundedButton, fade_in_window, fade_out_window, gradient
+
+_PULSE_HALF_PERIOD = 1.6  # seconds from ACCENT to ACCENT_MUTED
 
 
 class AlarmPopup:
@@ -21,67 +24,27 @@ class AlarmPopup:
         self.snooze_label = snooze_label
         self.confirm_label = confirm_label
         self.fullscreen = fullscreen
-        self.popup = None
+        self.card = None  # CardWindow, built by build() and kept for the app's lifetime
+        self._showing = False
         self._refocus_id = None
-        self._pulse_id = None
+        self._pulse = None
         self._is_test = False
         self._icon_label = None
 
-    def show(self, is_test=False):
-        if self.popup and self.popup.winfo_exists():
-            return
-        self._is_test = is_test
-
-        self.popup = tk.Toplevel(self.root)
-        self.popup.overrideredirect(True)
-        self.popup.attributes("-topmost", True)
-
-        sx = self.popup.winfo_screenwidth()
-        sy = self.popup.winfo_screenheight()
-
-        cw, ch = 520, 420
-        radius = T.CARD_RADIUS
-        margin = 10
-
-        if self.fullscreen:
-            self.popup.geometry(f"{sx}x{sy}+0+0")
-            self.popup.configure(bg="#000000")
+    @property
+    def popup(self):
+        return self.card.window if self.card is not None else None
 
-            card_canvas = tk.Canvas(
-                self.popup, width=cw + margin * 2, height=ch + margin * 2,
-                bg="#000000", highlightthickness=0, bd=0)
-            card_canvas.place(relx=0.5, rely=0.5, anchor="center")
-        else:
-            pw, ph = cw + margin * 2, ch + margin * 2
-            x, y = (sx - pw) // 2, (sy - ph) // 2
-            self.popup.geometry(f"{pw}x{ph}+{x}+{y}")
-            self.popup.configure(bg="#FF00FF")
-            self.popup.attributes("-transparentcolor", "#FF00FF")
-
-            card_canvas = tk.Canvas(
-                self.popup, width=pw, height=ph,
-                bg="#FF00FF", highlightthickness=0, bd=0)
-            card_canvas.pack(fill="both", expand=True)
-
-        self.popup.protocol("WM_DELETE_WINDOW", lambda: None)
-        self.popup.bind("<Alt-F4>", lambda e: "break")
-        self.popup.bind("<Escape>", lambda e: "break")
-        self.popup.bind("<Alt-Key>", lambda e: "break")
-
-        # Shadow layer
-        round_rect(card_canvas, margin + 4, margin + 4,
-                   margin + cw + 4, margin + ch + 4,
-                   radius=radius, fill=T.BG_SHADOW, outline="")
-        # Card background
-        round_rect(card_canvas, margin, margin,
-                   margin + cw, margin + ch,
-                   radius=radius, fill=T.BG, outline=T.BORDER)
-
-        # Content frame
-        inner = tk.Frame(card_canvas, bg=T.BG)
-        card_canvas.create_window(
-            margin + cw // 2, margin + ch // 2,
-            window=inner, width=cw - 96, height=ch - 80)
+    def build(self):
+        """Create the (withdrawn) window and its widgets; show() reuses them."""
+        if self.card is not None and self.card.exists():
+            return
+        self.card = card = CardWindow(self.root, 520, 420, pad_x=96, pad_y=80)
+        card.window.protocol("WM_DELETE_WINDOW", lambda: None)
+        card.window.bind("<Alt-F4>", lambda e: "break")
+        card.window.bind("<Escape>", lambda e: "break")
+        card.window.bind("<Alt-Key>", lambda e: "break")
+        inner = card.inner
 
         # Alarm icon (pulsing)
         self._icon_label = tk.Label(
@@ -91,39 +54,56 @@ class AlarmPopup:
         self._icon_label.pack(pady=(0, 10))
 
         # Title
-        tk.Label(
-            inner, text=self.title,
-            font=(T.FONT, 28, "bold"), bg=T.BG, fg=T.TEXT,
-        ).pack(pady=(0, 8))
+        self._title_label = tk.Label(
+            inner, font=(T.FONT, 28, "bold"), bg=T.BG, fg=T.TEXT,
+        )
+        self._title_label.pack(pady=(0, 8))
 
         # Subtitle
-        subtitle = self.popup_text or "Dein System hat heute geliefert.\nJetzt darf es sich erholen."
-        tk.Label(
-            inner, text=subtitle,
-            font=(T.FONT, 12), bg=T.BG, fg=T.TEXT_MUTED,
+        self._text_label = tk.Label(
+            inner, font=(T.FONT, 12), bg=T.BG, fg=T.TEXT_MUTED,
             justify="center", wraplength=400,
-        ).pack(pady=(0, 36))
+        )
+        self._text_label.pack(pady=(0, 36))
 
         # Buttons
         btn_row = tk.Frame(inner, bg=T.BG)
         btn_row.pack(fill="x")
 
-        RoundedButton(
+        self._snooze_btn = RoundedButton(
             btn_row, text=self.snooze_label,
             bg=T.BG_INPUT, fg=T.TEXT_SECONDARY,
             hover_bg=T.BG_HOVER, hover_fg=T.TEXT,
             command=self._on_snooze,
             width=200, height=54, radius=22,
-        ).pack(side="left")
+        )
+        self._snooze_btn.pack(side="left")
 
-        RoundedButton(
+        self._confirm_btn = RoundedButton(
             btn_row, text=self.confirm_label,
             bg=T.ACCENT, fg=T.BG,
             hover_bg=T.ACCENT_HOVER, hover_fg=T.BG,
             command=self._on_confirm,
             width=220, height=54, radius=22,
             font=(T.FONT, T.FONT_SIZE_LG, "bold"),
-        ).pack(side="right")
+        )
+        self._confirm_btn.pack(side="right")
+
+    def show(self, is_test=False):
+        if self.is_showing:
+            return
+        self._is_test = is_test
+        self.build()
+
+        # Only texts and geometry change between alarms
+        self._title_label.configure(text=self.title)
+        self._text_label.configure(
+            text=self.popup_text or "Dein System hat heute geliefert.\nJetzt darf es sich erholen.")
+        self._icon_label.configure(fg=T.ACCENT)
+        self._snooze_btn.reset(self.snooze_label)
+        self._confirm_btn.reset(self.confirm_label)
+        self.card.show(self.fullscreen)
+        self._showing = True
 
         fade_in_window(self.popup, duration_ms=350)
         self._play_sound()
@@ -134,35 +114,25 @@ class AlarmPopup:
 
     def _start_pulse(self):
         """Pulse the alarm icon between ACCENT and ACCENT_MUTED."""
-        self._pulse_step = 0
-        self._pulse_direction = 1
-        self._pulse_tick()
-
-    def _pulse_tick(self):
-        if not self.popup or not self.popup.winfo_exists() or not self._icon_label:
-            return
-        steps = 20
-        t = self._pulse_step / steps
-        r1, g1, b1 = int(T.ACCENT[1:3], 16), int(T.ACCENT[3:5], 16), int(T.ACCENT[5:7], 16)
-        r2, g2, b2 = int(T.ACCENT_MUTED[1:3], 16), int(T.ACCENT_MUTED[3:5], 16), int(T.ACCENT_MUTED[5:7], 16)
-        r = int(r1 + (r2 - r1) * t)
-        g = int(g1 + (g2 - g1) * t)
-        b = int(b1 + (b2 - b1) * t)
-        color = f"#{r:02x}{g:02x}{b:02x}"
-        self._icon_label.configure(fg=color)
-
-        self._pulse_step += self._pulse_direction
-        if self._pulse_step >= steps:
-            self._pulse_direction = -1
-        elif self._pulse_step <= 0:
-            self._pulse_direction = 1
-
-        self._pulse_id = self.root.after(80, self._pulse_tick)
+        self._stop_pulse()
+        self._pulse_colors = gradient(T.ACCENT, T.ACCENT_MUTED)
+        self._pulse_index = None
+        self._pulse = animate(self.popup, self._pulse_frame)
+
+    def _pulse_frame(self, elapsed):
+        if not self.is_showing or not self._icon_label:
+            return False
+        # Triangle wave: ACCENT -> ACCENT_MUTED -> ACCENT every 2 * _PULSE_HALF_PERIOD
+        phase = (elapsed / _PULSE_HALF_PERIOD) % 2
+        index = round((phase if phase <= 1 else 2 - phase) * GRADIENT_STEPS)
+        if index != self._pulse_index:
+            self._pulse_index = index
+            self._icon_label.configure(fg=self._pulse_colors[index])
 
     def _stop_pulse(self):
-        if self._pulse_id:
-            self.root.after_cancel(self._pulse_id)
-            self._pulse_id = None
+        if self._pulse:
+            self._pulse.cancel()
+            self._pulse = None
 
     def _play_sound(self):
         try:
@@ -181,7 +151,7 @@ class AlarmPopup:
             pass
 
     def _start_refocus(self):
-        if self.popup and self.popup.winfo_exists():
+        if self.is_showing:
             self.popup.attributes("-topmost", True)
             self.popup.focus_force()
             self.popup.lift()
@@ -206,34 +176,36 @@ class AlarmPopup:
         self._stop_refocus()
         self._stop_pulse()
         self._stop_sound()
-        if self.popup and self.popup.winfo_exists():
+        if self.is_showing:
             try:
                 self.popup.grab_release()
             except Exception:
                 pass
-            fade_out_window(self.popup, duration_ms=250, on_done=lambda: self._destroy_and_call(callback))
+            fade_out_window(self.popup, duration_ms=250, on_done=lambda: self._hide_and_call(callback))
         else:
-            self.popup = None
+            self._showing = False
             callback()
 
-    def _destroy_and_call(self, callback):
-        if self.popup and self.popup.winfo_exists():
-            self.popup.destroy()
-        self.popup = None
+    def _hide_and_call(self, callback):
+        self._hide()
         callback()
 
+    def _hide(self):
+        self._showing = False
+        if self.card is not None:
+            self.card.hide()
+
     def dismiss(self):
         self._stop_refocus()
         self._stop_pulse()
         self._stop_sound()
-        if self.popup and self.popup.winfo_exists():
+        if self.is_showing:
             try:
                 self.popup.grab_release()
             except Exception:
                 pass
-            self.popup.destroy()
-        self.popup = None
+        self._hide()
 
     @property
     def is_showing(self):
-        return self.popup is not None and self.popup.winfo_exists()
+        return self._showing and self.card is not None and self.card.exists()
@@ -0,0 +1,126 @@
+"""Tick profiler — rolling per-phase timings for the Diagnose window."""
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import NamedTuple
+
+RING_SIZE = 512  # samples kept per phase
+
+# Phase name -> label, in display order
+PHASES = {
+    "tick": "Tick gesamt",
+    "scheduler": "Alarm-Scheduler",
+    "break": "Pausen-Timer",
+    "tracker": "Zeit-Tracker",
+    "scan": "Erkennung gesamt",
+    "processes": "Prozess-Scan",
+    "windows": "Fenster-Liste",
+    "matching": "Trigger-Abgleich",
+}
+
+
+class PhaseStats(NamedTuple):
+    phase: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class TickProfiler:
+    """Fixed-size ring buffer of durations per phase.
+
+    Phases are recorded from both the Tk thread and the monitor thread.
+    """
+
+    def __init__(self, size=RING_SIZE):
+        self.size = size
+        self._samples = {}  # phase -> deque of seconds
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        with self._lock:
+            ring = self._samples.get(name)
+            if ring is None:
+                ring = self._samples[name] = deque(maxlen=self.size)
+            ring.append(seconds)
+
+    def samples(self, name):
+        with self._lock:
+            return list(self._samples.get(name, ()))
+
+    def stats(self):
+        """PhaseStats for every phase with samples, known phases first."""
+        with self._lock:
+            names = [p for p in PHASES if p in self._samples]
+            names += sorted(p for p in self._samples if p not in PHASES)
+            rings = {name: sorted(self._samples[name]) for name in names}
+        result = []
+        for name in names:
+            ordered = rings[name]
+            if not ordered:
+                continue
+            result.append(PhaseStats(
+                name, len(ordered),
+                _percentile(ordered, 0.50) * 1000,
+                _percentile(ordered, 0.95) * 1000,
+                _percentile(ordered, 0.99) * 1000,
+                ordered[-1] * 1000,
+            ))
+        return result
+
+    def to_dict(self):
+        return {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "ring_size": self.size,
+            "phases": {
+                s.phase: {
+                    "count": s.count,
+                    "p50_ms": round(s.p50_ms, 3),
+                    "p95_ms": round(s.p95_ms, 3),
+                    "p99_ms": round(s.p99_ms, 3),
+                    "max_ms": round(s.max_ms, 3),
+                    "samples_ms": [round(x * 1000, 3) for x in self.samples(s.phase)],
+                }
+                for s in self.stats()
+            },
+        }
+
+    def export(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+class _NullProfiler:
+    """Drop-in for callers without a profiler (simulator, benchmarks)."""
+
+    _null = nullcontext()
+
+    def phase(self, name):
+        return self._null
+
+    def record(self, name, seconds):
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
@@ -1,6 +1,8 @@
 """Scheduler with state machine for Sticky Alarm."""
 from enum import Enum, auto
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from clock import SYSTEM_CLOCK
 
 
 class State(Enum):
@@ -11,19 +13,20 @@ class State(Enum):
 
 
 class Scheduler:
-    def __init__(self, config):
+    def __init__(self, config, clock=None):
         self.config = config
+        self.clock = clock or SYSTEM_CLOCK
         self.state = State.WAITING
-        self._snooze_after = None
-        self._snooze_start = None
+        self._snooze_after = None  # monotonic deadline
+        self._snooze_start = None  # monotonic
         self._was_in_window = self._is_in_window()
 
     def _is_in_window(self):
-        now = datetime.now()
+        now = self.clock.now()
         return self.config.any_profile_active(now.hour, now.minute)
 
     def tick(self):
-        now = datetime.now()
+        now = self.clock.now()
         in_window = self.config.any_profile_active(now.hour, now.minute)
 
         if not in_window:
@@ -40,23 +43,32 @@ class Scheduler:
             else:
                 self.state = State.ACTIVE
         elif self.state == State.SNOOZED:
-            if self._snooze_after and now >= self._snooze_after:
+            if self._snooze_after is not None and self.clock.monotonic() >= self._snooze_after:
                 self.state = State.ACTIVE
                 self._snooze_after = None
                 self._snooze_start = None
 
         return self.state
 
+    def next_wakeup(self, now):
+        """Earliest instant at which tick() could return a different state."""
+        wakeup = self.config.next_schedule_change(now)
+        if self.state == State.SNOOZED and self._snooze_after is not None:
+            snooze_end = now + timedelta(seconds=self._snooze_after - self.clock.monotonic())
+            if wakeup is None or snooze_end < wakeup:
+                wakeup = snooze_end
+        return wakeup
+
     def snooze(self, snooze_minutes=None):
         self.state = State.SNOOZED
         minutes = snooze_minutes or self.config.snooze_minutes
-        self._snooze_start = datetime.now()
-        self._snooze_after = self._snooze_start + timedelta(minutes=minutes)
+        self._snooze_start = self.clock.monotonic()
+        self._snooze_after = self._snooze_start + minutes * 60
 
     def update_snooze_duration(self, new_minutes):
         """Update snooze end time if currently snoozed."""
-        if self.state == State.SNOOZED and self._snooze_start:
-            self._snooze_after = self._snooze_start + timedelta(minutes=new_minutes)
+        if self.state == State.SNOOZED and self._snooze_start is not None:
+            self._snooze_after = self._snooze_start + new_minutes * 60
 
     def confirm_routine(self):
         self.state = State.CONFIRMED
@@ -14,23 +14,11 @@ import theme as T
 from widgets import (
     RoundedButton, RoundedEntry, RoundedTextarea, TimeInput,
     NumberInput, CustomCheckbox, AutoHideScrollbar, CollapsibleSection,
-    EmojiPicker, fade_in_window, round_rect,
+    EmojiPicker, fade_in_window, round_rect, enable_dark_titlebar,
     draw_close_x, draw_play, draw_stop,
 )
 
 
-def _enable_dark_titlebar(window):
-    """Enable dark title bar on Windows 10/11 via DWM API."""
-    try:
-        import ctypes
-        hwnd = ctypes.windll.user32.GetParent(window.winfo_id())
-        value = ctypes.c_int(1)
-        ctypes.windll.dwmapi.DwmSetWindowAttribute(
-            hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
-    except Exception:
-        pass
-
-
 # -- Helpers --
 
 def _section_label(parent, text):
@@ -59,57 +47,74 @@ def _get_windows_sounds():
 # -- Sound List Item --
 
 class _SoundRow(tk.Frame):
-    """Single row in the sound picker list: name + play button, selectable."""
+    """Row in the sound picker list: name + play button, selectable.
 
-    _active_row = None
+    Rows are recycled by _SoundList: show() rebinds one to another sound.
+    """
 
-    def __init__(self, parent, filepath, display_name, is_selected, on_select,
-                 on_play, on_stop, is_custom=False):
+    def __init__(self, parent, on_select, on_toggle_play):
         super().__init__(parent, bg=T.BG, cursor="hand2")
-        self.filepath = filepath
+        self.filepath = None
         self._on_select = on_select
-        self._on_play = on_play
-        self._on_stop = on_stop
+        self._on_toggle_play = on_toggle_play
         self._playing = False
-        self._selected = is_selected
-
-        bg = T.BG_INPUT if is_selected else T.BG
-        self.configure(bg=bg)
+        self._selected = False
+        self._state = None
 
         self._play_canvas = tk.Canvas(self, width=34, height=34,
-                                       bg=bg, highlightthickness=0, bd=0,
+                                       bg=T.BG, highlightthickness=0, bd=0,
                                        cursor="hand2")
         self._play_canvas.pack(side="left", padx=(8, 6), pady=3)
         self._play_bg = round_rect(self._play_canvas, 2, 2, 32, 32, radius=12,
-                                    fill=bg, outline="")
+                                    fill=T.BG, outline="")
         self._play_icon_items = draw_play(self._play_canvas, 17, 17, 10, T.TEXT_MUTED)
         self._play_mode = "play"
-        self._play_canvas.bind("<Button-1>", self._toggle_play)
+        self._play_canvas.bind("<Button-1>", lambda e: self._on_toggle_play(self.filepath))
         self._play_canvas.bind("<Enter>", self._on_play_enter)
         self._play_canvas.bind("<Leave>", self._on_play_leave)
 
-        self._label = tk.Label(
-            self, text=display_name, font=T.FONT_BODY,
-            bg=bg, fg=T.TEXT if is_selected else T.TEXT_SECONDARY,
-            anchor="w",
-        )
+        self._label = tk.Label(self, font=T.FONT_BODY, bg=T.BG, anchor="w")
         self._label.pack(side="left", fill="x", expand=True, pady=6)
+        self._custom_badge = tk.Label(self, text="Eigene", font=T.FONT_MUTED,
+                                      bg=T.BG, fg=T.TEXT_MUTED)
+        self._check = tk.Label(self, text="\u2713", font=(T.FONT, 12, "bold"),
+                               bg=T.BG, fg=T.ACCENT)
 
-        if is_custom:
-            tk.Label(self, text="Eigene", font=T.FONT_MUTED,
-                     bg=bg, fg=T.TEXT_MUTED).pack(side="right", padx=(0, 10))
-
-        if is_selected:
-            tk.Label(self, text="\u2713", font=(T.FONT, 12, "bold"),
-                     bg=bg, fg=T.ACCENT).pack(side="right", padx=(0, 10))
-
-        self.bind("<Button-1>", lambda e: self._on_select(filepath))
-        self._label.bind("<Button-1>", lambda e: self._on_select(filepath))
+        self.bind("<Button-1>", lambda e: self._on_select(self.filepath))
+        self._label.bind("<Button-1>", lambda e: self._on_select(self.filepath))
 
         for w in (self, self._label):
             w.bind("<Enter>", self._on_enter, add="+")
             w.bind("<Leave>", self._on_leave, add="+")
 
+    def show(self, filepath, display_name, is_selected, is_custom, is_playing):
+        """Bind the row to a sound; does nothing if it already shows exactly that."""
+        state = (filepath, display_name, is_selected, is_custom, is_playing)
+        if state == self._state:
+            return
+        self._state = state
+        self.filepath = filepath
+        self._selected = is_selected
+        bg = T.BG_INPUT if is_selected else T.BG
+        for w in (self, self._label, self._play_canvas, self._custom_badge, self._check):
+            w.configure(bg=bg)
+        self._label.configure(text=display_name,
+                              fg=T.TEXT if is_selected else T.TEXT_SECONDARY)
+
+        self._custom_badge.pack_forget()
+        self._check.pack_forget()
+        if is_custom:
+            self._custom_badge.pack(side="right", padx=(0, 10))
+        if is_selected:
+            self._check.pack(side="right", padx=(0, 10))
+
+        self._playing = is_playing
+        if is_playing:
+            self._redraw_icon("stop", T.ACCENT)
+        else:
+            self._redraw_icon("play", T.TEXT_MUTED)
+        self._play_canvas.itemconfigure(self._play_bg, fill=bg)
+
     def _on_enter(self, _e):
         if not self._selected:
             bg = T.BG_HOVER
@@ -142,21 +147,11 @@ class _SoundRow(tk.Frame):
         for item in self._play_icon_items:
             self._play_canvas.itemconfigure(item, fill=color)
 
-    def _toggle_play(self, _e=None):
-        if self._playing:
-            self._set_stopped()
-            self._on_stop()
-            _SoundRow._active_row = None
-        else:
-            if _SoundRow._active_row and _SoundRow._active_row is not self:
-                _SoundRow._active_row._set_stopped()
-            _SoundRow._active_row = self
-            self._playing = True
-            self._redraw_icon("stop", T.ACCENT)
-            self._on_stop()
-            self._on_play(self.filepath, self._on_play_done)
-
     def _redraw_icon(self, mode, color):
+        if mode == self._play_mode:
+            for item in self._play_icon_items:
+                self._play_canvas.itemconfigure(item, fill=color)
+            return
         for item in self._play_icon_items:
             self._play_canvas.delete(item)
         if mode == "stop":
@@ -165,18 +160,126 @@ class _SoundRow(tk.Frame):
             self._play_icon_items = draw_play(self._play_canvas, 17, 17, 10, color)
         self._play_mode = mode
 
-    def _set_stopped(self):
-        self._playing = False
-        if self.winfo_exists():
-            self._redraw_icon("play", T.TEXT_MUTED)
-            row_bg = T.BG_INPUT if self._selected else T.BG
-            self._play_canvas.itemconfigure(self._play_bg, fill=row_bg)
 
-    def _on_play_done(self):
-        if self.winfo_exists():
-            self._set_stopped()
-        if _SoundRow._active_row is self:
-            _SoundRow._active_row = None
+class _SoundList(tk.Frame):
+    """Virtualized sound picker list.
+
+    `entries` holds (filepath, display_name, is_custom) tuples, or None for
+    the "Eigene Sounds" header. Only the rows that fit the viewport exist;
+    scrolling re-places them and rebinds them to other entries, so opening
+    the list costs the same for ten sounds or ten thousand.
+    """
+
+    ROW_H = 40
+
+    def __init__(self, parent, entries, selected, on_select, on_play, on_stop):
+        super().__init__(parent, bg=T.BG)
+        self._entries = entries
+        self._selected = selected
+        self._on_select = on_select
+        self._on_play = on_play
+        self._on_stop = on_stop
+        self._playing_path = None
+        self._top = 0  # scroll offset in pixels
+        self._rows = []
+        self._header = None
+        self.scrollbar = None
+        self.bind("<Configure>", lambda e: self._layout())
+        self.bind("<MouseWheel>", self._on_mousewheel)
+
+    @property
+    def content_height(self):
+        return len(self._entries) * self.ROW_H
+
+    def yview(self, *args):
+        """Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")."""
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.content_height)
+        elif args[0] == "scroll":
+            step = self.ROW_H if args[2] == "units" else self.winfo_height()
+            self.scroll_to(self._top + int(args[1]) * step)
+
+    def scroll_to(self, top):
+        max_top = max(0, self.content_height - self.winfo_height())
+        top = min(max(0, int(top)), max_top)
+        if top != self._top:
+            self._top = top
+            self._layout()
+
+    def see_selected(self):
+        """Center the selected sound, if it is in the list."""
+        for i, entry in enumerate(self._entries):
+            if entry is not None and entry[0] == self._selected:
+                self.update_idletasks()
+                self.scroll_to(i * self.ROW_H - (self.winfo_height() - self.ROW_H) // 2)
+                break
+
+    def _on_mousewheel(self, event):
+        self.yview("scroll", int(-1 * (event.delta / 120)), "units")
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_mousewheel)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _make_row(self):
+        row = _SoundRow(self, on_select=self._on_select, on_toggle_play=self._toggle_play)
+        self._bind_wheel(row)
+        self._rows.append(row)
+        return row
+
+    def _make_header(self):
+        header = tk.Frame(self, bg=T.BG)
+        tk.Frame(header, bg=T.BORDER, height=1).pack(fill="x", padx=10, pady=4)
+        tk.Label(header, text="Eigene Sounds", font=T.FONT_MUTED,
+                 bg=T.BG, fg=T.TEXT_MUTED).pack(anchor="w", padx=10, pady=(2, 4))
+        self._bind_wheel(header)
+        self._header = header
+        return header
+
+    def _layout(self):
+        height = self.winfo_height()
+        if height <= 1:
+            return
+        first = self._top // self.ROW_H
+        y = first * self.ROW_H - self._top
+        used = 0
+        header_shown = False
+        for entry in self._entries[first:first + height // self.ROW_H + 2]:
+            if entry is None:
+                (self._header or self._make_header()).place(
+                    x=0, y=y, relwidth=1, height=self.ROW_H)
+                header_shown = True
+            else:
+                row = self._rows[used] if used < len(self._rows) else self._make_row()
+                used += 1
+                filepath, name, is_custom = entry
+                row.show(filepath, name, filepath == self._selected, is_custom,
+                         filepath == self._playing_path)
+                row.place(x=0, y=y, relwidth=1, height=self.ROW_H)
+            y += self.ROW_H
+        for row in self._rows[used:]:
+            row.place_forget()
+        if self._header is not None and not header_shown:
+            self._header.place_forget()
+        if self.scrollbar is not None and self.content_height:
+            total = self.content_height
+            self.scrollbar.set(self._top / total, min(1.0, (self._top + height) / total))
+
+    def _toggle_play(self, filepath):
+        if filepath == self._playing_path:
+            self._playing_path = None
+            self._on_stop()
+        else:
+            self._on_stop()
+            self._playing_path = filepath
+            self._on_play(filepath, lambda: self._on_play_done(filepath))
+        self._layout()
+
+    def _on_play_done(self, filepath):
+        if filepath == self._playing_path and self.winfo_exists():
+            self._playing_path = None
+            self._layout()
 
 
 # -- Trigger Row --
@@ -736,7 +839,7 @@ class SettingsWindow:
         self.window.geometry(f"{w}x{h}+{(sx-w)//2}+{(sy-h)//2}")
 
         self.window.update_idletasks()
-        _enable_dark_titlebar(self.window)
+        enable_dark_titlebar(self.window)
 
         # -- Bottom buttons (pinned) --
         btn_bar = tk.Frame(self.window, bg=T.BG)
@@ -831,6 +934,7 @@ class SettingsWindow:
         # ============================================
         self._windows_sounds = _get_windows_sounds()
         self._custom_sounds = list(self.config.custom_sounds)
+        self._sound_entries_cache = None
         self._selected_sound = self.config.sound_file
         self._sound_popup = None
 
@@ -1074,110 +1178,56 @@ class SettingsWindow:
              + self._sound_dropdown.winfo_height() + 4)
         w = self._sound_dropdown.winfo_width()
 
-        row_h = 40
+        entries = self._sound_entries()
         max_visible = 8
-        total_sounds = len(self._windows_sounds) + len(self._custom_sounds)
-        if self._custom_sounds:
-            total_sounds += 1
-        visible_rows = min(max(total_sounds, 1), max_visible)
-        popup_h = visible_rows * row_h + 2
+        visible_rows = min(max(len(entries), 1), max_visible)
+        popup_h = visible_rows * _SoundList.ROW_H + 2
 
         popup.geometry(f"{w}x{popup_h}+{x}+{y}")
 
         inner = tk.Frame(popup, bg=T.BG)
         inner.pack(fill="both", expand=True, padx=0, pady=0)
 
-        sp_canvas = tk.Canvas(inner, bg=T.BG, highlightthickness=0, bd=0)
-        sp_canvas.pack(fill="both", expand=True, side="left")
-        self._sp_canvas = sp_canvas
-
-        scroll_frame = tk.Frame(sp_canvas, bg=T.BG)
-        sp_win = sp_canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
+        sound_list = _SoundList(
+            inner, entries, self._selected_sound,
+            on_select=self._select_sound,
+            on_play=self._play_preview,
+            on_stop=self._stop_preview,
+        )
+        sound_list.pack(fill="both", expand=True, side="left")
+        popup.bind("<MouseWheel>", sound_list._on_mousewheel)
 
-        if total_sounds > max_visible:
+        if len(entries) > max_visible:
             sp_scrollbar = AutoHideScrollbar(
-                inner, command=sp_canvas.yview, width=6)
+                inner, command=sound_list.yview, width=6)
             sp_scrollbar.place(relx=1.0, rely=0, relheight=1.0, anchor="ne")
-            sp_canvas.configure(yscrollcommand=sp_scrollbar.set)
+            sound_list.scrollbar = sp_scrollbar
             sp_scrollbar.show_temporarily()
 
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: sp_canvas.configure(scrollregion=sp_canvas.bbox("all")))
-        sp_canvas.bind(
-            "<Configure>",
-            lambda e: sp_canvas.itemconfigure(sp_win, width=e.width))
-
-        def _on_mousewheel(event):
-            sp_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        for w_bind in (popup, sp_canvas, scroll_frame):
-            w_bind.bind("<MouseWheel>", _on_mousewheel)
-
-        alarm_first = sorted(
-            self._windows_sounds,
-            key=lambda p: (
-                0 if "alarm" in os.path.basename(p).lower() else 1,
-                os.path.basename(p).lower()))
-
-        for filepath in alarm_first:
-            name = os.path.splitext(os.path.basename(filepath))[0]
-            selected = (filepath == self._selected_sound)
-            row = _SoundRow(
-                scroll_frame, filepath, name, selected,
-                on_select=self._select_sound,
-                on_play=self._play_preview,
-                on_stop=self._stop_preview,
-            )
-            row.pack(fill="x")
-            row.bind("<MouseWheel>", _on_mousewheel)
-            for child in row.winfo_children():
-                child.bind("<MouseWheel>", _on_mousewheel)
-
-        if self._custom_sounds:
-            sep = tk.Frame(scroll_frame, bg=T.BORDER, height=1)
-            sep.pack(fill="x", padx=10, pady=4)
-            lbl = tk.Label(scroll_frame, text="Eigene Sounds",
-                           font=T.FONT_MUTED, bg=T.BG, fg=T.TEXT_MUTED)
-            lbl.pack(anchor="w", padx=10, pady=(2, 4))
-            lbl.bind("<MouseWheel>", _on_mousewheel)
-
-            for filepath in self._custom_sounds:
-                if not os.path.isfile(filepath):
-                    continue
-                name = os.path.splitext(os.path.basename(filepath))[0]
-                selected = (filepath == self._selected_sound)
-                row = _SoundRow(
-                    scroll_frame, filepath, name, selected,
-                    on_select=self._select_sound,
-                    on_play=self._play_preview,
-                    on_stop=self._stop_preview,
-                    is_custom=True,
-                )
-                row.pack(fill="x")
-                row.bind("<MouseWheel>", _on_mousewheel)
-                for child in row.winfo_children():
-                    child.bind("<MouseWheel>", _on_mousewheel)
-
-        popup.update_idletasks()
-        self._scroll_to_selected(scroll_frame, sp_canvas)
+        sound_list.see_selected()
 
         popup.bind("<Deactivate>",
                    lambda e: self.window.after(100, self._close_sound_popup))
         popup.bind("<Escape>", lambda e: self._close_sound_popup())
         popup.focus_set()
 
-    def _scroll_to_selected(self, scroll_frame, canvas):
-        for child in scroll_frame.winfo_children():
-            if isinstance(child, _SoundRow) and child._selected:
-                canvas.update_idletasks()
-                child_y = child.winfo_y()
-                canvas_h = canvas.winfo_height()
-                scroll_h = scroll_frame.winfo_reqheight()
-                if scroll_h > canvas_h:
-                    fraction = max(0.0, (child_y - canvas_h // 2) / scroll_h)
-                    canvas.yview_moveto(fraction)
-                break
+    def _sound_entries(self):
+        """List entries for _SoundList; built once per settings window."""
+        if self._sound_entries_cache is None:
+            alarm_first = sorted(
+                self._windows_sounds,
+                key=lambda p: (
+                    0 if "alarm" in os.path.basename(p).lower() else 1,
+                    os.path.basename(p).lower()))
+            entries = [(p, os.path.splitext(os.path.basename(p))[0], False)
+                       for p in alarm_first]
+            custom = [(p, os.path.splitext(os.path.basename(p))[0], True)
+                      for p in self._custom_sounds if os.path.isfile(p)]
+            if custom:
+                entries.append(None)  # "Eigene Sounds" header
+                entries.extend(custom)
+            self._sound_entries_cache = entries
+        return self._sound_entries_cache
 
     def _close_sound_popup(self):
         if self._sound_popup and self._sound_popup.winfo_exists():
@@ -1258,6 +1308,7 @@ class SettingsWindow:
         if (path and path not in self._custom_sounds
                 and path not in self._windows_sounds):
             self._custom_sounds.append(path)
+            self._sound_entries_cache = None
             self._selected_sound = path
             self._draw_sound_dropdown()
 
@@ -1275,9 +1326,7 @@ class SettingsWindow:
 
     def _reset_save_btn(self):
         if self.window and self.window.winfo_exists():
-            self._save_btn._cur_bg = T.ACCENT
-            self._save_btn.itemconfigure(self._save_btn._rect, fill=T.ACCENT)
-            self._save_btn.itemconfigure(self._save_btn._label, text="Speichern", fill=T.BG)
+            self._save_btn.reset(text="Speichern")
 
     def _do_save(self):
         profiles = []
@@ -0,0 +1,271 @@
+"""Headless day simulator — replays desktop activity against the AlarmEngine.
+
+Runs on a FakeClock against a virtual process table and window list, so a
+full day of alarms, snoozes, breaks and trigger detection finishes in well
+under a second on any OS:
+
+    python src/simulator.py                   # synthetic evening
+    python src/simulator.py timeline.json     # recorded/hand-written timeline
+
+Timeline files are JSON lists of events sorted by time:
+
+    {"at": "20:35", "type": "process_start", "pid": 40, "name": "chrome.exe"}
+    {"at": "20:35", "type": "window_open", "hwnd": 7, "pid": 40, "title": "YouTube - Google Chrome"}
+    {"at": "21:10", "type": "window_title", "hwnd": 7, "pid": 40, "title": "Reddit - Google Chrome"}
+    {"at": "21:30", "type": "window_close", "hwnd": 7}
+    {"at": "21:30", "type": "process_exit", "pid": 40}
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from chrome_monitor import ProcessSnapshot, get_active_matches
+from clock import FakeClock
+from config import Config
+from engine import AlarmEngine, Action
+from scheduler import State
+from window_events import WindowTitleCache, FakeWindowBackend
+
+SCAN_INTERVAL = 5  # seconds, same cadence as the real monitor thread
+
+
+class SimEvent(NamedTuple):
+    at: datetime
+    type: str
+    data: dict
+
+
+class SimDecision(NamedTuple):
+    at: datetime
+    action: str
+    detail: str = ""
+
+
+class UserPolicy:
+    """How the simulated user reacts to popups."""
+
+    def __init__(self, reaction_seconds=20, snoozes=1):
+        self.reaction_seconds = reaction_seconds
+        self.snoozes = snoozes
+
+    def on_alarm(self, alarms_seen):
+        """Return "snooze" or "confirm" for the n-th alarm shown (1-based)."""
+        return "snooze" if alarms_seen <= self.snoozes else "confirm"
+
+
+class VirtualDesktop:
+    """Process table and window list the engine's detection runs against."""
+
+    def __init__(self):
+        self.processes = {}  # pid -> name
+        self.windows = WindowTitleCache()
+        self.backend = FakeWindowBackend(self.windows)
+
+    def apply(self, event):
+        d = event.data
+        if event.type == "process_start":
+            self.processes[d["pid"]] = d["name"]
+        elif event.type == "process_exit":
+            self.processes.pop(d["pid"], None)
+        elif event.type == "window_open":
+            self.backend.open_window(d["hwnd"], d["pid"], d["title"])
+        elif event.type == "window_title":
+            self.backend.set_title(d["hwnd"], d["pid"], d["title"])
+        elif event.type == "window_close":
+            self.backend.close_window(d["hwnd"])
+
+    def snapshot(self):
+        return ProcessSnapshot(list(self.processes.items()))
+
+    def close_triggers(self, triggers):
+        """Same effect as close_trigger_apps, applied to the virtual desktop."""
+        snapshot = self.snapshot()
+        for trigger in triggers:
+            name = trigger.name_lower
+            if trigger.type == "app":
+                proc_name = name if name.endswith(".exe") else f"{name}.exe"
+                for pid in snapshot.pids_by_name.get(proc_name, ()):
+                    self.processes.pop(pid, None)
+                    for hwnd, _pid, _title in self.windows.windows({pid}):
+                        self.backend.close_window(hwnd)
+            elif trigger.type == "site":
+                for hwnd, _pid, title in self.windows.windows(snapshot.browser_pids):
+                    if name in title.lower():
+                        self.backend.close_window(hwnd)
+
+
+class Simulation:
+    def __init__(self, config, events, start, policy=None):
+        self.clock = FakeClock(start)
+        self.config = config
+        self.engine = AlarmEngine(config, self.clock)
+        self.desktop = VirtualDesktop()
+        self.policy = policy or UserPolicy()
+        self.events = sorted(events, key=lambda e: e.at)
+        self.decisions = []
+        self.scans = 0
+        self._alarm_showing = False
+        self._break_showing = False
+        self._alarms_seen = 0
+        self._reaction_at = None
+        self._break_end_at = None
+        self._windows_dirty = False
+        self.desktop.backend.on_change = self._on_window_change
+
+    def _on_window_change(self):
+        self._windows_dirty = True
+
+    def _record(self, action, detail=""):
+        self.decisions.append(SimDecision(self.clock.now(), action, detail))
+
+    def run(self, until):
+        event_i = 0
+        next_tick = self.clock.now()
+        next_scan = None
+        while True:
+            now = self.clock.now()
+            candidates = [until, next_tick]
+            if event_i < len(self.events):
+                candidates.append(self.events[event_i].at)
+            if next_scan is not None:
+                candidates.append(next_scan)
+            if self._reaction_at is not None:
+                candidates.append(self._reaction_at)
+            if self._break_end_at is not None:
+                candidates.append(self._break_end_at)
+            target = max(min(candidates), now)
+            if target >= until:
+                break
+            self.clock.advance((target - now).total_seconds())
+            now = target
+
+            while event_i < len(self.events) and self.events[event_i].at <= now:
+                self.desktop.apply(self.events[event_i])
+                event_i += 1
+
+            if self._reaction_at is not None and now >= self._reaction_at:
+                self._react_to_alarm()
+                next_tick = now
+            if self._break_end_at is not None and now >= self._break_end_at:
+                self._break_end_at = None
+                self._break_showing = False
+                self._record("break_completed")
+                self.engine.break_completed()
+                next_tick = now
+
+            # Monitor: periodic scan while confirmed, or right after a window change
+            confirmed = self.engine.state == State.CONFIRMED
+            if confirmed and (next_scan is None or now >= next_scan or self._windows_dirty):
+                self._windows_dirty = False
+                next_scan = now + timedelta(seconds=SCAN_INTERVAL)
+                if self._scan():
+                    next_tick = now
+            elif not confirmed:
+                next_scan = None
+                self._windows_dirty = False
+
+            if now >= next_tick:
+                for decision in self.engine.tick(self._alarm_showing, self._break_showing):
+                    self._apply(decision)
+                if self.engine.state == State.CONFIRMED and next_scan is None:
+                    next_scan = now
+                wakeup = self.engine.next_wakeup(now)
+                next_tick = wakeup if wakeup and wakeup > now else now + timedelta(minutes=15)
+        return self.decisions
+
+    def _scan(self):
+        self.scans += 1
+        now = self.clock.now()
+        triggers = self.config.get_triggers_in_window(now.hour, now.minute)
+        matches = ()
+        if triggers:
+            matches = get_active_matches(triggers, self.desktop.snapshot(),
+                                         self.config.trigger_index, self.desktop.windows)
+        return self.engine.apply_matches(triggers, matches)
+
+    def _apply(self, decision):
+        if decision.action == Action.SHOW_ALARM:
+            self._alarm_showing = True
+            self._alarms_seen += 1
+            self._reaction_at = self.clock.now() + timedelta(seconds=self.policy.reaction_seconds)
+            names = ", ".join(t.name for t in decision.triggers)
+            self._record("show_alarm", names)
+        elif decision.action == Action.DISMISS_ALARM:
+            self._alarm_showing = False
+            self._reaction_at = None
+            self._record("dismiss_alarm")
+        elif decision.action == Action.SHOW_BREAK:
+            self._break_showing = True
+            self._break_end_at = self.clock.now() + timedelta(
+                minutes=self.config.break_duration_minutes)
+            self._record("show_break")
+        elif decision.action == Action.DISMISS_BREAK:
+            self._break_showing = False
+            self._break_end_at = None
+            self._record("dismiss_break")
+
+    def _react_to_alarm(self):
+        self._reaction_at = None
+        self._alarm_showing = False
+        if self.policy.on_alarm(self._alarms_seen) == "snooze":
+            self._record("snooze")
+            self.engine.snooze()
+            return
+        triggers_to_close, to_scan = self.engine.confirm()
+        if not triggers_to_close and to_scan:
+            matches = get_active_matches(to_scan, self.desktop.snapshot(),
+                                         self.config.trigger_index, self.desktop.windows)
+            triggers_to_close = [t for t in to_scan if t.name in matches]
+        self._record("confirm", ", ".join(t.name for t in triggers_to_close))
+        self.desktop.close_triggers(triggers_to_close)
+        self.engine.apps_closed(triggers_to_close)
+
+
+def parse_timeline(items, day):
+    events = []
+    for item in items:
+        hour, minute = (int(x) for x in item["at"].split(":")[:2])
+        at = day.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if at < day:
+            at += timedelta(days=1)  # after midnight belongs to the next day
+        data = {k: v for k, v in item.items() if k not in ("at", "type")}
+        events.append(SimEvent(at, item["type"], data))
+    return events
+
+
+def synthetic_evening(day):
+    """Browser and a game open during the evening window, YouTube late at night."""
+    return parse_timeline([
+        {"at": "08:30", "type": "process_start", "pid": 40, "name": "chrome.exe"},
+        {"at": "08:30", "type": "window_open", "hwnd": 7, "pid": 40, "title": "Inbox - Google Chrome"},
+        {"at": "19:45", "type": "window_title", "hwnd": 7, "pid": 40, "title": "youtube.com - Google Chrome"},
+        {"at": "21:15", "type": "window_open", "hwnd": 8, "pid": 40, "title": "reddit.com - Google Chrome"},
+        {"at": "22:00", "type": "process_start", "pid": 90, "name": "Steam.exe"},
+        {"at": "23:30", "type": "window_open", "hwnd": 9, "pid": 40, "title": "Twitch - twitch.tv - Google Chrome"},
+        {"at": "23:50", "type": "window_close", "hwnd": 9},
+    ], day)
+
+
+def main():
+    day = datetime(2024, 1, 1, 6, 0)
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "r", encoding="utf-8") as f:
+            events = parse_timeline(json.load(f), day)
+    else:
+        events = synthetic_evening(day)
+    config = Config()
+    config.break_enabled = True
+    config.rebuild_indexes()
+    sim = Simulation(config, events, start=day)
+    started = time.perf_counter()
+    decisions = sim.run(until=day + timedelta(hours=24))
+    elapsed = time.perf_counter() - started
+    for d in decisions:
+        print(f"{d.at:%d %H:%M:%S}  {d.action:<14} {d.detail}")
+    print(f"-- 24 h simulated in {elapsed * 1000:.0f} ms, {sim.scans} detection passes")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,166 +3,221 @@ import sys
 import os
 import threading
 import tkinter as tk
-from datetime import datetime
 
-from PIL import Image, ImageDraw, ImageTk
+from PIL import ImageTk
 import pystray
 
-from config import Config
-from scheduler import Scheduler, State
-from popup import AlarmPopup
-from chrome_monitor import get_active_matches, close_trigger_apps, is_app_window_open
+from config import Config, CONFIG_FILE, USAGE_FILE, disk_digest, flush_saves
+from config_store import digest
+from config_watcher import ConfigWatcher
+from icon_cache import IconCache, TRAY_SIZE
+from clock import SYSTEM_CLOCK
+from scheduler import State
+from engine import AlarmEngine, Action
+from chrome_monitor import (
+    ProcessSnapshot, get_active_matches, close_trigger_apps, is_app_window_open,
+)
 from foreground_tracker import ForegroundTracker
-from settings_window import SettingsWindow
-from break_scheduler import BreakScheduler, BreakState
-from break_popup import BreakPopup
+from window_events import WindowTitleCache, create_backend
+from monitor import TriggerMonitor
+from profiler import TickProfiler
+
+
+_MIN_TICK_MS = 100
+_MAX_TICK_MS = 15 * 60 * 1000  # re-check at least this often (clock jumps, resume)
+_WINDOW_ICON_SIZES = (64, 32, 16)  # Tk picks the best fit for title bar / taskbar
+_PREBUILD_DELAY_MS = 2000  # popups are built withdrawn once startup has settled
 
 
 class StickyAlarmApp:
     def __init__(self):
+        self.clock = SYSTEM_CLOCK
         self.config = Config.load()
-        self.scheduler = Scheduler(self.config)
-        self.tracker = ForegroundTracker()
+        self.tracker = ForegroundTracker(USAGE_FILE, self.clock)
+        self.profiler = TickProfiler()
+        self.engine = AlarmEngine(self.config, self.clock, self.tracker, self.profiler)
+        self.windows = WindowTitleCache()
+        self.monitor = TriggerMonitor(self.config, self.windows,
+                                      on_result=self._on_monitor_result, clock=self.clock,
+                                      profiler=self.profiler)
+        self.window_events = create_backend(self.windows, on_change=self.monitor.windows_changed)
+        self.config.subscribe(self._on_config_changed)  # after the engine's subscription
+        self.config_watcher = ConfigWatcher(
+            CONFIG_FILE, on_change=self._on_config_file_changed,
+            on_invalid=self._on_config_file_invalid,
+            is_own=lambda content: content == disk_digest())
+        self._result_check_pending = False
+        self._last_result_seq = 0
+        self._tick_id = None
         self.root = tk.Tk()
         self.root.withdraw()
 
-        self._icon_img = self._create_tray_image()
-        self._icon_photo = ImageTk.PhotoImage(self._icon_img)
-        self.root.iconphoto(True, self._icon_photo)
-
-        self._active_profile = None
-        self._matched_triggers = []
-
-        self.popup = AlarmPopup(
-            self.root,
-            on_snooze=self._on_snooze,
-            on_confirm=self._on_confirm,
-            sound_file=self.config.sound_file,
-            popup_text=self.config.popup_text,
-            title=self.config.popup_title,
-            snooze_label=self.config.snooze_label,
-            confirm_label=self.config.confirm_label,
-            fullscreen=self.config.fullscreen_popup,
-        )
-        self.break_scheduler = BreakScheduler(self.config)
-        self.settings = SettingsWindow(
-            self.root, self.config,
-            on_save=self._on_settings_saved,
-            on_test=self._on_test,
-            break_scheduler=self.break_scheduler,
-        )
-        self.break_popup = BreakPopup(
-            self.root,
-            on_snooze=self._on_break_snooze,
-            on_complete=self._on_break_complete,
-        )
+        self.icons = IconCache()
+        self._icon_img = self.icons.get(TRAY_SIZE)
+        self._icon_photos = [ImageTk.PhotoImage(self.icons.get(size))
+                             for size in _WINDOW_ICON_SIZES]
+        self.root.iconphoto(True, *self._icon_photos)
+
+        # UI modules are imported and built on first use (see properties below);
+        # the popups are built shortly after startup by _prebuild_popups
+        self._popup = None
+        self._settings = None
+        self._break_popup = None
+        self._diagnostics = None
         self.tray_icon = None
 
+    @property
+    def popup(self):
+        if self._popup is None:
+            from popup import AlarmPopup
+            self._popup = AlarmPopup(
+                self.root,
+                on_snooze=self._on_snooze,
+                on_confirm=self._on_confirm,
+                sound_file=self.config.sound_file,
+                popup_text=self.config.popup_text,
+                title=self.config.popup_title,
+                snooze_label=self.config.snooze_label,
+                confirm_label=self.config.confirm_label,
+                fullscreen=self.config.fullscreen_popup,
+            )
+        return self._popup
+
+    @property
+    def settings(self):
+        if self._settings is None:
+            from settings_window import SettingsWindow
+            self._settings = SettingsWindow(
+                self.root, self.config,
+                on_test=self._on_test,
+                break_scheduler=self.engine.break_scheduler,
+            )
+        return self._settings
+
+    @property
+    def break_popup(self):
+        if self._break_popup is None:
+            from break_popup import BreakPopup
+            self._break_popup = BreakPopup(
+                self.root,
+                on_snooze=self._on_break_snooze,
+                on_complete=self._on_break_complete,
+            )
+        return self._break_popup
+
+    @property
+    def diagnostics(self):
+        if self._diagnostics is None:
+            from diagnostics_window import DiagnosticsWindow
+            self._diagnostics = DiagnosticsWindow(self.root, self.profiler)
+        return self._diagnostics
+
     def run(self):
         threading.Thread(target=self._run_tray, daemon=True).start()
+        self.window_events.start()
+        self.monitor.start()
+        self.config_watcher.start()
         self._schedule_tick()
+        self.root.after(_PREBUILD_DELAY_MS, self._prebuild_popups)
         self.root.mainloop()
 
-    def _create_tray_image(self):
-        # Try loading from file first
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "icon.png")
-        if not os.path.isfile(icon_path):
-            # PyInstaller bundled path
-            icon_path = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), "assets", "icon.png")
-        if os.path.isfile(icon_path):
-            try:
-                img = Image.open(icon_path).convert("RGBA")
-                img = img.resize((64, 64), Image.LANCZOS)
-                return img
-            except Exception:
-                pass
-        # Fallback: clean geometric alarm clock
-        img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        # Clock body (circle)
-        draw.ellipse([10, 14, 54, 58], fill="#ffffff")
-        # Bell top bumps
-        draw.ellipse([18, 6, 30, 18], fill="#ffffff")
-        draw.ellipse([34, 6, 46, 18], fill="#ffffff")
-        # Clock face (dark circle inside)
-        draw.ellipse([16, 20, 48, 52], fill="#1a1a1a")
-        # Clock hands
-        draw.line([32, 36, 32, 26], fill="#ffffff", width=2)
-        draw.line([32, 36, 40, 36], fill="#ffffff", width=2)
-        # Small dot at center
-        draw.ellipse([30, 34, 34, 38], fill="#ffffff")
-        return img
+    def _prebuild_popups(self):
+        """Build both popups withdrawn, so an alarm only has to deiconify one."""
+        self.popup.build()
+        self.root.after_idle(self.break_popup.build)
 
     def _run_tray(self):
-        image = self._create_tray_image()
+        image = self._icon_img
         menu = pystray.Menu(
             pystray.MenuItem("Einstellungen", self._show_settings, default=True),
             pystray.MenuItem("Alarm testen", self._on_test),
+            pystray.MenuItem("Diagnose", self._show_diagnostics),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Beenden", self._quit),
         )
         self.tray_icon = pystray.Icon("StickyAlarm", image, "Sticky Alarm", menu)
-        self.tray_icon.run()
+        self.tray_icon.run(setup=self._on_tray_ready)
+
+    def _on_tray_ready(self, icon):
+        icon.visible = True
+        if self.config.load_errors:
+            self._notify_config_errors(self.config.load_errors,
+                                       "config.json nicht lesbar, Standardwerte aktiv")
 
     def _show_settings(self, *_args):
-        self.root.after(0, self.settings.show)
+        # Resolve the lazy window on the Tk thread, not the tray thread
+        self.root.after(0, lambda: self.settings.show())
+
+    def _show_diagnostics(self, *_args):
+        self.root.after(0, lambda: self.diagnostics.show())
 
     def _schedule_tick(self):
+        self._tick_id = None
         self._tick()
-        self.root.after(5000, self._schedule_tick)
+        self._arm_tick()
+
+    def _arm_tick(self, delay_ms=None):
+        """Arm one timer for the next instant any scheduler can change state."""
+        if self._tick_id:
+            self.root.after_cancel(self._tick_id)
+        if delay_ms is None:
+            delay_ms = self._next_tick_delay_ms()
+        self._tick_id = self.root.after(delay_ms, self._schedule_tick)
+
+    def _next_tick_delay_ms(self):
+        now = self.clock.now()
+        wakeup = self.engine.next_wakeup(now)
+        if wakeup is None:
+            return _MAX_TICK_MS
+        delay = int((wakeup - now).total_seconds() * 1000) + 50
+        return max(_MIN_TICK_MS, min(_MAX_TICK_MS, delay))
 
     def _tick(self):
-        state = self.scheduler.tick()
-
-        if state == State.ACTIVE and not self.popup.is_showing:
-            self._apply_profile_to_popup(self._active_profile)
+        with self.profiler.phase("tick"):
+            alarm_showing = self._popup is not None and self._popup.is_showing
+            break_showing = self._break_popup is not None and self._break_popup.is_showing
+            decisions = self.engine.tick(alarm_showing, break_showing)
+            for decision in decisions:
+                self._apply_decision(decision)
+            self.monitor.set_active(self.engine.state == State.CONFIRMED)
+            if self.engine.state == State.CONFIRMED:
+                self._check_triggers()
+
+    def _apply_decision(self, decision):
+        if decision.action == Action.SHOW_ALARM:
+            self._apply_profile_to_popup(decision.profile)
             self.popup.show()
-
-        elif state == State.CONFIRMED:
-            now = datetime.now()
-            active_triggers = self.config.get_triggers_in_window(now.hour, now.minute)
-            if active_triggers:
-                matches = get_active_matches(active_triggers)
-                if matches:
-                    self.tracker.update_active_matches(matches)
-                    matched_triggers = [t for t in active_triggers if t.name in matches]
-
-                    # Check immediate triggers first
-                    immediate = [t for t in matched_triggers if not t.is_time_based]
-                    if immediate:
-                        self._active_profile = self.config.get_profile_for_trigger(immediate[0])
-                        self._matched_triggers = immediate
-                        self.scheduler.trigger_detected()
-                    else:
-                        # Check time-based triggers
-                        for trigger in matched_triggers:
-                            if trigger.is_time_based and self.tracker.has_exceeded_limit(trigger):
-                                self._active_profile = self.config.get_profile_for_trigger(trigger)
-                                self._matched_triggers = [trigger]
-                                self.scheduler.trigger_detected()
-                                break
-                else:
-                    self.tracker.update_active_matches([])
-
-        elif state == State.WAITING:
-            if self.popup.is_showing:
-                self.popup.dismiss()
-
-        # Break timer (independent)
-        break_state = self.break_scheduler.tick()
-        if break_state == BreakState.BREAK_DUE and not self.break_popup.is_showing:
-            if not self.popup.is_showing:
-                self.break_scheduler.start_break()
-                self.break_popup.show(
-                    self.config.break_duration_minutes * 60,
-                    title=self.config.break_popup_title,
-                    text=self.config.break_popup_text,
-                    fullscreen=self.config.break_fullscreen,
-                    icon=self.config.break_icon)
-        elif self.popup.is_showing and self.break_popup.is_showing:
-            # Alarm takes priority — dismiss break
+        elif decision.action == Action.DISMISS_ALARM:
+            self.popup.dismiss()
+        elif decision.action == Action.SHOW_BREAK:
+            self.break_popup.show(
+                self.config.break_duration_minutes * 60,
+                title=self.config.break_popup_title,
+                text=self.config.break_popup_text,
+                fullscreen=self.config.break_fullscreen,
+                icon=self.config.break_icon)
+        elif decision.action == Action.DISMISS_BREAK:
             self.break_popup.dismiss()
-            self.break_scheduler.skip_break()
+
+    def _check_triggers(self):
+        result = self.monitor.latest
+        if result is None or result.seq == self._last_result_seq:
+            return
+        self._last_result_seq = result.seq
+        if self.engine.apply_matches(result.triggers, result.matches):
+            # Run a full tick now: shows the alarm and pre-empts a running break
+            self._arm_tick(0)
+
+    def _on_monitor_result(self):
+        # Called from the monitor thread — hop onto the Tk loop once
+        if not self._result_check_pending:
+            self._result_check_pending = True
+            self.root.after(0, self._result_check)
+
+    def _result_check(self):
+        self._result_check_pending = False
+        if self.engine.state == State.CONFIRMED:
+            self._check_triggers()
 
     def _apply_profile_to_popup(self, profile):
         if profile:
@@ -179,34 +234,52 @@ class StickyAlarmApp:
         self.popup.fullscreen = self.config.fullscreen_popup
 
     def _on_snooze(self):
-        profile = self._active_profile or self.config.default_profile
-        snooze_min = profile.snooze_minutes or self.config.snooze_minutes
-        self.scheduler.snooze(snooze_min)
+        self.engine.snooze()
+        self._arm_tick()
 
     def _on_confirm(self):
-        self.scheduler.confirm_routine()
-        # Close matched trigger apps (or scan now if first alarm)
-        triggers_to_close = self._matched_triggers
-        if not triggers_to_close:
-            now = datetime.now()
-            active_triggers = self.config.get_triggers_in_window(now.hour, now.minute)
-            if active_triggers:
-                matches = get_active_matches(active_triggers)
-                triggers_to_close = [t for t in active_triggers if t.name in matches]
-        if triggers_to_close:
-            close_trigger_apps(triggers_to_close)
-        for t in triggers_to_close:
-            self.tracker.reset_trigger(t.name)
+        # Close matched trigger apps (or scan now if first alarm) off the UI thread.
+        # Fresh snapshot: instances started since the last scan must close too
+        triggers_to_close, to_scan = self.engine.confirm()
+        self.monitor.set_active(True)
+        index = self.config.trigger_index
+
+        def _close():
+            to_close = triggers_to_close
+            snap = ProcessSnapshot.capture()
+            if not to_close and to_scan:
+                matches = get_active_matches(to_scan, snap, index, self.windows)
+                to_close = [t for t in to_scan if t.name in matches]
+            report = close_trigger_apps(to_close, snap, self.windows) if to_close else None
+            return to_close, report
+
+        self.monitor.submit(
+            _close, on_done=lambda result: self.root.after(0, self._on_apps_closed, result))
         # Launch profile apps
         self._launch_routine_apps()
+        self._arm_tick()
+
+    def _on_apps_closed(self, result):
+        if not result:
+            return
+        closed, report = result
+        if report is not None and report.alive:
+            # Survivors keep their usage; only what actually exited starts over
+            closed = [t for t in closed if not report.still_running(t)]
+            names = sorted({name for _pid, name in report.alive})
+            try:
+                self.tray_icon.notify(f"Nicht beendet: {', '.join(names)}", "Sticky Alarm")
+            except Exception:
+                pass
+        self.engine.apps_closed(closed)
 
     def _launch_routine_apps(self):
-        profile = self._active_profile or self.config.default_profile
+        profile = self.engine.routine_profile
         for app_path in profile.launch_apps:
             if not app_path or not os.path.exists(app_path):
                 continue
             app_name = os.path.splitext(os.path.basename(app_path))[0]
-            if is_app_window_open(app_name):
+            if is_app_window_open(app_name, self.windows):
                 continue
             try:
                 os.startfile(app_path)
@@ -215,45 +288,59 @@ class StickyAlarmApp:
 
     def _on_test(self, *_args):
         def _trigger():
-            self._active_profile = None
-            self._matched_triggers = []
-            self.scheduler.force_trigger()
+            self.engine.force_trigger()
             self._apply_profile_to_popup(None)
             self.popup.show(is_test=True)
         self.root.after(0, _trigger)
 
     def _on_break_snooze(self):
-        self.break_scheduler.snooze()
+        self.engine.break_snoozed()
+        self._arm_tick()
 
     def _on_break_complete(self):
-        self.break_scheduler.skip_break()
-
-    def _on_settings_saved(self):
-        self.scheduler.config = self.config
-        self.break_scheduler.config = self.config
-        self.break_scheduler.reload_config()
-
-        # Re-lookup active profile from new config (old reference is stale)
-        if self._active_profile:
-            old_id = self._active_profile.id
-            self._active_profile = None
-            for p in self.config.schedule_profiles:
-                if p.id == old_id:
-                    self._active_profile = p
-                    break
-
-        # Update snooze duration if currently snoozed
-        if self.scheduler.state == State.SNOOZED:
-            profile = self._active_profile or self.config.default_profile
-            new_snooze = profile.snooze_minutes or self.config.snooze_minutes
-            self.scheduler.update_snooze_duration(new_snooze)
-
-        self._apply_profile_to_popup(self._active_profile)
+        self.engine.break_completed()
+        self._arm_tick()
+
+    def _on_config_changed(self, change):
+        # The engine has already re-linked its active profile
+        if self._popup is not None and change.popup_changed:
+            self._apply_profile_to_popup(self.engine.active_profile)
+        if change.triggers_changed or change.schedule_changed:
+            self.monitor.wake()
+        self._arm_tick(0)
+
+    def _on_config_file_changed(self, config, text):
+        # Watcher thread: parsed and validated already; adopt it on the Tk loop
+        self.root.after(0, self._adopt_config, config, text)
+
+    def _adopt_config(self, config, text):
+        if digest(text) == disk_digest():
+            return  # we saved the same content in the meantime
+        self.config.adopt(config, text)
+
+    def _on_config_file_invalid(self, errors):
+        self._notify_config_errors(errors, "config.json ignoriert")
+
+    def _notify_config_errors(self, errors, prefix):
+        message = errors[0] if len(errors) == 1 else f"{errors[0]} (+{len(errors) - 1} weitere)"
+        try:
+            self.tray_icon.notify(f"{prefix}: {message}", "Sticky Alarm")
+        except Exception:
+            pass
 
     def _quit(self, *_args):
+        self.config_watcher.stop()
+        self.window_events.stop()
+        self.monitor.stop()
+        flush_saves()
         if self.tray_icon:
             self.tray_icon.stop()
-        self.root.after(0, self.root.quit)
+        self.root.after(0, self._shutdown)
+
+    def _shutdown(self):
+        # The tracker is only touched from the Tk loop; flush its last minute here
+        self.tracker.flush()
+        self.root.quit()
 
 
 def main():
@@ -0,0 +1,93 @@
+"""Compiled trigger index — matches every site/app trigger in one scan per text."""
+from collections import deque
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher (Aho–Corasick automaton).
+
+    Scanning a text costs O(len(text) + matches), independent of how many
+    patterns were compiled in.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]   # state -> {char: state}
+        self._fail = [0]
+        self._out = [()]    # state -> patterns ending here (incl. via fail links)
+        self._match_empty = False
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+            else:
+                self._match_empty = True
+        self._build_fail_links()
+
+    def _add(self, pattern):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][ch] = nxt
+            state = nxt
+        if pattern not in self._out[state]:
+            self._out[state] = self._out[state] + (pattern,)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __bool__(self):
+        return len(self._goto) > 1 or self._match_empty
+
+    def scan(self, text, found):
+        """Add every pattern occurring in text to the set `found`."""
+        if self._match_empty and text:
+            found.add("")
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class TriggerIndex:
+    """Lowercased site/app trigger names compiled into one automaton each.
+
+    Built from the full trigger list when the Config loads or is saved.
+    """
+
+    def __init__(self, triggers):
+        self._sites = AhoCorasick({t.name_lower for t in triggers if t.type == "site"})
+        self._apps = AhoCorasick({t.name_lower for t in triggers if t.type == "app"})
+
+    def match_sites(self, titles):
+        """Return the set of site patterns contained in any of the titles."""
+        found = set()
+        if self._sites:
+            for title in titles:
+                self._sites.scan(title.lower(), found)
+        return found
+
+    def match_apps(self, lower_names):
+        """Return the set of app patterns contained in any (lowercase) process name."""
+        found = set()
+        if self._apps:
+            for name in lower_names:
+                self._apps.scan(name, found)
+        return found
@@ -1,8 +1,10 @@
 """Reusable custom widgets — premium dark styling with Gold accent and animations."""
 
+import functools
 import tkinter as tk
 import math
 import theme as T
+from animation import animate
 
 
 # ---------------------------------------------------------------------------
@@ -25,14 +27,23 @@ def round_rect(canvas, x1, y1, x2, y2, radius=12, **kwargs):
     return canvas.create_polygon(points, smooth=True, **kwargs)
 
 
-def _lerp_color(c1: str, c2: str, t: float) -> str:
-    """Linearly interpolate between two hex colors. t=0 -> c1, t=1 -> c2."""
+GRADIENT_STEPS = 64  # colors per table; more than a 60 fps transition can show
+
+
+@functools.lru_cache(maxsize=256)
+def gradient(c1: str, c2: str, steps: int = GRADIENT_STEPS) -> tuple:
+    """Hex colors from c1 to c2 in `steps` equal steps (steps + 1 entries).
+
+    Built once per color pair and shared by every widget. Widgets keep an
+    index into the table rather than starting a new one from an in-between
+    color, so the cache only holds their fixed pairs.
+    """
     r1, g1, b1 = int(c1[1:3], 16), int(c1[3:5], 16), int(c1[5:7], 16)
     r2, g2, b2 = int(c2[1:3], 16), int(c2[3:5], 16), int(c2[5:7], 16)
-    r = int(r1 + (r2 - r1) * t)
-    g = int(g1 + (g2 - g1) * t)
-    b = int(b1 + (b2 - b1) * t)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return tuple(
+        f"#{int(r1 + (r2 - r1) * t):02x}{int(g1 + (g2 - g1) * t):02x}{int(b1 + (b2 - b1) * t):02x}"
+        for t in (i / steps for i in range(steps + 1))
+    )
 
 
 def ease_in_out(t: float) -> float:
@@ -100,80 +111,209 @@ def draw_stop(canvas, cx, cy, size, color, tag="icon"):
                             fill=color, outline="", tags=tag)
 
 
-def draw_circular_progress(canvas, cx, cy, radius, thickness, fraction, fg_color, bg_color=None):
-    """Draw a smooth anti-aliased circular progress ring using polylines."""
-    if bg_color is None:
-        bg_color = T.BG_INPUT
-    segments = 120
-
-    # Background ring - full circle polyline
-    bg_pts = []
-    for i in range(segments + 1):
-        angle = math.radians(i * 360 / segments - 90)
-        bg_pts.extend([cx + radius * math.cos(angle),
-                       cy + radius * math.sin(angle)])
-    canvas.create_line(bg_pts, fill=bg_color, width=thickness,
-                       capstyle="round", joinstyle="round",
-                       smooth=True, tags="ring")
-
-    # Foreground arc
-    if fraction > 0.003:
-        fg_segs = max(6, int(segments * fraction))
-        fg_pts = []
-        for i in range(fg_segs + 1):
-            angle = math.radians(-90 + i * (fraction * 360) / fg_segs)
-            fg_pts.extend([cx + radius * math.cos(angle),
-                           cy + radius * math.sin(angle)])
-        canvas.create_line(fg_pts, fill=fg_color, width=thickness,
-                           capstyle="round", joinstyle="round",
-                           smooth=True, tags="ring")
+# Unit-circle table for progress rings: 120 segments, clockwise from 12 o'clock
+_RING_SEGMENTS = 120
+_UNIT_CIRCLE = tuple(
+    (math.cos(math.radians(i * 360 / _RING_SEGMENTS - 90)),
+     math.sin(math.radians(i * 360 / _RING_SEGMENTS - 90)))
+    for i in range(_RING_SEGMENTS + 1)
+)
+
+
+class ProgressRing:
+    """Smooth circular progress ring whose canvas items are created once.
+
+    set() moves the existing polylines with coords() and toggles their state
+    instead of deleting and redrawing them, so a long countdown reuses the
+    same handful of items. Points come from a table scaled once per ring;
+    only the arc's end point needs cos/sin per update.
+    """
+
+    def __init__(self, canvas, cx, cy, radius, thickness, fg_color,
+                 bg_color=None, glow_color=None):
+        if bg_color is None:
+            bg_color = T.BG_INPUT
+        self.canvas = canvas
+        self.cx, self.cy, self.radius = cx, cy, radius
+        self._circle = []
+        for cos_a, sin_a in _UNIT_CIRCLE:
+            self._circle.append(cx + radius * cos_a)
+            self._circle.append(cy + radius * sin_a)
+        line = dict(capstyle="round", joinstyle="round", smooth=True, tags="ring")
+
+        # Optional glow: a wider background ring and arc behind the main ones
+        self._glow_arc = None
+        self._glow_items = ()
+        if glow_color:
+            glow_bg = canvas.create_line(self._circle, fill=bg_color, width=thickness + 6,
+                                         state="hidden", **line)
+            self._glow_arc = canvas.create_line(self._circle, fill=glow_color, width=thickness + 6,
+                                                state="hidden", **line)
+            self._glow_items = (glow_bg, self._glow_arc)
+        canvas.create_line(self._circle, fill=bg_color, width=thickness, **line)
+        self._arc = canvas.create_line(self._circle, fill=fg_color, width=thickness,
+                                       state="hidden", **line)
+        self._fraction = None
+        self._visible = False
+
+    def set(self, fraction):
+        """Show `fraction` (0..1) of the ring, starting at the top."""
+        if fraction == self._fraction:
+            return
+        self._fraction = fraction
+        visible = fraction > 0.003
+        if visible:
+            points = self._arc_points(fraction)
+            self.canvas.coords(self._arc, points)
+            if self._glow_arc is not None:
+                self.canvas.coords(self._glow_arc, points)
+        if visible != self._visible:
+            self._visible = visible
+            state = "normal" if visible else "hidden"
+            for item in (*self._glow_items, self._arc):
+                self.canvas.itemconfigure(item, state=state)
+
+    def _arc_points(self, fraction):
+        """Table points up to `fraction`, plus the exact end point."""
+        segments = min(_RING_SEGMENTS * fraction, _RING_SEGMENTS)
+        whole = int(segments)
+        points = self._circle[:2 * (whole + 1)]
+        if segments > whole:
+            angle = math.radians(fraction * 360 - 90)
+            points.append(self.cx + self.radius * math.cos(angle))
+            points.append(self.cy + self.radius * math.sin(angle))
+        return points
+
+
+# ---------------------------------------------------------------------------
+# Window helpers
+# ---------------------------------------------------------------------------
+
+def enable_dark_titlebar(window):
+    """Enable dark title bar on Windows 10/11 via DWM API."""
+    try:
+        import ctypes
+        hwnd = ctypes.windll.user32.GetParent(window.winfo_id())
+        value = ctypes.c_int(1)
+        ctypes.windll.dwmapi.DwmSetWindowAttribute(
+            hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
+    except Exception:
+        pass
 
 
 # ---------------------------------------------------------------------------
 # Fade animations
 # ---------------------------------------------------------------------------
 
-def fade_in_window(window, duration_ms=300, steps=15, on_done=None):
+def fade_in_window(window, duration_ms=300, on_done=None):
     """Animate a window from 0 to full opacity."""
     window.attributes("-alpha", 0.0)
-    step_time = duration_ms // steps
 
-    def _step(i):
+    def _frame(t):
         if not window.winfo_exists():
-            return
-        alpha = i / steps
-        window.attributes("-alpha", alpha)
-        if i < steps:
-            window.after(step_time, _step, i + 1)
-        elif on_done:
-            on_done()
+            return False
+        window.attributes("-alpha", t)
 
-    window.after(10, _step, 0)
+    return animate(window, _frame, duration_ms / 1000, on_done)
 
 
-def fade_out_window(window, duration_ms=250, steps=12, on_done=None):
+def fade_out_window(window, duration_ms=250, on_done=None):
     """Animate a window from current opacity to 0, then call on_done."""
-    step_time = duration_ms // steps
+    def _abort():
+        if on_done:
+            on_done()
+        return False
 
-    def _step(i):
+    def _frame(t):
         if not window.winfo_exists():
-            if on_done:
-                on_done()
-            return
-        alpha = 1.0 - (i / steps)
+            return _abort()
         try:
-            window.attributes("-alpha", max(0.0, alpha))
+            window.attributes("-alpha", max(0.0, 1.0 - t))
         except Exception:
-            if on_done:
-                on_done()
+            return _abort()
+
+    return animate(window, _frame, duration_ms / 1000, on_done)
+
+
+# ---------------------------------------------------------------------------
+# Card window — borderless topmost popup, built once and reused
+# ---------------------------------------------------------------------------
+
+_TRANSPARENT = "#FF00FF"  # color key for the rounded card's cut-out corners
+
+
+class CardWindow:
+    """Borderless, topmost Toplevel holding a rounded card with a shadow.
+
+    Built withdrawn. show() lays it out for the current screen, either
+    fullscreen on black or as a floating card, and deiconifies it. hide()
+    withdraws it again, so the widgets inside are created only once and
+    showing is just a geometry update.
+    """
+
+    def __init__(self, root, width, height, pad_x, pad_y, margin=10):
+        self.width, self.height, self.margin = width, height, margin
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        self.window.overrideredirect(True)
+        self.window.attributes("-topmost", True)
+
+        pw, ph = width + margin * 2, height + margin * 2
+        self.canvas = tk.Canvas(self.window, width=pw, height=ph,
+                                highlightthickness=0, bd=0)
+        # Shadow layer
+        round_rect(self.canvas, margin + 4, margin + 4,
+                   margin + width + 4, margin + height + 4,
+                   radius=T.CARD_RADIUS, fill=T.BG_SHADOW, outline="")
+        # Card background
+        round_rect(self.canvas, margin, margin,
+                   margin + width, margin + height,
+                   radius=T.CARD_RADIUS, fill=T.BG, outline=T.BORDER)
+
+        # Content frame
+        self.inner = tk.Frame(self.canvas, bg=T.BG)
+        self.canvas.create_window(
+            margin + width // 2, margin + height // 2,
+            window=self.inner, width=width - pad_x, height=height - pad_y)
+        self._fullscreen = None
+
+    def exists(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _layout(self, fullscreen):
+        sx = self.window.winfo_screenwidth()
+        sy = self.window.winfo_screenheight()
+        pw, ph = self.width + self.margin * 2, self.height + self.margin * 2
+        if fullscreen:
+            self.window.geometry(f"{sx}x{sy}+0+0")
+        else:
+            self.window.geometry(f"{pw}x{ph}+{(sx - pw) // 2}+{(sy - ph) // 2}")
+        if fullscreen == self._fullscreen:
             return
-        if i < steps:
-            window.after(step_time, _step, i + 1)
+        self._fullscreen = fullscreen
+        bg = "#000000" if fullscreen else _TRANSPARENT
+        self.window.configure(bg=bg, highlightthickness=0)
+        self.window.attributes("-transparentcolor", "" if fullscreen else _TRANSPARENT)
+        self.canvas.configure(bg=bg)
+        if fullscreen:
+            self.canvas.pack_forget()
+            self.canvas.place(relx=0.5, rely=0.5, anchor="center")
         else:
-            if on_done:
-                on_done()
+            self.canvas.place_forget()
+            self.canvas.pack(fill="both", expand=True)
 
-    _step(0)
+    def show(self, fullscreen):
+        self._layout(fullscreen)
+        self.window.attributes("-alpha", 0.0)
+        self.window.deiconify()
+        self.window.lift()
+
+    def hide(self):
+        if self.exists():
+            self.window.withdraw()
 
 
 # ---------------------------------------------------------------------------
@@ -193,13 +333,13 @@ class RoundedButton(tk.Canvas):
         self._fg = fg
         self._hover_bg = hover_bg or bg
         self._hover_fg = hover_fg or fg
-        self._cur_bg = bg
+        self._pos = 0  # index into the bg -> hover_bg gradient
         self._command = command
         self._radius = radius
         self._width = width
         self._height = height
         self._font = font or T.FONT_BUTTON_LG
-        self._anim_id = None
+        self._anim = None
         self._pressed = False
 
         self._rect = round_rect(self, 1, 1, width - 1, height - 1, radius,
@@ -215,32 +355,40 @@ class RoundedButton(tk.Canvas):
 
         self.configure(cursor="hand2")
 
-    def _animate_to(self, target_bg, target_fg, steps=12):
-        if self._anim_id:
-            self.after_cancel(self._anim_id)
-        start_bg = self._cur_bg
-
-        def _step(i):
-            if not self.winfo_exists():
-                return
-            t = ease_in_out(i / steps)
-            c = _lerp_color(start_bg, target_bg, t)
-            self._cur_bg = c
-            self.itemconfigure(self._rect, fill=c)
-            if i < steps:
-                self._anim_id = self.after(14, _step, i + 1)
-            else:
-                self.itemconfigure(self._label, fill=target_fg)
+    def _animate_to(self, target_pos, target_fg, duration=0.17):
+        """Move along the one bg -> hover_bg table; an interrupted hover resumes from its index."""
+        if self._anim:
+            self._anim.cancel()
+        colors = gradient(self._bg, self._hover_bg)
+        start = self._pos
+
+        def _frame(t):
+            self._pos = round(start + (target_pos - start) * ease_in_out(t))
+            self.itemconfigure(self._rect, fill=colors[self._pos])
 
         self.itemconfigure(self._label, fill=target_fg)
-        _step(0)
+        self._anim = animate(self, _frame, duration)
+
+    def reset(self, text=None):
+        """Back to the resting look, optionally with a new label (reused popups)."""
+        if self._anim:
+            self._anim.cancel()
+            self._anim = None
+        if self._pressed:
+            self._pressed = False
+            self.move(self._label, 0, -1)
+        self._pos = 0
+        self.itemconfigure(self._rect, fill=self._bg)
+        self.itemconfigure(self._label, fill=self._fg)
+        if text is not None:
+            self.itemconfigure(self._label, text=text)
 
     def _on_enter(self, _e):
-        self._animate_to(self._hover_bg, self._hover_fg)
+        self._animate_to(GRADIENT_STEPS, self._hover_fg)
 
     def _on_leave(self, _e):
         self._pressed = False
-        self._animate_to(self._bg, self._fg)
+        self._animate_to(0, self._fg)
 
     def _on_button_1(self, _e):
         if not self._pressed:
@@ -477,7 +625,7 @@ class CustomCheckbox(tk.Frame):
     def __init__(self, parent, text, variable):
         super().__init__(parent, bg=parent.cget("bg"), cursor="hand2")
         self.var = variable
-        self._anim_id = None
+        self._anim = None
 
         self.canvas = tk.Canvas(self, width=24, height=24,
                                 bg=parent.cget("bg"), highlightthickness=0, bd=0)
@@ -513,22 +661,17 @@ class CustomCheckbox(tk.Frame):
             return
 
         # Quick color transition
-        if self._anim_id:
-            self.after_cancel(self._anim_id)
+        if self._anim:
+            self._anim.cancel()
 
         start_bg = T.BG_INPUT if self.var.get() else T.ACCENT
-        steps = 10
+        colors = gradient(start_bg, target_bg)
 
-        def _step(i):
-            if not self.winfo_exists():
-                return
-            t = ease_in_out(i / steps)
-            c = _lerp_color(start_bg, target_bg, t)
+        def _frame(t):
+            c = colors[round(ease_in_out(t) * GRADIENT_STEPS)]
             self.canvas.itemconfigure(self._rect, fill=c, outline=c)
-            if i < steps:
-                self._anim_id = self.after(16, _step, i + 1)
 
-        _step(0)
+        self._anim = animate(self, _frame, 0.16)
 
 
 # ---------------------------------------------------------------------------
@@ -548,6 +691,7 @@ class AutoHideScrollbar(tk.Canvas):
         self._last = 1.0
         self._visible = False
         self._hide_id = None
+        self._fade = None
         self._drag_start = None
         self._hovering = False
         self._thumb_color = "#3a3a3a"
@@ -600,6 +744,9 @@ class AutoHideScrollbar(tk.Canvas):
                    fill=color, outline="", tags="thumb")
 
     def _show(self):
+        if self._fade:
+            self._fade.cancel()
+            self._fade = None
         if not self._visible:
             self._visible = True
             self.lift()
@@ -610,29 +757,21 @@ class AutoHideScrollbar(tk.Canvas):
             self._hide_id = None
         self._fade_out_thumb()
 
-    def _fade_out_thumb(self, step=0, steps=6):
-        if not self.winfo_exists():
-            return
-        if step >= steps:
+    def _fade_out_thumb(self, duration=0.15):
+        if self._fade:
+            self._fade.cancel()
+        colors = gradient(self._thumb_color, T.BG)
+
+        def _frame(t):
+            self.itemconfigure("thumb", fill=colors[round(ease_in_out(t) * GRADIENT_STEPS)])
+
+        def _done():
+            self._fade = None
             self._visible = False
             self.delete("thumb")
             self.lower()
-            return
-        t = ease_in_out(step / steps)
-        fade_color = _lerp_color(self._thumb_color, T.BG, t)
-        self.delete("thumb")
-        h = self.winfo_height()
-        w = self._bar_width
-        if h < 20:
-            return
-        thumb_h = max(30, (self._last - self._first) * h)
-        thumb_y = self._first * h
-        r = max(2, (w - 2) // 2)
-        x1, y1 = 1, max(2, int(thumb_y) + 2)
-        x2, y2 = w - 1, min(h - 2, int(thumb_y + thumb_h) - 2)
-        round_rect(self, x1, y1, x2, y2, radius=r,
-                   fill=fade_color, outline="", tags="thumb")
-        self.after(25, self._fade_out_thumb, step + 1, steps)
+
+        self._fade = animate(self, _frame, duration, _done)
 
     def _schedule_hide(self):
         if self._hide_id:
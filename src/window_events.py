@@ -0,0 +1,232 @@
+"""Event-driven top-level window tracking for Sticky Alarm.
+
+A backend pushes window title changes into a WindowTitleCache; the detection
+path only reads the cache and never enumerates windows itself.
+"""
+from abc import ABC, abstractmethod
+import ctypes
+from ctypes import wintypes
+import sys
+import threading
+
+
+class WindowTitleCache:
+    """Thread-safe hwnd -> (pid, title) map of visible, titled windows."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows = {}
+        self.version = 0
+
+    def update(self, hwnd, pid, title):
+        """Store a window; returns True if anything changed."""
+        with self._lock:
+            if self._windows.get(hwnd) == (pid, title):
+                return False
+            self._windows[hwnd] = (pid, title)
+            self.version += 1
+            return True
+
+    def remove(self, hwnd):
+        with self._lock:
+            if self._windows.pop(hwnd, None) is None:
+                return False
+            self.version += 1
+            return True
+
+    def replace_all(self, windows):
+        """Replace the whole cache with an iterable of (hwnd, pid, title)."""
+        with self._lock:
+            self._windows = {hwnd: (pid, title) for hwnd, pid, title in windows}
+            self.version += 1
+
+    def windows(self, filter_pids=None):
+        """Return list of (hwnd, pid, title), optionally limited to some pids."""
+        with self._lock:
+            items = list(self._windows.items())
+        return [(hwnd, pid, title) for hwnd, (pid, title) in items
+                if filter_pids is None or pid in filter_pids]
+
+
+class WindowEventBackend(ABC):
+    """Interface: keeps a WindowTitleCache current until stopped.
+
+    `on_change` is called (from the backend's thread) after every update
+    that actually changed the cache.
+    """
+
+    def __init__(self, cache, on_change=None):
+        self.cache = cache
+        self.on_change = on_change
+
+    @abstractmethod
+    def start(self):
+        """Begin delivering updates into the cache."""
+
+    @abstractmethod
+    def stop(self):
+        """Stop delivering updates."""
+
+    def _notify(self, changed):
+        if changed and self.on_change:
+            self.on_change()
+
+
+class FakeWindowBackend(WindowEventBackend):
+    """In-memory backend for Linux tests and simulations — windows are scripted."""
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def open_window(self, hwnd, pid, title):
+        self._notify(self.cache.update(hwnd, pid, title))
+
+    def set_title(self, hwnd, pid, title):
+        self._notify(self.cache.update(hwnd, pid, title))
+
+    def close_window(self, hwnd):
+        self._notify(self.cache.remove(hwnd))
+
+
+if sys.platform == "win32":
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
+    _WINEVENTPROC = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    _user32.SetWinEventHook.restype = wintypes.HANDLE
+    _user32.SetWinEventHook.argtypes = [
+        wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, _WINEVENTPROC,
+        wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+    _user32.GetAncestor.restype = wintypes.HWND
+    _user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+else:
+    # No user32 off Windows; benchmarks swap in a fake module-level _user32
+    _user32 = None
+    _kernel32 = None
+    _WNDENUMPROC = ctypes.CFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
+    _WINEVENTPROC = None
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_HIDE = 0x8003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_ROOT = 2
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+WM_QUIT = 0x0012
+WM_CLOSE = 0x0010
+
+
+def _read_window(hwnd):
+    """Return (pid, title) for a visible, titled window, else None."""
+    if not _user32.IsWindowVisible(hwnd):
+        return None
+    length = _user32.GetWindowTextLengthW(hwnd)
+    if length <= 0:
+        return None
+    buf = ctypes.create_unicode_buffer(length + 1)
+    _user32.GetWindowTextW(hwnd, buf, length + 1)
+    if not buf.value:
+        return None
+    pid = wintypes.DWORD()
+    _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value, buf.value
+
+
+def enum_windows():
+    """Return [(hwnd, pid, title), ...] for visible, titled top-level windows.
+
+    The single EnumWindows pass everything else filters in memory.
+    """
+    windows = []
+    def _callback(hwnd, _lparam):
+        info = _read_window(hwnd)
+        if info:
+            windows.append((hwnd, info[0], info[1]))
+        return True
+    _user32.EnumWindows(_WNDENUMPROC(_callback), 0)
+    return windows
+
+
+def post_close(hwnd):
+    """Ask a window to close (same as clicking its X)."""
+    _user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+
+
+class WinEventBackend(WindowEventBackend):
+    """SetWinEventHook listener running its own message loop thread (Windows only)."""
+
+    _EVENT_RANGES = (
+        (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND),
+        (EVENT_OBJECT_DESTROY, EVENT_OBJECT_HIDE),
+        (EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE),
+    )
+
+    def __init__(self, cache, on_change=None):
+        super().__init__(cache, on_change)
+        self._thread = None
+        self._thread_id = None
+        self._ready = threading.Event()
+        # Keep the ctypes callback alive for as long as the hooks exist
+        self._proc = _WINEVENTPROC(self._on_event)
+
+    def start(self):
+        if self._thread:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(2.0)
+
+    def stop(self):
+        if self._thread_id:
+            _user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread = None
+        self._thread_id = None
+
+    def _run(self):
+        self._thread_id = _kernel32.GetCurrentThreadId()
+        hooks = [
+            _user32.SetWinEventHook(lo, hi, None, self._proc, 0, 0,
+                                    WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS)
+            for lo, hi in self._EVENT_RANGES
+        ]
+        # Seed silently: start() runs before the Tk loop, so on_change must not
+        # fire from here; scans read the cache whenever they next run
+        self.cache.replace_all(enum_windows())
+        self._ready.set()
+        msg = wintypes.MSG()
+        while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            _user32.TranslateMessage(ctypes.byref(msg))
+            _user32.DispatchMessageW(ctypes.byref(msg))
+        for hook in hooks:
+            if hook:
+                _user32.UnhookWinEvent(hook)
+
+    def _on_event(self, _hook, event, hwnd, id_object, id_child, _thread, _time):
+        if not hwnd or id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+        if event == EVENT_OBJECT_DESTROY:
+            self._notify(self.cache.remove(hwnd))
+            return
+        if _user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+            return
+        info = None if event == EVENT_OBJECT_HIDE else _read_window(hwnd)
+        if info:
+            self._notify(self.cache.update(hwnd, info[0], info[1]))
+        else:
+            self._notify(self.cache.remove(hwnd))
+
+
+def create_backend(cache, on_change=None):
+    """Return the window event backend for this platform."""
+    if sys.platform == "win32":
+        return WinEventBackend(cache, on_change)
+    return FakeWindowBackend(cache, on_change)